@@ -0,0 +1,232 @@
+"""
+Benchmark
+=========
+
+Times the maze operations on reproducible synthetic mazes, and prints the
+results as JSON so that runs can be compared.
+
+Every generator takes a size, a food density and a seed, and returns the
+food flag of every vertex and the edges as (i, j) pairs of positions, ready
+for QuokkaMaze.from_edges:
+
+    * grid - a square grid of about `size` vertices.
+    * geometric - points in the unit square, joined when they are close,
+      about 6 neighbours each.
+    * scale_free - preferential attachment, 2 edges per new vertex.
+    * corridor - a ladder two vertices wide and size / 2 long.
+
+Run it as a script, for example:
+
+    python benchmark.py --sizes 1000 10000 --food 0.1 0.3 --output run.json
+
+and compare the "per_call_us" of two runs.
+"""
+
+from typing import Dict, List, Tuple
+import argparse
+import json
+import math
+import platform
+import random
+import sys
+import time
+
+from vertex import Vertex
+from graph import QuokkaMaze
+
+
+def _food(size: int, density: float, rng: random.Random) -> List[bool]:
+    return [rng.random() < density for _ in range(size)]
+
+
+def grid(size: int, density: float, seed: int) -> Tuple[List[bool], List[Tuple[int, int]]]:
+    rng = random.Random(seed)
+    side = max(1, math.isqrt(size))
+    edges = []
+    for r in range(side):
+        for c in range(side):
+            i = r * side + c
+            if c + 1 < side:
+                edges.append((i, i + 1))
+            if r + 1 < side:
+                edges.append((i, i + side))
+    return _food(side * side, density, rng), edges
+
+
+def geometric(size: int, density: float, seed: int) -> Tuple[List[bool], List[Tuple[int, int]]]:
+    rng = random.Random(seed)
+    points = [(rng.random(), rng.random()) for _ in range(size)]
+    # about 6 other points within the radius
+    radius = math.sqrt(6 / (math.pi * max(size, 1)))
+
+    # bucket the points into cells of the radius, only neighbouring cells
+    # can hold points close enough
+    cells = {}
+    for i, (x, y) in enumerate(points):
+        cells.setdefault((int(x / radius), int(y / radius)), []).append(i)
+    edges = []
+    for i, (x, y) in enumerate(points):
+        cx, cy = int(x / radius), int(y / radius)
+        for dx in (-1, 0, 1):
+            for dy in (-1, 0, 1):
+                for j in cells.get((cx + dx, cy + dy), ()):
+                    if j > i and (points[j][0] - x) ** 2 + (points[j][1] - y) ** 2 <= radius ** 2:
+                        edges.append((i, j))
+    return _food(size, density, rng), edges
+
+
+def scale_free(size: int, density: float, seed: int) -> Tuple[List[bool], List[Tuple[int, int]]]:
+    rng = random.Random(seed)
+    edges = []
+    # every vertex appears once per edge end, so a uniform pick from it is
+    # a pick by degree
+    ends = []
+    for i in range(1, size):
+        targets = {rng.choice(ends) if ends else 0 for _ in range(min(2, i))}
+        for j in targets:
+            edges.append((i, j))
+            ends.extend((i, j))
+    return _food(size, density, rng), edges
+
+
+def corridor(size: int, density: float, seed: int) -> Tuple[List[bool], List[Tuple[int, int]]]:
+    rng = random.Random(seed)
+    length = max(1, size // 2)
+    edges = []
+    for i in range(length):
+        if i + 1 < length:
+            edges.append((i, i + 1))
+            edges.append((length + i, length + i + 1))
+        edges.append((i, length + i))
+    return _food(2 * length, density, rng), edges
+
+
+GENERATORS = {
+    "grid": grid,
+    "geometric": geometric,
+    "scale_free": scale_free,
+    "corridor": corridor,
+}
+
+
+def _timed(results: List[Dict], row: Dict, calls: int, seconds: float) -> None:
+    row.update(
+        calls=calls,
+        seconds=round(seconds, 6),
+        per_call_us=round(seconds / calls * 1e6, 3) if calls else None
+    )
+    results.append(row)
+
+
+def run(
+        generators: List[str],
+        sizes: List[int],
+        densities: List[float],
+        ks: List[int],
+        xs: List[int],
+        queries: int = 20,
+        engines: Tuple[str, ...] = ("dijkstra",),
+        seed: int = 0
+) -> Dict:
+    """
+    Builds every maze one vertex and one edge at a time, then times the
+    queries, min_k and blocking edges on it.
+
+    :return the results, ready for json.dumps.
+    """
+
+    results = []
+    for name in generators:
+        for size in sizes:
+            for density in densities:
+                food, edges = GENERATORS[name](size, density, seed)
+                base = {"generator": name, "size": len(food), "edges": len(edges), "food": density}
+
+                maze = QuokkaMaze()
+                vertices = [Vertex(f) for f in food]
+                start = time.perf_counter()
+                for v in vertices:
+                    maze.add_vertex(v)
+                _timed(results, dict(base, operation="add_vertex"), len(vertices),
+                       time.perf_counter() - start)
+
+                start = time.perf_counter()
+                for i, j in edges:
+                    maze.fix_edge(vertices[i], vertices[j])
+                _timed(results, dict(base, operation="fix_edge"), len(edges),
+                       time.perf_counter() - start)
+
+                # the same pairs for every k, x and engine
+                rng = random.Random(seed + 1)
+                pairs = [(rng.choice(vertices), rng.choice(vertices)) for _ in range(queries)]
+                for k in ks:
+                    if "overlay" in engines:
+                        maze.enable_food_overlay(k)
+                    for engine in engines:
+                        found = 0
+                        start = time.perf_counter()
+                        for s, t in pairs:
+                            found += maze.find_path(s, t, k, engine=engine) is not None
+                        _timed(results, dict(base, operation="find_path", k=k, engine=engine,
+                                             found=found),
+                               len(pairs), time.perf_counter() - start)
+                    for x in xs:
+                        found = 0
+                        start = time.perf_counter()
+                        for s, t in pairs:
+                            found += maze.exists_path_with_extra_food(s, t, k, x)
+                        _timed(results, dict(base, operation="exists_path_with_extra_food",
+                                             k=k, x=x, found=found),
+                               len(pairs), time.perf_counter() - start)
+
+                # min_k has to stay close to linear in the maze, compare its
+                # per_call_us across sizes
+                found = 0
+                start = time.perf_counter()
+                for s, t in pairs:
+                    found += maze.min_k(s, t) is not None
+                _timed(results, dict(base, operation="min_k", found=found),
+                       len(pairs), time.perf_counter() - start)
+
+                blocked = rng.sample(edges, min(len(edges), max(1, len(edges) // 10)))
+                start = time.perf_counter()
+                for i, j in blocked:
+                    maze.block_edge(vertices[i], vertices[j])
+                _timed(results, dict(base, operation="block_edge"), len(blocked),
+                       time.perf_counter() - start)
+
+    return {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "seed": seed,
+        "results": results,
+    }
+
+
+def main(argv: List[str] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[1])
+    parser.add_argument("--generators", nargs="+", default=sorted(GENERATORS),
+                        choices=sorted(GENERATORS))
+    parser.add_argument("--sizes", nargs="+", type=int, default=[1000, 10000])
+    parser.add_argument("--food", nargs="+", type=float, default=[0.1, 0.3])
+    parser.add_argument("--k", nargs="+", type=int, default=[1, 3, 8])
+    parser.add_argument("--x", nargs="+", type=int, default=[0, 2])
+    parser.add_argument("--queries", type=int, default=20)
+    parser.add_argument("--engines", nargs="+", default=["dijkstra"],
+                        choices=QuokkaMaze.ENGINES)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", help="write the JSON here instead of stdout")
+    args = parser.parse_args(argv)
+
+    report = run(args.generators, args.sizes, args.food, args.k, args.x,
+                 args.queries, tuple(args.engines), args.seed)
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(text + "\n")
+    else:
+        sys.stdout.write(text + "\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+"""
+Query Cache
+===========
+
+A bounded, least recently used cache for the answers of maze queries.
+
+The maze puts its version number in every key and bumps it whenever the
+graph changes, so an answer computed before a change can never be found
+again afterwards.
+"""
+
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Tuple
+import threading
+
+
+class QueryCache:
+    """
+    A thread-safe LRU cache with hit, miss and eviction counters.
+
+    Attributes:
+        * self.capacity (int) - the most entries kept at once.
+        * self.hits, self.misses, self.evictions (int) - how the cache has
+            been doing since it was created.
+
+    Functions:
+        * get(self, key) - look an answer up.
+        * put(self, key, value) - remember an answer.
+        * clear(self) - forget every answer.
+        * stats(self) - the counters, as a dict.
+    """
+
+    def __init__(self, capacity: int) -> None:
+        """
+        :param capacity - The most entries kept at once, at least 1.
+        """
+
+        if not isinstance(capacity, int) or capacity < 1:
+            raise ValueError("capacity must be a positive integer")
+        self.capacity = capacity
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Hashable) -> Tuple[bool, Any]:
+        """
+        Looks up `key`, and marks it as the most recently used.
+
+        :return a (found, value) tuple, value is None when not found.
+        """
+
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return True, self._entries[key]
+            self.misses += 1
+            return False, None
+
+    def put(self, key: Hashable, value: Any) -> None:
+        """
+        Remembers `value` for `key`, evicting the least recently used entry
+        if the cache is full.
+        """
+
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.capacity:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self) -> None:
+        """
+        Forgets every entry, the counters are kept.
+        """
+
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "size": len(self._entries),
+                "capacity": self.capacity,
+            }
@@ -16,11 +16,35 @@ All functions to implement are marked with a `TODO` comment.
 Please implement these methods to help the quokkas find their new home!
 """
 
-from typing import List, Union
+from typing import Iterator, List, Tuple, Union
 
 from vertex import Vertex
-from math import inf, isinf
-import heapq
+from priority_queue import IndexedPriorityQueue
+from search import (
+    DijkstraQuery,
+    FeasibilityTree,
+    SearchScratch,
+    alternative_paths,
+    bidirectional_search,
+    bottleneck_search,
+    count_placements,
+    fuel_search,
+    plan_extra_food,
+)
+from snapshot import MazeSnapshot
+from overlay import FoodOverlay
+from cache import QueryCache
+from versioned import MazeVersion
+import mazefile
+import vectorized
+from instrument import CountingDijkstraQuery, CountingQueue, Instrumentation, QueryStats
+from replan import RoutePlan
+from oracle import ConnectivityOracle
+from landmarks import Landmarks, alt_search
+import operator
+import threading
+import time
+import weakref
 
 
 class QuokkaMaze:
@@ -38,9 +62,28 @@ class QuokkaMaze:
 
     ===== Functions =====
 
+        * has_vertex(v) - checks whether vertex `v` has been added to the maze
+        * freeze() - a compact, read-only snapshot of the maze to query
+        * save(path) - writes the maze to a binary file, mazefile.load maps
+            it back
+        * enable_food_overlay(k) / disable_food_overlay(k) - maintain an index
+            of food-to-food hops within k steps for find_path to search
+        * enable_query_cache(capacity) / disable_query_cache() - remember
+            query answers until the maze changes, see cache_stats()
+        * enable_versions() / current_version() - immutable versions of the
+            maze that can be searched while edges change
+        * enable_instrumentation(callback) / last_query_stats() /
+            query_stats() - counters and timings for every query
+        * enable_connectivity_oracle() - turn down queries that certainly
+            have no answer before searching
+        * enable_landmarks(count) - pick the landmarks find_path(engine="alt")
+            steers by
         * block_edge(u, v) - removes the edge between vertex `u` and vertex `v`
         * fix_edge(u, v) - fixes the edge between vertex `u` and `v`. or adds an
             edge if non-existent
+        * from_edges(food_flags, edge_pairs, statuses) / add_vertices(vertices) /
+            fix_edges(pairs) / block_edges(pairs) - build or change the maze
+            a whole batch at a time
         * find_path(s, t, k) - find a SIMPLE path from veretx `s` to vertex `t`
             such that from any location with food along this simple path we
             reach the next location with food in at most `k` steps
@@ -48,6 +91,20 @@ class QuokkaMaze:
             possible for the quokkas to make it from s to t along a simple path
             where from any location with food we reach the next location with
             food in at most k steps, by placing food at at most x new locations
+        * find_paths(queries) / exists_paths_with_extra_food(queries) - answer
+            a batch of queries, sharing the search between queries from the
+            same start
+        * reachable_from(s, k) - every destination the quokkas can reach from
+            s, from a single search
+        * alternative_paths(s, t, k) - a generator of distinct feasible
+            paths, each only worked out when asked for
+        * plan_path(s, t, k) - a route that repairs itself as edges are
+            fixed and blocked
+        * min_extra_food(s, t, k) - the fewest new locations we have to place
+            food on for the quokkas to make it from s to t, as far as the
+            search can tell
+        * min_k(s, t) - the smallest k for which the quokkas can make it from
+            s to t, with a path that shows it
 
     ===== Notes ======
 
@@ -65,11 +122,74 @@ class QuokkaMaze:
         TO ADD DUPLICATE VERTICES! (i.e the same vertex instance)
     """
 
+    # the searches find_path can run, see find_path
+    ENGINES = ("dijkstra", "fuel", "overlay", "numpy", "alt", "bidirectional")
+
     def __init__(self) -> None:
         """
         Initialises an empty graph with a list of empty vertices.
+
+        `self._ids` maps every vertex to its position in `self.vertices`, so
+        checking whether a vertex belongs to the maze doesn't scan the list.
+        `self._scratch` holds the search tables every thread reuses between
+        queries. `self._overlays` holds the food overlay of every k it has
+        been enabled for, they are kept up to date as edges change.
+        `self._version` goes up with every change to the maze, and
+        `self._cache` remembers query answers for the current version.
+        `self._head` is the latest immutable MazeVersion, if versions are
+        enabled. `self._arrays` holds the NumPy arrays of the numpy engine,
+        with the version they were made for. `self._instrument` collects
+        the query counters while instrumentation is enabled. `self._plans`
+        are the RoutePlans to tell about edge changes, a plan nobody holds
+        any more drops out by itself. `self._oracle` rules out hopeless
+        queries while the connectivity oracle is enabled. `self._landmarks`
+        are the distance tables of the alt engine, `self._landmark_count`
+        how many landmarks they are made with.
         """
         self.vertices = []
+        self._ids = {}
+        self._scratch = threading.local()
+        self._overlays = {}
+        self._version = 0
+        self._cache = None
+        self._head = None
+        self._arrays = None
+        self._instrument = None
+        self._plans = weakref.WeakSet()
+        self._oracle = None
+        self._landmarks = None
+        self._landmark_count = Landmarks.DEFAULT_COUNT
+
+    def has_vertex(self, v: Vertex) -> bool:
+        """
+        Checks whether the vertex `v` has been added to this maze.
+
+        :param v - The vertex to look for.
+        :return true if `v` is in the maze, else false
+        """
+        return isinstance(v, Vertex) and v in self._ids
+
+    def freeze(self) -> MazeSnapshot:
+        """
+        Takes an array-backed snapshot of the maze as it is now.
+
+        The snapshot answers find_path and exists_path_with_extra_food with
+        far less memory and better locality than the vertex objects, but it
+        doesn't see edges fixed or blocked afterwards.
+
+        :return a MazeSnapshot of this maze.
+        """
+        return MazeSnapshot(self)
+
+    def save(self, path: str) -> None:
+        """
+        Writes the maze to `path` in the binary maze file format. Load it
+        with mazefile.load, which maps the file instead of rebuilding the
+        vertices.
+
+        :param path - The file to write.
+        """
+        mazefile.save(self, path)
 
     def add_vertex(self, v: Vertex) -> bool:
         """
@@ -80,8 +200,15 @@ class QuokkaMaze:
         :return true if the vertex was correctly added, else false
         """
         # TODO implement me, please?   Sure!
-        if isinstance(v, Vertex) and v not in self.vertices:
+        if isinstance(v, Vertex) and v not in self._ids:
+            self._ids[v] = len(self.vertices)
             self.vertices.append(v)
+            for overlay in self._overlays.values():
+                overlay.vertex_added(v)
+            self._bump_version()
+            head = self._head
+            if head is not None:
+                self._head = head.with_vertex(self._version, v.has_food)
             return True
         else:
             return False
@@ -100,15 +227,16 @@ class QuokkaMaze:
         # input validity check
         if not(isinstance(u, Vertex) and isinstance(v, Vertex)):
             return False
-        if u not in self.vertices or v not in self.vertices:
+        if u not in self._ids or v not in self._ids:
             return False
         if u == v:
             return False
-        if u in v.edges or v in u.edges:
+        if v.has_edge(u) or u.has_edge(v):
             return False
         
         u.add_edge(v)
         v.add_edge(u)
+        self._edge_changed(u, v)
         return True
         
 
@@ -126,23 +254,366 @@ class QuokkaMaze:
         # TODO implement me, please!
         if not(isinstance(u, Vertex) and isinstance(v, Vertex)):
             return False
-        if u not in self.vertices or v not in self.vertices:
+        if u not in self._ids or v not in self._ids:
             return False
         if u == v:
             return False
-        if u in v.edges or v in u.edges:
+        if v.has_edge(u) or u.has_edge(v):
             u.rm_edge(v)
             v.rm_edge(u)
+            self._edge_changed(u, v)
             return True
         else:
             return False
 
+    @classmethod
+    def from_edges(
+            cls,
+            food_flags,
+            edge_pairs,
+            statuses: Union[List[bool], None] = None
+    ) -> "QuokkaMaze":
+        """
+        Builds a maze in one pass: a new vertex for every entry of
+        `food_flags`, and an edge for every pair of positions in
+        `edge_pairs`. Pairs that aren't two indices, are out of range, loops
+        or duplicates are skipped, and reported in `statuses`.
+
+        :param food_flags - Whether each new vertex has food.
+        :param edge_pairs - (i, j) positions in `food_flags` to connect, any
+            pairs of integers, e.g. the rows of a NumPy array.
+        :param statuses - If given, a list that gets whether each pair was
+            added, in the same order, like fix_edges returns.
+        :return the new maze, its vertices in `maze.vertices`.
+        """
+        maze = cls()
+        maze.add_vertices([Vertex(bool(food)) for food in food_flags])
+
+        vertices = maze.vertices
+        size = len(vertices)
+        for pair in edge_pairs:
+            try:
+                i, j = (operator.index(p) for p in pair)
+            except (TypeError, ValueError):
+                ok = False
+            else:
+                ok = 0 <= i < size and 0 <= j < size and i != j
+            if ok:
+                u = vertices[i]
+                v = vertices[j]
+                ok = not u.has_edge(v)
+                if ok:
+                    u.add_edge(v)
+                    v.add_edge(u)
+            if statuses is not None:
+                statuses.append(ok)
+        return maze
+
+    def add_vertices(self, vertices) -> List[bool]:
+        """
+        Adds many vertices, like add_vertex, updating the overlays, versions
+        and cache once for the whole batch.
+
+        :param vertices - The vertices to add.
+        :return whether each vertex was added, in the same order.
+        """
+        results = []
+        added = []
+        for v in vertices:
+            ok = isinstance(v, Vertex) and v not in self._ids
+            if ok:
+                self._ids[v] = len(self.vertices)
+                self.vertices.append(v)
+                added.append(v)
+            results.append(ok)
+
+        if added:
+            for overlay in self._overlays.values():
+                for v in added:
+                    overlay.vertex_added(v)
+            self._bump_version()
+            head = self._head
+            if head is not None:
+                for v in added:
+                    head = head.with_vertex(self._version, v.has_food)
+                self._head = head
+        return results
+
+    def _edge_pair(self, pair) -> bool:
+        """
+        Checks one (u, v) pair of fix_edges or block_edges.
+        """
+        if not isinstance(pair, (tuple, list)) or len(pair) != 2:
+            return False
+        u, v = pair
+        if not(isinstance(u, Vertex) and isinstance(v, Vertex)):
+            return False
+        return u in self._ids and v in self._ids and u != v
+
+    def fix_edges(self, pairs) -> List[bool]:
+        """
+        Fixes many edges, like fix_edge, updating the overlays, versions and
+        cache once for the whole batch. A pair repeated in the batch is only
+        fixed the first time.
+
+        :param pairs - (u, v) tuples of vertices.
+        :return whether each edge was fixed, in the same order.
+        """
+        results = []
+        changed = []
+        for pair in pairs:
+            ok = self._edge_pair(pair) and not pair[0].has_edge(pair[1])
+            if ok:
+                u, v = pair
+                u.add_edge(v)
+                v.add_edge(u)
+                changed.append((u, v))
+            results.append(ok)
+
+        self._edges_changed(changed)
+        return results
+
+    def block_edges(self, pairs) -> List[bool]:
+        """
+        Blocks many edges, like block_edge, updating the overlays, versions
+        and cache once for the whole batch. A pair repeated in the batch is
+        only blocked the first time.
+
+        :param pairs - (u, v) tuples of vertices.
+        :return whether each edge was blocked, in the same order.
+        """
+        results = []
+        changed = []
+        seen = set()
+        for pair in pairs:
+            ok = self._edge_pair(pair) and pair[0].has_edge(pair[1])
+            if ok:
+                edge = frozenset(pair)
+                ok = edge not in seen
+                if ok:
+                    seen.add(edge)
+                    changed.append(tuple(pair))
+            results.append(ok)
+
+        # the overlay scans that used the edges can only be found before
+        # they are gone
+        before = {k: overlay.affected(changed) for k, overlay in self._overlays.items()}
+        for u, v in changed:
+            u.rm_edge(v)
+            v.rm_edge(u)
+        self._edges_changed(changed, before)
+        return results
+
+    def _edge_changed(self, u: Vertex, v: Vertex) -> None:
+        """
+        Brings everything derived from the edges up to date after the edge
+        between `u` and `v` was fixed or blocked.
+        """
+        self._edges_changed([(u, v)])
+
+    def _edges_changed(self, changed, affected=None) -> None:
+        """
+        Brings everything derived from the edges up to date after the edges
+        in `changed` were fixed or blocked.
+
+        :param changed - The (u, v) pairs that changed.
+        :param affected - For every overlay k, food locations to rescan on
+        top of the ones near the changed edges now.
+        """
+        if not changed:
+            return
+        for k, overlay in self._overlays.items():
+            found = overlay.affected(changed)
+            if affected:
+                found |= affected[k]
+            overlay.rescan(found)
+        for plan in list(self._plans):
+            plan.edges_changed(changed)
+        if self._oracle is not None:
+            self._oracle.edges_changed(changed)
+        if any(u.has_edge(v) for u, v in changed):
+            # a new edge can make distances shorter than the tables say,
+            # blocked ones only make them longer
+            self._landmarks = None
+        self._bump_version()
+
+        head = self._head
+        if head is not None:
+            # publish the next version in one assignment, readers holding
+            # the old one keep it as it was
+            ids = self._ids
+            for u, v in changed:
+                head = head.with_edge(self._version, ids[u], ids[v], u.has_edge(v))
+            self._head = head
+
+    def _bump_version(self) -> None:
+        """
+        Marks the maze as changed, cached answers are no longer valid.
+        """
+        self._version += 1
+        if self._cache is not None:
+            self._cache.clear()
+
+    def enable_versions(self) -> None:
+        """
+        Starts publishing an immutable MazeVersion after every change, see
+        current_version(). Each fix_edge/block_edge copies O(log V) of it
+        and shares the rest with the version before.
+        """
+        self._head = MazeVersion(self)
+
+    def disable_versions(self) -> None:
+        """
+        Stops publishing versions, the ones already handed out still work.
+        """
+        self._head = None
+
+    def current_version(self) -> Union[MazeVersion, None]:
+        """
+        The maze as it is now, frozen. Searches on it are not affected by
+        edges fixed or blocked while they run, so a reader never has to wait
+        for a writer. It has the same queries as a MazeSnapshot.
+
+        :return the latest MazeVersion, or None if versions aren't enabled.
+        """
+        return self._head
+
+    def enable_query_cache(self, capacity: int = 1024) -> None:
+        """
+        Starts remembering the answers of find_path and
+        exists_path_with_extra_food, up to `capacity` of them, least recently
+        used first out. Any change to the maze forgets them all.
+
+        :param capacity - The most answers kept at once, at least 1.
+        """
+        self._cache = QueryCache(capacity)
+
+    def disable_query_cache(self) -> None:
+        """
+        Stops remembering query answers.
+        """
+        self._cache = None
+
+    def cache_stats(self) -> Union[dict, None]:
+        """
+        :return the hits, misses, evictions, size and capacity of the query
+        cache, or None if it isn't enabled.
+        """
+        cache = self._cache
+        return None if cache is None else cache.stats()
+
+    def enable_instrumentation(self, callback=None) -> None:
+        """
+        Starts counting and timing every find_path and
+        exists_path_with_extra_food, see instrument.QueryStats. The totals
+        start from zero.
+
+        :param callback - Called with the QueryStats of every query, in the
+        thread that ran it, e.g. to feed a sampling profiler.
+        """
+        self._instrument = Instrumentation(callback)
+
+    def disable_instrumentation(self) -> None:
+        """
+        Stops counting, queries run exactly as before it was enabled.
+        """
+        self._instrument = None
+
+    def last_query_stats(self) -> Union[QueryStats, None]:
+        """
+        :return the QueryStats of this thread's last query, or None if
+        instrumentation isn't enabled or nothing was asked yet.
+        """
+        instrument = self._instrument
+        return None if instrument is None else instrument.last()
+
+    def query_stats(self) -> Union[dict, None]:
+        """
+        :return the number of queries, their total time and counters since
+        instrumentation was enabled, or None if it isn't.
+        """
+        instrument = self._instrument
+        return None if instrument is None else instrument.totals()
+
+    def enable_landmarks(self, count: int = Landmarks.DEFAULT_COUNT) -> bool:
+        """
+        Picks `count` landmarks for find_path(engine="alt") and measures the
+        maze from them now, instead of on the first query. More landmarks
+        give tighter bounds, at the cost of a breadth first search and a
+        table of the whole maze each.
+
+        :param count - How many landmarks, at least 1.
+        :return true if the tables were made, false if `count` is invalid.
+        """
+        if not isinstance(count, int) or count < 1:
+            return False
+        self._landmark_count = count
+        self._landmarks = Landmarks(self, count)
+        return True
+
+    def enable_connectivity_oracle(self) -> None:
+        """
+        Starts checking every query against oracle.ConnectivityOracle first.
+        A query it rules out answers None / False straight away, without a
+        search. Fixed edges are folded in as they come, blocked ones make it
+        rebuild on the next query.
+        """
+        self._oracle = ConnectivityOracle(self)
+
+    def disable_connectivity_oracle(self) -> None:
+        """
+        Stops checking queries against the oracle, and drops its union-finds.
+        """
+        self._oracle = None
+
+    def _ruled_out(self, s: Vertex, t: Vertex, k: int, x: int) -> bool:
+        """
+        Checks a valid query against the connectivity oracle, if enabled.
+        """
+        oracle = self._oracle
+        return oracle is not None and oracle.rules_out(s, t, k, x)
+
+    def _valid_query(self, s, t, k, x) -> bool:
+        """
+        Checks the parameters shared by the path queries.
+        """
+        if not(isinstance(s, Vertex) and isinstance(t, Vertex) and isinstance(k, int) and isinstance(x, int)):
+            return False
+        if s not in self._ids or t not in self._ids or k < 0 or x < 0:
+            return False
+        return True
+
+    def enable_food_overlay(self, k: int) -> bool:
+        """
+        Starts maintaining the food overlay for `k`, see overlay.FoodOverlay.
+        find_path(engine="overlay") then searches from food to food instead
+        of through every location, and fix_edge/block_edge keep it up to date.
+
+        :param k - The maximum number of hops between locations with food,
+        must be at least 1.
+        :return true if the overlay was built, false if it already existed or
+        `k` is invalid.
+        """
+        if not isinstance(k, int) or k < 1 or k in self._overlays:
+            return False
+        self._overlays[k] = FoodOverlay(self, k)
+        return True
+
+    def disable_food_overlay(self, k: int) -> bool:
+        """
+        Stops maintaining the food overlay for `k`.
+
+        :return true if there was an overlay for `k`, else false.
+        """
+        return self._overlays.pop(k, None) is not None
+
     def find_path(
             self,
             s: Vertex,
             t: Vertex,
             k: int,
-            extra_food:int=0
+            extra_food:int=0,
+            engine: str = "dijkstra"
     ) -> Union[List[Vertex], None]:
         """
         find_path returns a SIMPLE path between `s` and `t` such that from any
@@ -153,12 +624,33 @@ class QuokkaMaze:
         :param t - The destination for the quokka colony
         :param k - The maximum number of hops between locations with food, so
         that the colony can survive!
+        :param extra_food - How many locations we may place extra food on.
+        :param engine - Which search to run:
+            * "dijkstra" - the modified Dijkstra search (default).
+            * "fuel" - a breadth first search over (vertex, steps since food)
+            states, see `search.fuel_search`. Each state is visited at most
+            once, so it is O((V + E) * k) even when food is sparse.
+            * "overlay" - hops between locations with food using the food
+            overlay for `k`. Queries use "fuel" unless enable_food_overlay(k)
+            was called, so that a query never makes every later edge change
+            pay for an overlay, and with extra food.
+            * "numpy" - a level-synchronous breadth first search over NumPy
+            arrays of the maze, see vectorized.ArrayMaze. The arrays are made
+            again on the first query after the maze changes. Queries with
+            extra food use "fuel". Raises ImportError without NumPy.
+            * "alt" - A* over the same states as "fuel", steered towards `t`
+            by landmark distance tables, see landmarks.alt_search. The
+            tables are made on the first query and again after an edge is
+            fixed. Queries with extra food use "fuel".
+            * "bidirectional" - the states searched from `s` and from `t` at
+            once until the two searches meet, see
+            search.bidirectional_search. Queries with extra food use "fuel".
         :returns
             * The list of vertices to form the simple path from `s` to `t`
             satisfying the conditions.
             OR
             * None if no simple path exists that can satisfy the conditions, or
-            is invalid.
+            the input (the engine included) is invalid.
 
         Example:
         (* means the vertex has food)
@@ -176,83 +668,159 @@ class QuokkaMaze:
 
         # TODO implement me please
         # input validity check
-        if not(isinstance(s, Vertex) and isinstance(t, Vertex) and isinstance(k, int) and isinstance(extra_food, int)):
-            return None
-        if s not in self.vertices or t not in self.vertices or k < 0 or extra_food < 0:
+        if not self._valid_query(s, t, k, extra_food) or engine not in self.ENGINES:
             return None
         # s != t ???
 
-        # modified Dijstra Algorithm
-        # initiation
-        i = 0
-        while i < len(self.vertices):
-            self.vertices[i].Dijkstra_parent = None
-            self.vertices[i].Dijkstra_distance = inf
-            self.vertices[i].extra_food = None
-            self.vertices[i].destination = False
-            self.vertices[i].heap_counter = i
-            i += 1
-        
-        s.Dijkstra_parent = "<root>"
-        s.Dijkstra_distance = 0
-        s.extra_food = extra_food
+        instrument = self._instrument
+        if instrument is None:
+            return self._find_path(s, t, k, extra_food, engine, None)
+
+        stats = QueryStats("find_path", engine, k, extra_food)
+        start = time.perf_counter()
+        path = self._find_path(s, t, k, extra_food, engine, stats)
+        stats.seconds = time.perf_counter() - start
+        stats.found = path is not None
+        stats.path_length = 0 if path is None else len(path)
+        instrument.record(stats)
+        return path
 
-        t.destination = True
+    def _find_path(
+            self,
+            s: Vertex,
+            t: Vertex,
+            k: int,
+            extra_food: int,
+            engine: str,
+            stats: Union[QueryStats, None]
+    ) -> Union[List[Vertex], None]:
+        """
+        find_path through the connectivity oracle and the query cache, the
+        inputs have already been checked.
+        """
+
+        if self._ruled_out(s, t, k, extra_food):
+            return None
 
-        pqkeys = [v.Dijkstra_distance for v in self.vertices]
-        pqcounters = [v.heap_counter for v in self.vertices]
-        PQ = [elem for elem in zip(pqkeys, pqcounters, self.vertices)]    # priority queue
-        heapq.heapify(PQ)
+        cache = self._cache
+        if cache is None:
+            return self._search(s, t, k, extra_food, engine, stats)
+
+        key = ("find_path", self._version, s, t, k, extra_food, engine)
+        found, path = cache.get(key)
+        if found:
+            if stats is not None:
+                stats.cached = True
+        else:
+            path = self._search(s, t, k, extra_food, engine, stats)
+            if path is not None:
+                path = tuple(path)
+            cache.put(key, path)
+        return None if path is None else list(path)
+
+    def _search(
+            self,
+            s: Vertex,
+            t: Vertex,
+            k: int,
+            extra_food: int,
+            engine: str,
+            stats: Union[QueryStats, None] = None
+    ) -> Union[List[Vertex], None]:
+        """
+        Runs the search `engine` for find_path, the inputs have already been
+        checked. The dijkstra engine counts its work into `stats`.
+        """
+
+        overlay = self._overlays.get(k) if engine == "overlay" else None
+        if overlay is not None and extra_food == 0:
+            return overlay.find_path(s, t)
+        if engine == "numpy" and extra_food == 0:
+            arrays = self._array_maze()
+            ids = arrays.snapshot.ids
+            path = arrays.search(ids[s], ids[t], k)
+            return None if path is None else [arrays.snapshot.vertices[i] for i in path]
+        if engine == "alt" and extra_food == 0:
+            landmarks = self._landmarks
+            if landmarks is None:
+                landmarks = self._landmarks = Landmarks(self, self._landmark_count)
+            return alt_search(s, t, k, landmarks)
+        if engine == "bidirectional" and extra_food == 0:
+            return bidirectional_search(s, t, k)
+        if engine in ("fuel", "overlay", "numpy", "alt", "bidirectional"):
+            return fuel_search(s, t, k, extra_food)
+        return self._dijkstra_path(s, t, k, extra_food, stats)
+
+    def _array_maze(self) -> vectorized.ArrayMaze:
+        """
+        The NumPy arrays of the maze as it is now, made once per version.
+        """
+        cached = self._arrays
+        if cached is None or cached[0] != self._version:
+            cached = self._arrays = (self._version, vectorized.ArrayMaze(self.freeze()))
+        return cached[1]
+
+    def _dijkstra_path(
+            self,
+            s: Vertex,
+            t: Vertex,
+            k: int,
+            extra_food: int,
+            stats: Union[QueryStats, None] = None
+    ) -> Union[List[Vertex], None]:
+        """
+        The modified Dijkstra search behind find_path(engine="dijkstra"), the
+        inputs have already been checked.
+
+        All the working state lives in a `DijkstraQuery`, nothing is written
+        to the vertices, so any number of searches can share the maze. With
+        `stats` the counting versions of the query and the queue are used.
+        """
+
+        # modified Dijstra Algorithm
+        # initiation, only the start is reached so far and nothing else is
+        # touched until the search gets to it
+        scratch = getattr(self._scratch, "dijkstra", None)
+        if scratch is None:
+            scratch = self._scratch.dijkstra = SearchScratch()
+        # priority queue, keyed on (distance, counter) so that ties never
+        # compare the vertices themselves
+        if stats is None:
+            query = DijkstraQuery(s, extra_food, self._ids, scratch)
+            PQ = IndexedPriorityQueue()
+        else:
+            stats.start_counting()
+            query = CountingDijkstraQuery(s, extra_food, self._ids, scratch, stats)
+            PQ = CountingQueue(stats)
+        PQ.push(s, (0, self._ids[s]))
 
         # find the path
         while PQ:
-            if not isinf(PQ[0][0]):
-                current_vertex = heapq.heappop(PQ)[2]
-                if current_vertex.will_survive(k):
-                    if current_vertex.destination:
-                        # return a list
-                        return_list = []
-                        to_be_append = current_vertex
-                        while to_be_append.Dijkstra_parent != "<root>":
-                            return_list.append(to_be_append)
-                            to_be_append = to_be_append.Dijkstra_parent
-                        return_list.append(to_be_append)
-                        return [ele for ele in reversed(return_list)]
-
-                    # update neighbors
-                    j = 0
-                    while j < len(current_vertex.edges):
-                        # update neighbor's key in the heap
-                        # update neighbor's parent
-                        # update neighbor's extra_food here
-                        # reorder the heap
-                        try:
-                            idx = PQ.index((current_vertex.edges[j].Dijkstra_distance, current_vertex.edges[j].heap_counter, current_vertex.edges[j]))
-                            if current_vertex.Dijkstra_distance + 1 < current_vertex.edges[j].Dijkstra_distance:
-                                current_vertex.edges[j].Dijkstra_distance = current_vertex.Dijkstra_distance + 1
-                                current_vertex.edges[j].Dijkstra_parent = current_vertex
-                                current_vertex.edges[j].extra_food = current_vertex.extra_food
-                                PQ[idx] = (current_vertex.edges[j].Dijkstra_distance, current_vertex.edges[j].heap_counter, current_vertex.edges[j])
-                                heapq._siftdown(PQ, 0, idx)     # reorder the heap
-                        except ValueError:
-                            pass
-                        j += 1
-                else:
-                    # delete k vertexs:
-                    #   initilize k vertices' value
-                    #   push them back to the heap
-                    to_be_initialize = current_vertex
-                    i1 = 0
-                    while i1 < k:
-                        to_be_initialize.Dijkstra_parent = None
-                        to_be_initialize.Dijkstra_distance = inf
-                        to_be_initialize.extra_food = None
-                        heapq.heappush(PQ, (to_be_initialize.Dijkstra_distance, to_be_initialize.heap_counter, to_be_initialize))
-                        i1 += 1
+            current_vertex = PQ.pop()[1]
+            query.settle(current_vertex)
+            if query.will_survive(current_vertex, k):
+                if current_vertex == t:
+                    return query.path_to(current_vertex)
 
-            else:
-                return None
+                # update neighbors
+                distance = query.distance_of(current_vertex) + 1
+                for neighbor in current_vertex.edges:
+                    # update neighbor's key in the heap
+                    # update neighbor's parent
+                    # update neighbor's extra_food here
+                    # neighbors that already left the heap are done
+                    if not query.is_settled(neighbor) and distance < query.distance_of(neighbor):
+                        query.relax(current_vertex, neighbor)
+                        if neighbor in PQ:
+                            PQ.update(neighbor, (distance, self._ids[neighbor]))
+                        else:
+                            PQ.push(neighbor, (distance, self._ids[neighbor]))
+            elif k > 0:
+                # initilize the vertex's value, so it can still be reached
+                # from another direction
+                query.forget(current_vertex)
 
+        return None
 
     def exists_path_with_extra_food(
         self,
@@ -267,6 +835,8 @@ class QuokkaMaze:
         next location with food in at most k steps, by placing food at at most
         x new locations.
 
+        This is min_extra_food(s, t, k) <= x.
+
         :param s - The start vertex for the quokka colony
         :param t - The destination for the quokka colony
         :param k - The maximum number of hops between locations with food, so
@@ -293,8 +863,327 @@ class QuokkaMaze:
         """
 
         # TODO implement me please
-        path = self.find_path(s, t, k, x)
-        if path is None:
+        if not self._valid_query(s, t, k, x):
             return False
-        else:
-            return True
+
+        instrument = self._instrument
+        if instrument is None:
+            return self._exists_path(s, t, k, x, None)
+
+        stats = QueryStats("exists_path_with_extra_food", None, k, x)
+        start = time.perf_counter()
+        answer = self._exists_path(s, t, k, x, stats)
+        stats.seconds = time.perf_counter() - start
+        stats.found = answer
+        instrument.record(stats)
+        return answer
+
+    def _exists_path(
+        self,
+        s: Vertex,
+        t: Vertex,
+        k: int,
+        x: int,
+        stats: Union[QueryStats, None]
+    ) -> bool:
+        """
+        exists_path_with_extra_food through the connectivity oracle and the
+        query cache, the inputs have already been checked.
+        """
+
+        if self._ruled_out(s, t, k, x):
+            return False
+
+        cache = self._cache
+        if cache is not None:
+            key = ("exists_path_with_extra_food", self._version, s, t, k, x)
+            found, answer = cache.get(key)
+            if found:
+                if stats is not None:
+                    stats.cached = True
+                return answer
+
+        needed = self.min_extra_food(s, t, k)
+        answer = needed is not None and needed <= x
+        if cache is not None:
+            cache.put(key, answer)
+        return answer
+
+    def _batch(self, queries, arity: Tuple[int, ...]):
+        """
+        Checks a batch of queries and groups the valid ones by start and k.
+
+        :return the number of queries, and a dict from (s, k) to a list of
+        (index, t, x) for every valid query.
+        """
+        queries = list(queries)
+        groups = {}
+        for i, query in enumerate(queries):
+            if not isinstance(query, (tuple, list)) or len(query) not in arity:
+                continue
+            s, t, k = query[:3]
+            x = query[3] if len(query) == 4 else 0
+            if self._valid_query(s, t, k, x):
+                groups.setdefault((s, k), []).append((i, t, x))
+        return len(queries), groups
+
+    def find_paths(self, queries) -> List[Union[List[Vertex], None]]:
+        """
+        Answers many find_path queries at once. Queries from the same start
+        with the same k and extra food share one search tree, instead of
+        every query searching the maze from scratch.
+
+        The paths are the kind find_path(engine="fuel") finds, but may differ
+        from it when several paths are equally good.
+
+        :param queries - (s, t, k) or (s, t, k, extra_food) tuples.
+        :return the answer of every query, in the same order. Invalid
+        queries get None, like find_path.
+        """
+        size, groups = self._batch(queries, (3, 4))
+        results = [None] * size
+        for (s, k), group in groups.items():
+            by_food = {}
+            for i, t, x in group:
+                if not self._ruled_out(s, t, k, x):
+                    by_food.setdefault(x, []).append((i, t))
+            for x, targets in by_food.items():
+                if len(targets) == 1:
+                    # nothing to share, the search can stop at the destination
+                    i, t = targets[0]
+                    results[i] = fuel_search(s, t, k, x)
+                    continue
+                tree = FeasibilityTree(s, k, x)
+                for i, t in targets:
+                    results[i] = tree.path_to(t)
+        return results
+
+    def exists_paths_with_extra_food(self, queries) -> List[bool]:
+        """
+        Answers many exists_path_with_extra_food queries at once. Queries
+        from the same start with the same k share one search tree, explored
+        with as much extra food as the largest x among them.
+
+        :param queries - (s, t, k, x) tuples.
+        :return the answer of every query, in the same order. Invalid
+        queries get False, like exists_path_with_extra_food.
+        """
+        size, groups = self._batch(queries, (4,))
+        results = [False] * size
+        for (s, k), group in groups.items():
+            group = [(i, t, x) for i, t, x in group if not self._ruled_out(s, t, k, x)]
+            if not group:
+                continue
+            budget = max(x for _, _, x in group)
+            tree = FeasibilityTree(s, k, budget)
+            for i, t, x in group:
+                path = tree.path_to(t)
+                results[i] = path is not None and count_placements(path, k) <= x
+        return results
+
+    def reachable_from(
+        self,
+        s: Vertex,
+        k: int,
+        extra_food: int = 0
+    ) -> Union[FeasibilityTree, None]:
+        """
+        Runs one search from s and answers, for every destination, whether
+        the quokkas can get there, and how. This replaces a find_path(s, t, k)
+        call for every candidate t.
+
+        :param s - The start vertex for the quokka colony
+        :param k - The maximum number of hops between locations with food, so
+        that the colony can survive!
+        :param extra_food - How many locations we may place extra food on.
+        :returns
+            * A search.FeasibilityTree: `tree.reachable(t)` and
+            `tree.path_to(t)`. It doesn't see later changes to the maze.
+            OR
+            * None if the input is invalid.
+
+        Example:
+        (* means the vertex has food)
+                    *       *
+            A---B---C---D---E
+
+            tree = reachable_from(A, 2)
+            tree.reachable(E) -> returns: True
+            tree.path_to(D) -> returns: [A, B, C, D]
+            tree.reachable(A) -> returns: True
+        """
+        if not self._valid_query(s, s, k, extra_food):
+            return None
+        return FeasibilityTree(s, k, extra_food)
+
+    def alternative_paths(
+        self,
+        s: Vertex,
+        t: Vertex,
+        k: int,
+        extra_food: int = 0
+    ) -> Union[Iterator[List[Vertex]], None]:
+        """
+        Lazily lists distinct SIMPLE paths from s to t the quokkas survive,
+        see search.alternative_paths. The first path is ready as soon as one
+        search is done, and every later one costs a few more searches, only
+        when it is asked for. The maze itself is never changed.
+
+        The generator reads the maze as it goes, take it from
+        current_version() or freeze() if edges may change in between.
+
+        :param s - The start vertex for the quokka colony
+        :param t - The destination for the quokka colony
+        :param k - The maximum number of hops between locations with food, so
+        that the colony can survive!
+        :param extra_food - How many locations we may place extra food on.
+        :returns
+            * A generator of paths, lists of vertices from `s` to `t`.
+            OR
+            * None if the input is invalid.
+
+        Example:
+        (* means the vertex has food)
+                    *       *
+            A---B---C---D---E
+                |           |
+                F-----------G*
+
+            paths = alternative_paths(A, E, 3)
+            next(paths) -> returns: [A, B, C, D, E]
+            next(paths) -> returns: [A, B, F, G, E]
+            next(paths) -> raises StopIteration
+        """
+        if not self._valid_query(s, t, k, extra_food):
+            return None
+        return alternative_paths(s, t, k, extra_food)
+
+    def plan_path(
+        self,
+        s: Vertex,
+        t: Vertex,
+        k: int
+    ) -> Union[RoutePlan, None]:
+        """
+        A find_path(s, t, k) query that stays up to date, see
+        replan.RoutePlan. `plan.path()` is the route in the maze as it is
+        now: after fix_edge or block_edge it repairs the part of its search
+        the change affects instead of searching from scratch.
+
+        :param s - The start vertex for the quokka colony
+        :param t - The destination for the quokka colony
+        :param k - The maximum number of hops between locations with food, so
+        that the colony can survive!
+        :returns
+            * The RoutePlan, until `plan.close()` or it is dropped.
+            OR
+            * None if the input is invalid.
+
+        Example:
+        (* means the vertex has food)
+                    *       *
+            A---B---C---D---E
+
+            plan = plan_path(A, E, 2)
+            plan.path() -> returns: [A, B, C, D, E]
+            block_edge(C, D)
+            plan.path() -> returns: None
+        """
+        if not self._valid_query(s, t, k, 0):
+            return None
+        plan = RoutePlan(self, s, t, k)
+        self._plans.add(plan)
+        return plan
+
+    def min_extra_food(
+        self,
+        s: Vertex,
+        t: Vertex,
+        k: int,
+        return_plan: bool = False
+    ) -> Union[int, Tuple[int, List[Vertex], List[Vertex]], None]:
+        """
+        Finds the fewest locations we have to place extra food on so that the
+        quokkas make it from s to t along a SIMPLE path, where from any
+        location with food we reach the next location with food in at most k
+        steps. This is one search, whatever the answer turns out to be.
+
+        The search goes by walks, and a simple path it can't put together
+        from them may be missed, so the answer is an upper bound: it is
+        always achievable, and exact unless such a path needs less food, see
+        search.plan_extra_food.
+
+        :param s - The start vertex for the quokka colony
+        :param t - The destination for the quokka colony
+        :param k - The maximum number of hops between locations with food, so
+        that the colony can survive!
+        :param return_plan - Also return where to put the food, and the path.
+        :returns
+            * The number of extra food needed, or a (count, placements, path)
+            tuple with `return_plan`.
+            OR
+            * None if no amount of food helps, or the input is invalid.
+
+        Example:
+        (* means the vertex has food)
+                            *
+            A---B---C---D---E
+
+            1/ min_extra_food(A, E, 2) -> returns: 1
+                (food on `C`)
+
+            2/ min_extra_food(A, E, 1, return_plan=True)
+                -> returns: (3, [B, C, D], [A, B, C, D, E])
+
+        """
+
+        if not self._valid_query(s, t, k, 0):
+            return None
+
+        plan = plan_extra_food(s, t, k)
+        if plan is None or return_plan:
+            return plan
+        return plan[0]
+
+    def min_k(
+        self,
+        s: Vertex,
+        t: Vertex
+    ) -> Union[Tuple[int, List[Vertex]], None]:
+        """
+        Finds the smallest k for which find_path(s, t, k) has a SIMPLE path,
+        in O(log k) fuel searches. Like min_extra_food the searches go by
+        walks, so in rare mazes the k is an upper bound, see
+        search.bottleneck_search.
+
+        For s == t this is (0, [s]), as with every find_path engine but the
+        default "dijkstra", which turns k=0 down even when the colony is
+        already there.
+
+        :param s - The start vertex for the quokka colony
+        :param t - The destination for the quokka colony
+        :returns
+            * A (k, path) tuple, the path needs no more than k steps between
+            locations with food.
+            OR
+            * None if t can't be reached from s, or the input is invalid.
+
+        Example:
+        (* means the vertex has food)
+                    *       *
+            A---B---C---D---E
+
+            1/ min_k(A, E) -> returns: (2, [A, B, C, D, E])
+
+            2/ min_k(A, D) -> returns: (2, [A, B, C, D])
+                (D has no food, so the colony must get there before it
+                runs out)
+
+        """
+
+        if not(isinstance(s, Vertex) and isinstance(t, Vertex)):
+            return None
+        if s not in self._ids or t not in self._ids:
+            return None
+
+        return bottleneck_search(s, t)
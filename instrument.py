@@ -0,0 +1,163 @@
+"""
+Instrumentation
+===============
+
+Opt-in counters and timings for the queries of a quokka maze.
+
+While instrumentation is off the maze runs its usual classes and pays for
+a single `is None` check per query. While it is on, the modified Dijkstra
+search runs on the counting subclasses below, which tally every heap
+operation, relaxation, starved vertex and parent step, and every query is
+timed. Each query's QueryStats is kept for its thread, added to the
+totals, and handed to the callback if there is one.
+"""
+
+from typing import Callable, Dict, Union
+import threading
+
+from priority_queue import IndexedPriorityQueue
+from search import DijkstraQuery
+
+
+class QueryStats:
+    """
+    What one query did.
+
+    Attributes:
+        * self.operation (str) - "find_path" or "exists_path_with_extra_food".
+        * self.engine (str) - the find_path engine, None for the others.
+        * self.k, self.extra_food (int) - the query's parameters.
+        * self.cached (bool) - the answer came from the query cache.
+        * self.found (bool) - whether there was a path.
+        * self.path_length (int) - vertices on the path, 0 if none.
+        * self.seconds (float) - wall time of the query.
+        * self.pushes, self.pops, self.updates, self.sifts (int or None) - priority
+            queue operations, sifts counts the swaps of both directions.
+        * self.relaxations (int or None) - neighbours reached with a shorter path.
+        * self.starved (int or None) - vertices the quokkas wouldn't survive.
+        * self.parent_steps (int or None) - parents looked up, walking back to the
+            last meal or along the path.
+
+    Only a dijkstra search fills in the counters, from pushes to
+    parent_steps. They stay None for the other engines, for
+    exists_path_with_extra_food and for answers from the cache, so that a
+    query nobody counted doesn't look like one that did no work.
+    """
+
+    COUNTERS = ("pushes", "pops", "updates", "sifts", "relaxations", "starved", "parent_steps")
+
+    def __init__(self, operation: str, engine: Union[str, None], k: int, extra_food: int) -> None:
+        self.operation = operation
+        self.engine = engine
+        self.k = k
+        self.extra_food = extra_food
+        self.cached = False
+        self.found = False
+        self.path_length = 0
+        self.seconds = 0.0
+        for name in self.COUNTERS:
+            setattr(self, name, None)
+
+    def start_counting(self) -> None:
+        """
+        Sets the counters to 0, for a search that is about to count.
+        """
+        for name in self.COUNTERS:
+            setattr(self, name, 0)
+
+    def as_dict(self) -> Dict:
+        return dict(vars(self))
+
+
+class CountingQueue(IndexedPriorityQueue):
+    """
+    An IndexedPriorityQueue counting its operations into a QueryStats.
+    """
+
+    def __init__(self, stats: QueryStats) -> None:
+        super().__init__()
+        self.stats = stats
+
+    def push(self, item, key) -> None:
+        self.stats.pushes += 1
+        super().push(item, key)
+
+    def pop(self):
+        self.stats.pops += 1
+        return super().pop()
+
+    def update(self, item, key) -> None:
+        self.stats.updates += 1
+        super().update(item, key)
+
+    def _swap(self, i: int, j: int) -> None:
+        self.stats.sifts += 1
+        super()._swap(i, j)
+
+
+class CountingDijkstraQuery(DijkstraQuery):
+    """
+    A DijkstraQuery counting relaxations, starved vertices and parent steps
+    into a QueryStats.
+    """
+
+    def __init__(self, s, extra_food, ids, scratch, stats: QueryStats) -> None:
+        super().__init__(s, extra_food, ids, scratch)
+        self.stats = stats
+
+    def relax(self, u, v) -> None:
+        self.stats.relaxations += 1
+        super().relax(u, v)
+
+    def _parent(self, v):
+        self.stats.parent_steps += 1
+        return super()._parent(v)
+
+    def will_survive(self, v, k: int) -> bool:
+        survived = super().will_survive(v, k)
+        if not survived:
+            self.stats.starved += 1
+        return survived
+
+
+class Instrumentation:
+    """
+    Collects the QueryStats of a maze's queries.
+
+    Functions:
+        * record(self, stats) - a query finished.
+        * last(self) - the QueryStats of this thread's last query.
+        * totals(self) - the number of queries, their time and counters.
+            "counted" is how many of the queries the counters come from.
+    """
+
+    def __init__(self, callback: Union[Callable[[QueryStats], None], None] = None) -> None:
+        """
+        :param callback - Called with the QueryStats of every query, in the
+        thread that ran it.
+        """
+
+        self.callback = callback
+        self._last = threading.local()
+        self._lock = threading.Lock()
+        self._totals = dict.fromkeys(("queries", "seconds", "counted") + QueryStats.COUNTERS, 0)
+
+    def record(self, stats: QueryStats) -> None:
+        self._last.stats = stats
+        with self._lock:
+            totals = self._totals
+            totals["queries"] += 1
+            totals["seconds"] += stats.seconds
+            if stats.pushes is not None:
+                totals["counted"] += 1
+                for name in QueryStats.COUNTERS:
+                    totals[name] += getattr(stats, name)
+        if self.callback is not None:
+            self.callback(stats)
+
+    def last(self) -> Union[QueryStats, None]:
+        return getattr(self._last, "stats", None)
+
+    def totals(self) -> Dict:
+        with self._lock:
+            return dict(self._totals)
@@ -0,0 +1,192 @@
+"""
+Landmarks
+=========
+
+Goal-directed search with A*, landmarks and the triangle inequality (ALT).
+
+A few landmark locations are picked far apart from each other, and the hop
+distance from each of them to every location is stored. For any location v
+and destination t, |d(L, t) - d(L, v)| is at most the distance from v to t,
+so the largest of those over the landmarks is a lower bound that steers an
+A* search towards t without ever making it miss a shorter route.
+
+The search runs over the same (location, steps since food) states as
+search.fuel_search, so the food rules are the same, only the order the
+states are expanded in changes. When the walk it finds to the destination
+can't be made into a simple path the colony survives, it asks fuel_search,
+like the other engines, see search.simple_or_fuel.
+
+Blocking an edge only makes distances longer, so the tables stay valid
+lower bounds; they only have to be made again after an edge is fixed.
+"""
+
+from array import array
+from collections import deque
+from typing import Hashable, List, Union
+import heapq
+
+from search import simple_or_fuel
+
+
+class Landmarks:
+    """
+    Hop distance tables from a handful of landmarks.
+
+    Attributes:
+        * self.landmarks (List[Vertex]) - the landmarks, in the order picked.
+        * self.tables (List[array]) - for every landmark, the distance to
+            every vertex id, -1 when it can't be reached.
+
+    Functions:
+        * bound(self, t) - a function giving a lower bound on the distance
+            from any vertex to `t`.
+    """
+
+    DEFAULT_COUNT = 8
+
+    def __init__(self, maze, count: int = DEFAULT_COUNT) -> None:
+        """
+        Picks `count` landmarks, each as far as possible from the ones
+        before, and measures the maze from them.
+
+        :param maze - The QuokkaMaze to measure.
+        :param count - How many landmarks, at most one per vertex.
+        """
+
+        self._ids = maze._ids
+        self._size = len(maze.vertices)
+        self.landmarks = []
+        self.tables = []
+        if not maze.vertices:
+            return
+
+        # the first landmark is the vertex farthest from vertex 0, every next
+        # one the vertex farthest from all landmarks so far, and a vertex no
+        # landmark reaches is the farthest of all
+        nearest = self._distances(maze.vertices[0])
+        for _ in range(min(count, self._size)):
+            far = max(range(self._size), key=lambda i: nearest[i] if nearest[i] >= 0 else self._size)
+            landmark = maze.vertices[far]
+            table = self._distances(landmark)
+            self.landmarks.append(landmark)
+            self.tables.append(table)
+            for i, d in enumerate(table):
+                if d >= 0 and (nearest[i] < 0 or d < nearest[i]):
+                    nearest[i] = d
+            nearest[far] = 0
+
+    def _distances(self, start) -> array:
+        """
+        Breadth first search from `start`.
+        """
+
+        ids = self._ids
+        table = array("l", [-1]) * self._size
+        table[ids[start]] = 0
+        queue = deque([start])
+        while queue:
+            v = queue.popleft()
+            d = table[ids[v]] + 1
+            for u in v.edges:
+                i = ids[u]
+                if i < self._size and table[i] < 0:
+                    table[i] = d
+                    queue.append(u)
+        return table
+
+    def bound(self, t: Hashable):
+        """
+        :return h(v), a lower bound on the steps from v to `t`. Vertices
+        added after the tables were made get 0.
+        """
+
+        ids = self._ids
+        size = self._size
+        i = ids.get(t, size)
+        if i >= size:
+            return lambda v: 0
+        pairs = [(table, table[i]) for table in self.tables if table[i] >= 0]
+
+        def h(v) -> int:
+            j = ids.get(v, size)
+            if j >= size:
+                return 0
+            best = 0
+            for table, to_t in pairs:
+                d = table[j]
+                if d >= 0:
+                    gap = d - to_t if d > to_t else to_t - d
+                    if gap > best:
+                        best = gap
+            return best
+
+        return h
+
+
+def alt_search(
+        s: Hashable,
+        t: Hashable,
+        k: int,
+        landmarks: Landmarks
+) -> Union[List[Hashable], None]:
+    """
+    A* over (vertex, steps since food) states from `s` to `t`, without extra
+    food, guided by the landmarks.
+
+    The walk to the first state of `t` is cut down to a simple path, and if
+    that path starves the colony the route is looked for again with
+    fuel_search, see search.simple_or_fuel.
+
+    :param s - The start vertex for the quokka colony
+    :param t - The destination for the quokka colony
+    :param k - The maximum number of hops between locations with food
+    :param landmarks - The distance tables of the maze being searched.
+    :returns
+        * The list of vertices from `s` to `t` satisfying the conditions.
+        OR
+        * None if the search couldn't find one.
+    """
+
+    if s == t:
+        return [s]
+
+    h = landmarks.bound(t)
+    bounds = {}
+    start = (s, 0)
+    distance = {start: 0}
+    parent = {start: None}
+    counter = 0
+    # ties go to the state furthest from the start, it is the closest to t
+    PQ = [(h(s), 0, counter, start)]
+    done = set()
+    while PQ:
+        _, minus_g, _, state = heapq.heappop(PQ)
+        if state in done:
+            continue
+        done.add(state)
+
+        v, steps = state
+        if v == t:
+            walk = []
+            while state is not None:
+                walk.append(state[0])
+                state = parent[state]
+            return simple_or_fuel(walk[::-1], s, t, k)
+
+        g = -minus_g + 1
+        for u in v.edges:
+            if u.has_food and steps < k:
+                nxt = (u, 0)
+            elif not u.has_food and steps + 1 < k:
+                nxt = (u, steps + 1)
+            else:
+                continue
+            if g < distance.get(nxt, g + 1):
+                distance[nxt] = g
+                parent[nxt] = state
+                bound = bounds.get(u)
+                if bound is None:
+                    bound = bounds[u] = h(u)
+                counter += 1
+                heapq.heappush(PQ, (g + bound, -g, counter, nxt))
+    return None
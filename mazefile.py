@@ -0,0 +1,176 @@
+"""
+Maze Files
+==========
+
+A compact binary file format for quokka mazes, loaded by memory mapping.
+
+The file holds a MazeSnapshot's arrays as they are in memory:
+
+    * header - magic, format version, byte order, vertex count and
+      neighbour count (32 bytes).
+    * food bitmap - one bit per vertex, padded to a multiple of 8 bytes.
+    * offsets - vertex count + 1 signed 64-bit integers.
+    * neighbours - neighbour count signed 64-bit integers.
+
+Loading maps the file and views the arrays in place, so it takes the same
+time for any size of maze, and workers that load the same file share its
+pages. No `Vertex` is made until a query needs one, see MappedMaze.vertex.
+"""
+
+from typing import Union
+import mmap
+import struct
+import sys
+
+from vertex import Vertex
+from snapshot import MazeSnapshot
+
+
+MAGIC = b"QMAZ"
+FORMAT_VERSION = 2
+
+# magic, format version, byte order (0 little, 1 big), padding, vertices,
+# neighbours, padding so that the 64-bit arrays after it stay aligned
+_HEADER = struct.Struct("<4sHBxQQ8x")
+assert _HEADER.size % 8 == 0
+
+
+def _food_bytes(size: int) -> int:
+    return (size + 63) // 64 * 8
+
+
+def save(maze, path: str) -> None:
+    """
+    Writes `maze` to `path`.
+
+    :param maze - A QuokkaMaze, or a MazeSnapshot such as a MazeVersion.
+    :param path - The file to write.
+    """
+
+    snapshot = maze if isinstance(maze, MazeSnapshot) else maze.freeze()
+    size = len(snapshot)
+    offsets, neighbours, food = snapshot.csr()
+    food = bytes(food)
+    order = 0 if sys.byteorder == "little" else 1
+
+    with open(path, "wb") as f:
+        f.write(_HEADER.pack(MAGIC, FORMAT_VERSION, order, size, len(neighbours)))
+        f.write(food.ljust(_food_bytes(size), b"\0"))
+        f.write(memoryview(offsets).cast("B"))
+        f.write(memoryview(neighbours).cast("B"))
+
+
+class _LazyVertices:
+    """
+    The vertex list of a MappedMaze, making each Vertex the first time it
+    is asked for.
+    """
+
+    def __init__(self, maze: "MappedMaze") -> None:
+        self._maze = maze
+        self._made = {}
+
+    def __len__(self) -> int:
+        return len(self._maze)
+
+    def __getitem__(self, i: int) -> Vertex:
+        v = self._made.get(i)
+        if v is None:
+            if not 0 <= i < len(self._maze):
+                raise IndexError("vertex id out of range")
+            v = self._made[i] = Vertex(self._maze.has_food(i))
+            self._maze.ids[v] = i
+        return v
+
+
+class MappedMaze(MazeSnapshot):
+    """
+    A maze file mapped into memory, queried like a MazeSnapshot.
+
+    The `Vertex` objects are handles made on demand by `vertex(i)`: they
+    tell the queries which location is meant, and carry `has_food`, but
+    their `edges` stay empty. Paths come back as the same handles.
+
+    Functions:
+        * vertex(self, i) - the Vertex handle of vertex id `i`.
+        * close(self) - unmaps the file, the maze can't be queried after.
+        * the queries of MazeSnapshot.
+    """
+
+    def __init__(self, path: str) -> None:
+        """
+        Maps the maze file at `path`.
+
+        :raise ValueError if the file isn't a maze file this version and
+        byte order can read.
+        """
+
+        with open(path, "rb") as f:
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        size, count = self._check(self._map)
+
+        data = memoryview(self._map)
+        start = _HEADER.size
+        food_end = start + _food_bytes(size)
+        offsets_end = food_end + 8 * (size + 1)
+        self.food = data[start:food_end]
+        self.offsets = data[food_end:offsets_end].cast("q")
+        self.neighbours = data[offsets_end:].cast("q")
+        self._view = self.neighbours
+        self.ids = {}
+        self.vertices = _LazyVertices(self)
+
+    def _check(self, data: mmap.mmap):
+        """
+        Reads the header, closing the file if it can't be used.
+
+        :return the vertex and neighbour counts.
+        """
+
+        try:
+            if len(data) < _HEADER.size:
+                raise ValueError("not a maze file")
+            magic, version, order, size, count = _HEADER.unpack_from(data)
+            if magic != MAGIC or version != FORMAT_VERSION:
+                raise ValueError("not a maze file")
+            if order != (0 if sys.byteorder == "little" else 1):
+                raise ValueError("maze file has the wrong byte order")
+            expected = _HEADER.size + _food_bytes(size) + 8 * (size + 1 + count)
+            if len(data) != expected:
+                raise ValueError("maze file has the wrong size")
+        except ValueError:
+            data.close()
+            raise
+        return size, count
+
+    def vertex(self, i: int) -> Union[Vertex, None]:
+        """
+        :return the Vertex handle of vertex id `i`, or None if there is no
+        such vertex.
+        """
+        if not isinstance(i, int) or not 0 <= i < len(self):
+            return None
+        return self.vertices[i]
+
+    def close(self) -> None:
+        # the views have to go before the map can be closed
+        for view in (self.neighbours, self.offsets, self.food):
+            if view is not None:
+                view.release()
+        self._view = self.food = self.offsets = self.neighbours = None
+        self._map.close()
+
+    def __enter__(self) -> "MappedMaze":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+def load(path: str) -> MappedMaze:
+    """
+    Maps the maze file at `path`, see MappedMaze.
+    """
+
+    return MappedMaze(path)
@@ -0,0 +1,232 @@
+"""
+Connectivity Oracle
+===================
+
+Cheap, conservative answers to "can the quokkas possibly get from s to t?",
+so that hopeless queries are turned down before any search starts.
+
+Two union-finds back the answers:
+
+    * the connected components of the maze. If s and t are in different
+      ones, no amount of food helps.
+    * for every k asked about, the components of the locations with food,
+      where two of them are joined when one can reach the other within k
+      steps without eating on the way. Without extra food the quokkas go
+      from meal to meal, so the food near s and the food near t (found by a
+      search of at most k steps from each) must share a component.
+
+Fixing an edge only ever joins components, and is folded into the
+union-finds straight away. Blocking one may split them, which a union-find
+can't do, so the union-finds are thrown away and rebuilt on the next query.
+"""
+
+from collections import deque
+from typing import Dict, Hashable, Iterable, Tuple
+
+from vertex import Vertex
+
+
+class UnionFind:
+    """
+    Disjoint sets of hashable items, with path halving and union by size.
+    An item nobody has mentioned yet is a set of its own.
+
+    Functions:
+        * find(self, x) - the representative of the set of `x`.
+        * union(self, x, y) - joins the sets of `x` and `y`.
+    """
+
+    def __init__(self) -> None:
+        self._parent = {}
+        self._size = {}
+
+    def find(self, x: Hashable) -> Hashable:
+        parent = self._parent
+        while parent.get(x, x) != x:
+            parent[x] = parent.get(parent[x], parent[x])
+            x = parent[x]
+        return x
+
+    def union(self, x: Hashable, y: Hashable) -> None:
+        x = self.find(x)
+        y = self.find(y)
+        if x == y:
+            return
+        if self._size.get(x, 1) < self._size.get(y, 1):
+            x, y = y, x
+        self._parent[y] = x
+        self._size[x] = self._size.get(x, 1) + self._size.get(y, 1)
+
+
+def _food_within(start: Vertex, depth: int) -> Dict[Vertex, int]:
+    """
+    The locations with food reachable from `start` in at most `depth` steps
+    without eating on the way, with their number of steps. `start` itself
+    is included if it has food.
+    """
+
+    seen = {start: 0}
+    found = {}
+    queue = deque([start])
+    while queue:
+        v = queue.popleft()
+        hops = seen[v]
+        if v.has_food:
+            found[v] = hops
+            if v != start:
+                continue
+        if hops == depth:
+            continue
+        for u in v.edges:
+            if u not in seen:
+                seen[u] = hops + 1
+                queue.append(u)
+    return found
+
+
+class ConnectivityOracle:
+    """
+    Rules out queries that can't have an answer, see the module notes.
+
+    Attributes:
+        * self.rejected (int) - how many queries were ruled out so far.
+
+    Functions:
+        * rules_out(self, s, t, k, x) - true if there is certainly no path.
+        * edges_changed(self, pairs) - keep up with the maze. New vertices
+            need nothing, the union-finds treat unknown vertices as sets of
+            their own.
+    """
+
+    def __init__(self, maze) -> None:
+        """
+        :param maze - The QuokkaMaze to answer for, the union-finds are
+        built on the first query.
+        """
+
+        self._maze = maze
+        self._components = None
+        self._food = {}
+        self.rejected = 0
+
+    def _build_components(self) -> UnionFind:
+        components = UnionFind()
+        for v in self._maze.vertices:
+            for u in v.edges:
+                components.union(u, v)
+        return components
+
+    def _build_food(self, k: int) -> UnionFind:
+        food = UnionFind()
+        for f in self._maze.vertices:
+            if f.has_food:
+                for g in _food_within(f, k):
+                    food.union(f, g)
+        return food
+
+    def _link(self, food: UnionFind, k: int, u: Vertex, v: Vertex) -> None:
+        """
+        Joins the food that can now reach other food through the new edge
+        between `u` and `v`.
+        """
+
+        near_u = _food_within(u, 0 if u.has_food else k - 1)
+        near_v = _food_within(v, 0 if v.has_food else k - 1)
+        if not near_u or not near_v:
+            return
+
+        # f and g are joined when du + 1 + dv <= k, and then f is also
+        # within reach of the closest food on v's side and g of the closest
+        # on u's side, so joining everything to those two is the same
+        closest_u = min(near_u, key=near_u.get)
+        closest_v = min(near_v, key=near_v.get)
+        for f, du in near_u.items():
+            if du + 1 + near_v[closest_v] <= k:
+                food.union(f, closest_v)
+        for g, dv in near_v.items():
+            if dv + 1 + near_u[closest_u] <= k:
+                food.union(g, closest_u)
+
+    def edges_changed(self, pairs: Iterable[Tuple[Vertex, Vertex]]) -> None:
+        """
+        Folds fixed edges in, or drops the union-finds if any edge was
+        blocked.
+        """
+
+        pairs = list(pairs)
+        if any(not u.has_edge(v) for u, v in pairs):
+            self._components = None
+            self._food = {}
+            return
+        for u, v in pairs:
+            if self._components is not None:
+                self._components.union(u, v)
+            for k, food in self._food.items():
+                self._link(food, k, u, v)
+
+    def rules_out(self, s: Vertex, t: Vertex, k: int, x: int) -> bool:
+        """
+        Checks whether there is certainly no path from s to t for this k and
+        this much extra food. The inputs have already been checked.
+
+        :return true if there is no path, false if there may be one.
+        """
+
+        if s == t:
+            return False
+        if x == 0 and k == 0:
+            # the colony can't take a single step
+            self.rejected += 1
+            return True
+        if self._reject_components(s, t) or (x == 0 and self._reject_food(s, t, k)):
+            self.rejected += 1
+            return True
+        return False
+
+    def _reject_components(self, s: Vertex, t: Vertex) -> bool:
+        components = self._components
+        if components is None:
+            components = self._components = self._build_components()
+        return components.find(s) != components.find(t)
+
+    def _reject_food(self, s: Vertex, t: Vertex, k: int) -> bool:
+        # the start counts as a meal, the destination without food has to be
+        # reached a step before the colony runs out
+        from_s = _food_within_or_target(s, t, k)
+        if from_s is None:
+            return False
+        to_t = {t} if t.has_food else _food_within(t, k - 1)
+        if not from_s or not to_t:
+            return True
+
+        food = self._food.get(k)
+        if food is None:
+            food = self._food[k] = self._build_food(k)
+        roots = {food.find(f) for f in from_s}
+        return not any(food.find(g) in roots for g in to_t)
+
+
+def _food_within_or_target(s: Vertex, t: Vertex, k: int):
+    """
+    The food reachable from the start `s` within k steps without eating, as
+    _food_within, or None if `t` itself can be reached that way.
+    """
+
+    seen = {s: 0}
+    found = set()
+    queue = deque([s])
+    while queue:
+        v = queue.popleft()
+        hops = seen[v]
+        if v == t and (hops < k or t.has_food):
+            return None
+        if v.has_food and v != s:
+            found.add(v)
+            continue
+        if hops == k:
+            continue
+        for u in v.edges:
+            if u not in seen:
+                seen[u] = hops + 1
+                queue.append(u)
+    return found
@@ -0,0 +1,218 @@
+"""
+Food Overlay
+============
+
+For a fixed k, the only locations that matter as waypoints are the ones with
+food: a route is feasible exactly when every stretch between two meals is
+at most k steps long. The overlay keeps, for every location with food, the
+other locations with food it can reach within k steps without eating on the
+way. A search then hops from food to food over this much smaller graph, and
+the result is expanded back into a full path.
+
+The overlay is updated incrementally: when an edge is fixed or blocked, only
+the food locations within k steps of it are scanned again.
+"""
+
+from collections import deque
+from math import inf
+from typing import Dict, Iterable, List, Set, Tuple, Union
+import heapq
+
+from vertex import Vertex
+from search import simple_or_fuel
+
+
+class FoodOverlay:
+    """
+    Food-to-food reachability within k steps, for one k.
+
+    Attributes:
+        * self.k (int) - the maximum number of hops between meals.
+        * self.links (Dict[Vertex, Dict[Vertex, int]]) - for every location
+            with food, the other locations with food within k steps of it
+            without eating on the way, and how many steps away they are.
+
+    Functions:
+        * vertex_added(self, v) - a vertex was added to the maze.
+        * edge_changed(self, u, v) - the edge between u and v was fixed or
+            blocked.
+        * affected(self, pairs) / rescan(self, affected) - the two halves of
+            edge_changed, for a batch of edges.
+        * find_path(self, s, t) - a feasible simple path from s to t.
+    """
+
+    def __init__(self, maze, k: int) -> None:
+        """
+        Builds the overlay for all the food in `maze`.
+
+        :param maze - The QuokkaMaze to index.
+        :param k - The maximum number of hops between meals, k >= 1.
+        """
+
+        self.k = k
+        self.links = {}
+        for v in maze.vertices:
+            if v.has_food:
+                self.links[v] = {}
+        for f in self.links:
+            self.links[f] = self._scan(f)
+
+    def _reach(self, start: Vertex, depth: int) -> Dict[Vertex, int]:
+        """
+        Breadth first search from `start` that only walks through locations
+        without food, up to `depth` steps.
+
+        :return every location reached, with its number of steps.
+        """
+
+        seen = {start: 0}
+        queue = deque([start])
+        while queue:
+            v = queue.popleft()
+            hops = seen[v]
+            if hops == depth or (v.has_food and v != start):
+                continue
+            for u in v.edges:
+                if u not in seen:
+                    seen[u] = hops + 1
+                    queue.append(u)
+        return seen
+
+    def _scan(self, f: Vertex) -> Dict[Vertex, int]:
+        return {
+            g: hops for g, hops in self._reach(f, self.k).items()
+            if g.has_food and g != f
+        }
+
+    def vertex_added(self, v: Vertex) -> None:
+        if v.has_food:
+            self.links[v] = {}
+
+    def edge_changed(self, u: Vertex, v: Vertex) -> None:
+        """
+        Rescans the food locations whose k-step neighbourhood may have used,
+        or may now use, the edge between `u` and `v`.
+        """
+
+        self.rescan(self.affected([(u, v)]))
+
+    def affected(self, pairs: Iterable[Tuple[Vertex, Vertex]]) -> Set[Vertex]:
+        """
+        The food locations whose scan may walk one of the edges in `pairs`,
+        in the maze as it is now.
+
+        A batch of changes calls this before blocking edges, when the scans
+        that used them can still be found, and after fixing them.
+        """
+
+        # a scan only walks an edge from its start or from a location without
+        # food less than k steps away, so those are the ones to redo
+        found = set()
+        for pair in pairs:
+            for end in pair:
+                for g in self._reach(end, self.k - 1):
+                    if g.has_food:
+                        found.add(g)
+        return found
+
+    def rescan(self, affected: Set[Vertex]) -> None:
+        """
+        Scans the food locations in `affected` again, and updates the links
+        pointing back at them.
+        """
+
+        for f in affected:
+            for g in self.links[f]:
+                self.links[g].pop(f, None)
+        for f in affected:
+            self.links[f] = self._scan(f)
+            for g, hops in self.links[f].items():
+                self.links[g][f] = hops
+
+    def _segment(self, a: Vertex, b: Vertex, depth: int) -> List[Vertex]:
+        """
+        The locations strictly between `a` and `b` on a shortest stretch with
+        no food in between.
+        """
+
+        parent = {a: None}
+        queue = deque([(a, 0)])
+        while queue:
+            v, hops = queue.popleft()
+            if v == b:
+                break
+            if hops == depth or (v.has_food and v != a):
+                continue
+            for u in v.edges:
+                if u not in parent:
+                    parent[u] = v
+                    queue.append((u, hops + 1))
+
+        segment = []
+        v = parent[b]
+        while v != a:
+            segment.append(v)
+            v = parent[v]
+        return segment[::-1]
+
+    def find_path(self, s: Vertex, t: Vertex) -> Union[List[Vertex], None]:
+        """
+        find_path for this overlay's k, without extra food. The inputs have
+        already been checked.
+
+        The start and destination are attached to the overlay for this
+        query only: the start reaches food within k steps, and food reaches a
+        destination without food within k - 1 steps.
+        """
+
+        k = self.k
+        if s == t:
+            return [s]
+
+        start = {
+            g: hops for g, hops in self._reach(s, k).items()
+            if (g.has_food and g != s) or (g == t and hops < k)
+        }
+        end = {
+            g: hops for g, hops in self._reach(t, k if t.has_food else k - 1).items()
+            if g.has_food and g != t
+        }
+
+        # Dijkstra on steps, over the start, the food and the destination
+        distance = {s: 0}
+        previous = {s: None}
+        counter = 0
+        PQ = [(0, counter, s)]
+        done = set()
+        while PQ:
+            d, _, stop = heapq.heappop(PQ)
+            if stop in done:
+                continue
+            done.add(stop)
+            if stop == t:
+                break
+
+            links = start if stop == s else self.links.get(stop, {})
+            hops_to_t = end.get(stop)
+            nexts = list(links.items())
+            if hops_to_t is not None:
+                nexts.append((t, hops_to_t))
+            for g, hops in nexts:
+                if d + hops < distance.get(g, inf):
+                    distance[g] = d + hops
+                    previous[g] = (stop, hops)
+                    counter += 1
+                    heapq.heappush(PQ, (d + hops, counter, g))
+
+        if t not in done:
+            return None
+
+        # expand every hop of the overlay back into locations
+        walk = [t]
+        stop = t
+        while previous[stop] is not None:
+            before, hops = previous[stop]
+            walk.extend(reversed(self._segment(before, stop, hops)))
+            walk.append(before)
+            stop = before
+        return simple_or_fuel(walk[::-1], s, t, k)
@@ -0,0 +1,215 @@
+"""
+Parallel Queries
+================
+
+Runs batches of path queries on a pool of worker processes, to get past the
+GIL on big offline jobs.
+
+The maze is exported once into shared memory in the same CSR layout as a
+MazeSnapshot (integer ids, offsets and neighbours arrays, food bitmap).
+Every worker attaches to it when it starts, so tasks only carry vertex ids
+and the graph is never pickled per task. Paths come back as ids and are
+mapped to the caller's `Vertex` objects.
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing.shared_memory import SharedMemory
+from typing import List, Tuple, Union
+
+from vertex import Vertex
+from search import FeasibilityTree, count_placements, fuel_search
+
+
+# the maze as seen by a worker process, set up by _attach
+_worker = {}
+
+
+def _open(name: str) -> SharedMemory:
+    """
+    Attaches to an existing block. The parent owns it and unlinks it, the
+    workers share its resource tracker so attaching doesn't register it
+    a second time.
+    """
+
+    try:
+        return SharedMemory(name=name, track=False)
+    except TypeError:
+        # no `track` before Python 3.13
+        return SharedMemory(name=name)
+
+
+def _attach(names: Tuple[str, str, str], size: int, count: int) -> None:
+    """
+    Worker initializer: maps the shared maze into this process.
+
+    :param size - The number of vertices.
+    :param count - The number of neighbour entries.
+    """
+
+    blocks = [_open(name) for name in names]
+    offsets = blocks[0].buf.cast("q")[:size + 1]
+    neighbours = blocks[1].buf.cast("q")[:count]
+    food = blocks[2].buf
+
+    def neighbours_of(i: int):
+        return neighbours[offsets[i]:offsets[i + 1]]
+
+    def has_food(i: int) -> bool:
+        return bool(food[i >> 3] >> (i & 7) & 1)
+
+    _worker["blocks"] = blocks
+    _worker["neighbours_of"] = neighbours_of
+    _worker["has_food"] = has_food
+
+
+def _run(kind: str, s: int, k: int, x: int, targets: List[Tuple[int, int, int]]):
+    """
+    Worker task: answers every query of one (start, k, extra food) group.
+
+    :param targets - (index, t, x) for every query of the group.
+    :return (index, answer) for every query.
+    """
+
+    neighbours_of = _worker["neighbours_of"]
+    has_food = _worker["has_food"]
+
+    if len(targets) == 1:
+        i, t, own = targets[0]
+        path = fuel_search(s, t, k, x, neighbours_of, has_food)
+        answers = [(i, path)]
+    else:
+        tree = FeasibilityTree(s, k, x, neighbours_of, has_food)
+        answers = [(i, tree.path_to(t)) for i, t, _ in targets]
+
+    if kind == "exists":
+        budgets = {i: own for i, _, own in targets}
+        return [
+            (i, path is not None and count_placements(path, k, has_food) <= budgets[i])
+            for i, path in answers
+        ]
+    return answers
+
+
+class ParallelQueryExecutor:
+    """
+    A worker pool answering find_path / exists_path_with_extra_food batches
+    against a shared-memory copy of a maze.
+
+    The copy is taken when the executor is made and doesn't see later
+    changes to the maze. Close the executor (or use it as a context manager)
+    to stop the workers and free the shared memory.
+
+    Functions:
+        * find_paths(self, queries) - same as QuokkaMaze.find_paths.
+        * exists_paths_with_extra_food(self, queries) - same as
+            QuokkaMaze.exists_paths_with_extra_food.
+        * close(self) - stop the workers and release the shared memory.
+    """
+
+    def __init__(self, maze, processes: Union[int, None] = None) -> None:
+        """
+        Exports `maze` into shared memory and starts the workers.
+
+        :param maze - The QuokkaMaze to query.
+        :param processes - How many workers, defaults to the number of CPUs.
+        """
+
+        snapshot = maze.freeze()
+        self._maze = maze
+        self._vertices = snapshot.vertices
+        self._ids = snapshot.ids
+
+        self._blocks = []
+        for data in (snapshot.offsets, snapshot.neighbours, snapshot.food):
+            raw = memoryview(data).cast("B")
+            # whole 64-bit words, and never empty, even without edges
+            shm = SharedMemory(create=True, size=max((len(raw) + 7) // 8 * 8, 8))
+            shm.buf[:len(raw)] = raw
+            self._blocks.append(shm)
+
+        self._pool = ProcessPoolExecutor(
+            max_workers=processes,
+            initializer=_attach,
+            initargs=(tuple(shm.name for shm in self._blocks), len(snapshot),
+                      len(snapshot.neighbours))
+        )
+
+    def __enter__(self) -> "ParallelQueryExecutor":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def close(self) -> None:
+        if self._pool is None:
+            return
+        self._pool.shutdown()
+        self._pool = None
+        for shm in self._blocks:
+            shm.close()
+            shm.unlink()
+        self._blocks = []
+
+    def _submit(self, kind: str, queries, arity: Tuple[int, ...]):
+        """
+        Groups the valid queries by (start, k, extra food), one task each.
+
+        :return the number of queries and the answers of the valid ones, as
+        (index, answer) tuples.
+        """
+
+        size, groups = self._maze._batch(queries, arity)
+        ids = self._ids
+        futures = []
+        for (s, k), group in groups.items():
+            # vertices added to the maze after it was exported are unknown
+            group = [entry for entry in group if entry[1] in ids]
+            if s not in ids or not group:
+                continue
+            if kind == "exists":
+                # one tree per start and k, big enough for the largest x
+                parts = {max(x for _, _, x in group): group}
+            else:
+                parts = {}
+                for entry in group:
+                    parts.setdefault(entry[2], []).append(entry)
+            for x, part in parts.items():
+                targets = [(i, ids[t], own) for i, t, own in part]
+                futures.append(self._pool.submit(_run, kind, ids[s], k, x, targets))
+
+        answers = []
+        for future in futures:
+            answers.extend(future.result())
+        return size, answers
+
+    def find_paths(self, queries) -> List[Union[List[Vertex], None]]:
+        """
+        Answers many find_path queries on the worker processes.
+
+        :param queries - (s, t, k) or (s, t, k, extra_food) tuples.
+        :return the answer of every query, in the same order. Invalid
+        queries get None.
+        """
+
+        size, answers = self._submit("find", queries, (3, 4))
+        results = [None] * size
+        for i, path in answers:
+            if path is not None:
+                results[i] = [self._vertices[v] for v in path]
+        return results
+
+    def exists_paths_with_extra_food(self, queries) -> List[bool]:
+        """
+        Answers many exists_path_with_extra_food queries on the worker
+        processes.
+
+        :param queries - (s, t, k, x) tuples.
+        :return the answer of every query, in the same order. Invalid
+        queries get False.
+        """
+
+        size, answers = self._submit("exists", queries, (4,))
+        results = [False] * size
+        for i, answer in answers:
+            results[i] = answer
+        return results
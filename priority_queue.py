@@ -0,0 +1,159 @@
+"""
+Priority Queue
+==============
+
+An addressable binary min-heap, used by the path finding in the quokka maze.
+
+Unlike a plain `heapq` list, this queue remembers where every item lives in
+the heap, so the key of an item already in the queue can be changed in
+O(log n) without scanning the whole heap to find it first.
+"""
+
+from typing import Any, Hashable, Tuple
+
+
+class IndexedPriorityQueue:
+    """
+    A min-heap of unique, hashable items, each with a comparable key.
+
+    Attributes:
+        * self._heap (List[Tuple[key, item]]) - the binary heap itself.
+        * self._positions (Dict[item, int]) - index of every item in the heap.
+
+    Functions:
+        * push(self, item, key) - adds 'item' to the queue with 'key'.
+        * pop(self) - removes and returns the (key, item) with the smallest key.
+        * peek(self) - returns the (key, item) with the smallest key.
+        * update(self, item, key) - changes the key of an item in the queue.
+        * discard(self, item) - removes 'item' from the queue if it is there.
+        * key_of(self, item) - returns the current key of 'item'.
+    """
+
+    def __init__(self) -> None:
+        """
+        Initialises an empty queue.
+        """
+
+        self._heap = []
+        self._positions = {}
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+    def __contains__(self, item: Hashable) -> bool:
+        return item in self._positions
+
+    def push(self, item: Hashable, key: Any) -> None:
+        """
+        Adds 'item' to the queue.
+
+        :param item - The item to add, it must not be in the queue already.
+        :param key - The priority of the item, smaller keys are popped first.
+        """
+
+        if item in self._positions:
+            raise KeyError("item is already in the queue")
+        self._heap.append((key, item))
+        self._positions[item] = len(self._heap) - 1
+        self._sift_up(len(self._heap) - 1)
+
+    def pop(self) -> Tuple[Any, Hashable]:
+        """
+        Removes the item with the smallest key from the queue.
+
+        :return a (key, item) tuple.
+        """
+
+        if not self._heap:
+            raise IndexError("pop from an empty queue")
+        top = self._heap[0]
+        last = self._heap.pop()
+        del self._positions[top[1]]
+        if self._heap:
+            self._heap[0] = last
+            self._positions[last[1]] = 0
+            self._sift_down(0)
+        return top
+
+    def peek(self) -> Tuple[Any, Hashable]:
+        """
+        Returns the (key, item) tuple with the smallest key without removing it.
+        """
+
+        if not self._heap:
+            raise IndexError("peek into an empty queue")
+        return self._heap[0]
+
+    def key_of(self, item: Hashable) -> Any:
+        """
+        Returns the key 'item' currently has in the queue.
+        """
+
+        return self._heap[self._positions[item]][0]
+
+    def update(self, item: Hashable, key: Any) -> None:
+        """
+        Changes the key of an item that is already in the queue.
+
+        :param item - The item to change.
+        :param key - The new key, it may be smaller or larger than the old one.
+        """
+
+        idx = self._positions[item]
+        old_key = self._heap[idx][0]
+        self._heap[idx] = (key, item)
+        if key < old_key:
+            self._sift_up(idx)
+        else:
+            self._sift_down(idx)
+
+    def discard(self, item: Hashable) -> None:
+        """
+        Removes 'item' from the queue, wherever it is in the heap. Does
+        nothing if it isn't in the queue.
+        """
+
+        idx = self._positions.pop(item, None)
+        if idx is None:
+            return
+        last = self._heap.pop()
+        if idx < len(self._heap):
+            old_key = self._heap[idx][0]
+            self._heap[idx] = last
+            self._positions[last[1]] = idx
+            if last[0] < old_key:
+                self._sift_up(idx)
+            else:
+                self._sift_down(idx)
+
+    def _swap(self, i: int, j: int) -> None:
+        heap = self._heap
+        heap[i], heap[j] = heap[j], heap[i]
+        self._positions[heap[i][1]] = i
+        self._positions[heap[j][1]] = j
+
+    def _sift_up(self, idx: int) -> None:
+        heap = self._heap
+        while idx > 0:
+            parent = (idx - 1) >> 1
+            if heap[idx][0] < heap[parent][0]:
+                self._swap(idx, parent)
+                idx = parent
+            else:
+                break
+
+    def _sift_down(self, idx: int) -> None:
+        heap = self._heap
+        size = len(heap)
+        while True:
+            smallest = idx
+            left = 2 * idx + 1
+            right = left + 1
+            if left < size and heap[left][0] < heap[smallest][0]:
+                smallest = left
+            if right < size and heap[right][0] < heap[smallest][0]:
+                smallest = right
+            if smallest == idx:
+                break
+            self._swap(idx, smallest)
+            idx = smallest
@@ -0,0 +1,210 @@
+"""
+Route Plans
+===========
+
+A route between two locations that repairs itself when edges change, in the
+manner of Lifelong Planning A* (LPA*).
+
+The plan searches the same (location, steps since food) states as
+search.fuel_search, without extra food. For every state it keeps `g`, the
+steps it took to reach it in the last search, and `rhs`, the steps it
+would take now going by its predecessors. A state whose two values differ
+is inconsistent and waits in a queue. When an edge is fixed or blocked only
+the states of its two ends are checked again, and the search carries on
+from the ones that became inconsistent, so the part of the old search that
+the change doesn't touch is reused as it is.
+
+The heuristic is zero, every step costs one.
+"""
+
+from math import inf
+from typing import Hashable, Iterable, List, Tuple, Union
+
+from priority_queue import IndexedPriorityQueue
+from search import simple_or_fuel
+
+
+# the state every state of the destination leads to, for free
+GOAL = "<goal>"
+
+
+class RoutePlan:
+    """
+    A repairable find_path(s, t, k) query, without extra food.
+
+    The maze tells the plan about every edge it fixes or blocks, the plan
+    only repairs itself the next time `path()` is asked for, so a burst of
+    closures costs a single repair. A plan belongs to the thread using it.
+
+    Attributes:
+        * self.s, self.t - the start and destination.
+        * self.k (int) - the maximum number of hops between meals.
+        * self.expanded (int) - states expanded by all searches so far, the
+            first search included.
+
+    Functions:
+        * path(self) - the current route, repaired if edges changed.
+        * edges_changed(self, pairs) - the edges between these pairs of
+            locations were fixed or blocked.
+        * close(self) - stop following the maze.
+    """
+
+    def __init__(self, maze, s: Hashable, t: Hashable, k: int) -> None:
+        """
+        Sets up the plan, the first search runs on the first `path()`.
+
+        :param maze - The QuokkaMaze the plan follows.
+        """
+
+        self._maze = maze
+        self.s = s
+        self.t = t
+        self.k = k
+        self.expanded = 0
+
+        self._g = {}
+        self._rhs = {}
+        self._queue = IndexedPriorityQueue()
+        # ends of the edges changed since the last repair, a set so that a
+        # plan nobody asks stays as big as the maze at most
+        self._changed = set()
+        self._path = None
+        self._stale = True
+
+        start = (s, 0)
+        self._rhs[start] = 0
+        self._queue.push(start, 0)
+
+    def _states(self, v: Hashable) -> Iterable[Tuple[Hashable, int]]:
+        """
+        Every state `v` can be in.
+        """
+
+        if v.has_food:
+            return [(v, 0)]
+        return [(v, steps) for steps in range(self.k)]
+
+    def _successors(self, state) -> List:
+        if state == GOAL:
+            return []
+        v, steps = state
+        after = []
+        if v == self.t:
+            after.append(GOAL)
+        for u in v.edges:
+            if u.has_food:
+                after.append((u, 0))
+            elif steps + 1 < self.k:
+                after.append((u, steps + 1))
+        return after
+
+    def _predecessors(self, state) -> List:
+        if state == GOAL:
+            return self._states(self.t)
+        u, steps = state
+        if u.has_food:
+            # food is reached from any state with a step left
+            return [(v, before) for v in u.edges for before in range(self.k)]
+        if steps == 0:
+            return []
+        return [(v, steps - 1) for v in u.edges]
+
+    def _key(self, state) -> int:
+        return min(self._g.get(state, inf), self._rhs.get(state, inf))
+
+    def _update(self, state) -> None:
+        """
+        Works out `rhs` of `state` again, and queues it if it is
+        inconsistent.
+        """
+
+        if state != (self.s, 0):
+            g = self._g
+            self._rhs[state] = min(
+                (g.get(p, inf) + (0 if state == GOAL else 1) for p in self._predecessors(state)),
+                default=inf
+            )
+        self._queue.discard(state)
+        if self._g.get(state, inf) != self._rhs.get(state, inf):
+            self._queue.push(state, self._key(state))
+
+    def _search(self) -> None:
+        """
+        Expands inconsistent states until the destination is settled. States
+        as far away as the destination are expanded too, so that every state
+        on the way back to the start is consistent.
+        """
+
+        queue = self._queue
+        g = self._g
+        rhs = self._rhs
+        while queue and (queue.peek()[0] <= self._key(GOAL) or
+                         g.get(GOAL, inf) != rhs.get(GOAL, inf)):
+            state = queue.pop()[1]
+            self.expanded += 1
+            if g.get(state, inf) > rhs.get(state, inf):
+                g[state] = rhs[state]
+                for after in self._successors(state):
+                    self._update(after)
+            else:
+                g[state] = inf
+                self._update(state)
+                for after in self._successors(state):
+                    self._update(after)
+
+    def _walk(self) -> Union[List[Hashable], None]:
+        """
+        Follows the cheapest predecessors back from the destination.
+        """
+
+        g = self._g
+        cost = g.get(GOAL, inf)
+        if cost == inf:
+            return None
+
+        walk = []
+        state = min(self._predecessors(GOAL), key=lambda p: g.get(p, inf))
+        while state != (self.s, 0):
+            walk.append(state[0])
+            cost = g[state]
+            state = next(p for p in self._predecessors(state) if g.get(p, inf) == cost - 1)
+        walk.append(self.s)
+        return walk[::-1]
+
+    def edges_changed(self, pairs) -> None:
+        for u, v in pairs:
+            self._changed.add(u)
+            self._changed.add(v)
+        self._stale = True
+
+    def path(self) -> Union[List[Hashable], None]:
+        """
+        :return a simple path from s to t the quokkas survive in the maze as
+        it is now, or None if there isn't one.
+        """
+
+        if self.s == self.t:
+            return [self.s]
+        if self.k == 0:
+            return None
+        if not self._stale:
+            return None if self._path is None else list(self._path)
+
+        changed, self._changed = self._changed, set()
+        for v in changed:
+            for state in self._states(v):
+                self._update(state)
+        if changed:
+            self._update(GOAL)
+        self._search()
+        self._stale = False
+
+        walk = self._walk()
+        path = None
+        if walk is not None:
+            path = simple_or_fuel(walk, self.s, self.t, self.k)
+        self._path = path
+        return None if path is None else list(path)
+
+    def close(self) -> None:
+        self._maze._plans.discard(self)
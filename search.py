@@ -0,0 +1,1007 @@
+"""
+Search
+======
+
+Path finding over (location, steps since the last meal) states.
+
+The colony's situation at any point of a route is fully described by where it
+is and how many steps ago it last ate, so instead of searching the maze
+itself we search the graph of those states. Every state is visited at most
+once, which bounds a query by O((V + E) * k) no matter where the food is.
+
+`DijkstraQuery` holds the working state of the older, modified Dijkstra
+search of `QuokkaMaze.find_path`.
+
+The search works on any graph: `neighbours(v)` and `has_food(v)` describe
+it, and default to reading the `edges` and `has_food` of `Vertex` objects.
+"""
+
+from collections import deque
+from math import inf
+import heapq
+from typing import Callable, Dict, Hashable, Iterable, Iterator, List, Tuple, Union
+
+
+def vertex_neighbours(v) -> Iterable:
+    """Neighbours of a `Vertex`, the default adjacency for the searches."""
+    return v.edges
+
+
+def vertex_has_food(v) -> bool:
+    """Food flag of a `Vertex`, the default food lookup for the searches."""
+    return v.has_food
+
+
+def food_placements(
+        path: List[Hashable],
+        k: int,
+        has_food: Callable = vertex_has_food,
+        steps: int = 0
+) -> Union[List[Hashable], None]:
+    """
+    Works out where the colony needs extra food to follow `path`.
+
+    Food is placed as late as possible: only on a location without food that
+    is reached exactly `k` steps after the last meal. Doing it any earlier
+    never saves a placement further down the path, so this is the fewest
+    placements the path can do with.
+
+    :param path - The route, starting at the colony's current home.
+    :param k - The maximum number of hops between locations with food.
+    :param has_food - Food lookup for the vertices in `path`.
+    :param steps - How many steps ago the colony last ate when it sets off,
+        0 unless the path continues another one.
+    :return the locations to put food on, in path order, or None if no amount
+        of food helps (only when k == 0 and the path has more than one
+        location).
+    """
+
+    if k == 0 and len(path) > 1:
+        return None
+
+    placed = []
+    for v in path[1:]:
+        steps += 1
+        if has_food(v):
+            steps = 0
+        elif steps == k:
+            placed.append(v)
+            steps = 0
+    return placed
+
+
+def count_placements(
+        path: List[Hashable],
+        k: int,
+        has_food: Callable = vertex_has_food,
+        steps: int = 0
+) -> Union[int, None]:
+    """
+    Counts the extra food the colony needs to follow `path`, see
+    food_placements.
+
+    :return the number of placements, or None if no amount of food helps.
+    """
+
+    placed = food_placements(path, k, has_food, steps)
+    if placed is None:
+        return None
+    return len(placed)
+
+
+def required_k(
+        path: List[Hashable],
+        has_food: Callable = vertex_has_food
+) -> int:
+    """
+    The smallest k for which the colony can follow `path` without extra food.
+
+    That is the longest stretch between two meals, where the start counts as
+    a meal, and a destination without food has to be reached before the
+    colony runs out, one step earlier than a location with food.
+
+    :param path - The route, starting at the colony's current home.
+    :param has_food - Food lookup for the vertices in `path`.
+    :return the smallest feasible k, 0 for a path of a single location.
+    """
+
+    worst = 0
+    steps = 0
+    for v in path[1:]:
+        steps += 1
+        if has_food(v):
+            worst = max(worst, steps)
+            steps = 0
+    if steps > 0:
+        worst = max(worst, steps + 1)
+    return worst
+
+
+def shortcut(walk: List[Hashable]) -> List[Hashable]:
+    """
+    Turns a walk into a simple path by cutting out every loop.
+
+    When a location shows up again, everything since its first visit is
+    dropped, so the result only contains locations of the walk, in order.
+
+    :param walk - The walk to shorten.
+    :return a simple path with the same ends as `walk`.
+    """
+
+    path = []
+    seen = {}
+    for v in walk:
+        if v in seen:
+            idx = seen[v]
+            for dropped in path[idx + 1:]:
+                del seen[dropped]
+            del path[idx + 1:]
+        else:
+            seen[v] = len(path)
+            path.append(v)
+    return path
+
+
+def plan_extra_food(
+        s: Hashable,
+        t: Hashable,
+        k: int,
+        neighbours: Callable = vertex_neighbours,
+        has_food: Callable = vertex_has_food
+) -> Union[Tuple[int, List[Hashable], List[Hashable]], None]:
+    """
+    Finds as few extra food placements as it can that get the colony from `s`
+    to `t`, in a single fuel search with no limit on the food.
+
+    The search settles the states of `t` by the food their walks need, so the
+    first one gives a lower bound for the simple paths. Every state of `t` is
+    tried, the best simple path wins, and the search stops early once a path
+    meets the bound. A simple path the search can't put together from its
+    walks may be missed, so the count is an upper bound on the fewest
+    placements, exact whenever a path meets the bound.
+
+    :returns
+        * A (count, placements, path) tuple: how much food is needed, where to
+        put it, and the simple path it makes feasible.
+        OR
+        * None if no amount of food gets the colony there.
+    """
+
+    parent = {}
+    others = {}
+    best = None
+    bound = None
+    for v, steps, level in settle_states(s, k, inf, parent, neighbours, has_food, t, 0, others):
+        if best is not None and best[0] <= bound:
+            break
+        if v == t:
+            if bound is None:
+                bound = level
+            # a simple walk to this state first, else its walk with the loops cut
+            found = state_path(parent, others, (v, steps), k, level, has_food)
+            if found is None:
+                path = shortcut(state_walk(parent, (v, steps)))
+                found = path, count_placements(path, k, has_food)
+            if found[1] is not None and (best is None or found[1] < best[0]):
+                best = found[1], found[0]
+    if best is None:
+        return None
+    path = best[1]
+    return best[0], food_placements(path, k, has_food), path
+
+
+def settle_states(
+        s: Hashable,
+        k: int,
+        extra_food: Union[int, float],
+        parent: Dict,
+        neighbours: Callable = vertex_neighbours,
+        has_food: Callable = vertex_has_food,
+        goal: Union[Hashable, None] = None,
+        steps: int = 0,
+        others: Union[Dict, None] = None
+) -> Iterator[Tuple[Hashable, int, int]]:
+    """
+    Breadth first search over (vertex, steps since food) states from `s`,
+    layered by the number of placements used: all states reachable with no
+    extra food are settled first, then those needing one placement, and so
+    on. Every state is settled at most once.
+
+    :param s - Where the colony starts
+    :param k - The maximum number of hops between locations with food
+    :param extra_food - How many locations we may place food on, inf for no
+        limit
+    :param parent - Filled in with the state every settled state was reached
+        from, see state_walk
+    :param neighbours - Adjacency of the graph being searched
+    :param has_food - Food lookup of the graph being searched
+    :param goal - States of this vertex are settled but not expanded
+    :param steps - How many steps ago the colony last ate at `s`
+    :param others - If given, filled in with the other states a state was
+        reached from with as little food before it was settled, see
+        state_path
+    :return yields (vertex, steps since food, placements) for every state, in
+        the order they are settled.
+    """
+
+    start = (s, steps)
+    used = {start: 0}    # placements needed to reach every state
+    parent[start] = None
+
+    settled = set()
+    level = 0
+    current = deque([start])
+    later = deque()
+    while True:
+        if not current:
+            level += 1
+            if not later or level > extra_food:
+                return
+            current, later = later, deque()
+
+        state = current.popleft()
+        if used[state] != level:
+            # it was reached with less food after being queued
+            continue
+
+        settled.add(state)
+        v, steps = state
+        yield v, steps, level
+        if v == goal:
+            continue
+
+        for u in neighbours(v):
+            if has_food(u):
+                nxt = (u, 0)
+                cost = level
+            elif steps + 1 < k:
+                nxt = (u, steps + 1)
+                cost = level
+            elif steps + 1 == k:
+                # we have to put food on `u`, the colony starves otherwise
+                nxt = (u, 0)
+                cost = level + 1
+            else:
+                continue
+
+            known = used.get(nxt, cost + 1)
+            if cost < known:
+                used[nxt] = cost
+                parent[nxt] = state
+                if others is not None:
+                    others.pop(nxt, None)
+                if cost == level:
+                    current.append(nxt)
+                else:
+                    later.append(nxt)
+            elif others is not None and cost == known and nxt not in settled:
+                others.setdefault(nxt, []).append(state)
+
+
+def state_walk(parent: Dict, state: Tuple[Hashable, int]) -> List[Hashable]:
+    """
+    The walk the search took to reach `state`, from the start.
+    """
+
+    walk = []
+    while state is not None:
+        walk.append(state[0])
+        state = parent[state]
+    return walk[::-1]
+
+
+def state_path(
+        parent: Dict,
+        others: Dict,
+        state: Tuple[Hashable, int],
+        k: int,
+        extra_food: Union[int, float] = 0,
+        has_food: Callable = vertex_has_food,
+        steps: int = 0
+) -> Union[Tuple[List[Hashable], int], None]:
+    """
+    Puts together a simple path to `state` that needs at most `extra_food`
+    placements.
+
+    The walk of the parents is tried first, with its loops cut out. If that
+    starves the colony, the walks through the other parents in `others` are
+    searched, depth first, for one that never visits a location twice. That
+    search gives up after as many steps as there are states in `parent`.
+
+    :param steps - How many steps ago the colony last ate at the start
+    :return a (path, placements) tuple, or None if no path was found.
+    """
+
+    path = shortcut(state_walk(parent, state))
+    placed = count_placements(path, k, has_food, steps)
+    if placed is not None and placed <= extra_food:
+        return path, placed
+    if not others:
+        return None
+
+    budget = len(parent)
+    stack = [(state, 0)]
+    visited = {state[0]}
+    while stack and budget > 0:
+        current, i = stack[-1]
+        before = parent[current]
+        if before is None:
+            path = [v for (v, _), _ in reversed(stack)]
+            placed = count_placements(path, k, has_food, steps)
+            if placed is not None and placed <= extra_food:
+                return path, placed
+            options = ()
+        else:
+            options = [before] + others.get(current, [])
+        if i == len(options):
+            stack.pop()
+            visited.discard(current[0])
+            continue
+        stack[-1] = (current, i + 1)
+        budget -= 1
+        nxt = options[i]
+        if nxt[0] not in visited:
+            visited.add(nxt[0])
+            stack.append((nxt, 0))
+    return None
+
+
+def fuel_search(
+        s: Hashable,
+        t: Hashable,
+        k: int,
+        extra_food: Union[int, float] = 0,
+        neighbours: Callable = vertex_neighbours,
+        has_food: Callable = vertex_has_food,
+        steps: int = 0
+) -> Union[List[Hashable], None]:
+    """
+    Finds a simple path from `s` to `t` where the colony never goes more than
+    `k` steps without food, placing food on at most `extra_food` locations.
+
+    The states come from settle_states, so the first time `t` is settled its
+    walk uses the fewest placements any walk can, and without extra food it
+    is also a shortest one.
+
+    The states describe walks, which may go back to a location once the
+    colony has eaten. Loops are cut out of the walk afterwards, and the
+    result is only returned if the simple path is still feasible. Otherwise
+    the other walks to the same state are tried, see state_path, and then
+    the next way of reaching `t`.
+
+    :param s - The start vertex for the quokka colony
+    :param t - The destination for the quokka colony
+    :param k - The maximum number of hops between locations with food
+    :param extra_food - How many locations we may place food on, inf for no
+        limit
+    :param neighbours - Adjacency of the graph being searched
+    :param has_food - Food lookup of the graph being searched
+    :param steps - How many steps ago the colony last ate at `s`, for a
+        search that continues another route
+    :returns
+        * The list of vertices from `s` to `t` satisfying the conditions.
+        OR
+        * None if the search couldn't find one.
+    """
+
+    parent = {}
+    others = {}
+    start = steps
+    for v, steps, _ in settle_states(s, k, extra_food, parent, neighbours, has_food, t, start, others):
+        if v == t:
+            found = state_path(parent, others, (v, steps), k, extra_food, has_food, start)
+            if found is not None:
+                return found[0]
+    return None
+
+
+def simple_or_fuel(
+        walk: List[Hashable],
+        s: Hashable,
+        t: Hashable,
+        k: int,
+        neighbours: Callable = vertex_neighbours,
+        has_food: Callable = vertex_has_food
+) -> Union[List[Hashable], None]:
+    """
+    Turns the walk an engine found from `s` to `t`, without extra food, into
+    its answer: the walk with its loops cut out, if the colony still
+    survives that, or else whatever fuel_search finds.
+
+    :param walk - A walk from `s` to `t` the colony survives.
+    :return a simple path feasible for `k`, or None.
+    """
+
+    path = shortcut(walk)
+    if required_k(path, has_food) <= k:
+        return path
+    # cutting the loops out starved the colony somewhere
+    return fuel_search(s, t, k, 0, neighbours, has_food)
+
+def bidirectional_search(
+        s: Hashable,
+        t: Hashable,
+        k: int,
+        neighbours: Callable = vertex_neighbours,
+        has_food: Callable = vertex_has_food
+) -> Union[List[Hashable], None]:
+    """
+    Finds a shortest route from `s` to `t` without extra food by growing two
+    breadth first searches, one from each end, and joining them.
+
+    The forward search runs over (vertex, steps since food) states like
+    fuel_search. The maze is undirected, so the backward search is the same
+    search run from `t`, over (vertex, steps to the next meal) states: `t`
+    with food is a meal itself, without food it has to be reached a step
+    before the colony runs out, so it starts one step short. A forward state
+    (v, a) and a backward state (v, r) join into a route when a + r <= k.
+
+    The smaller frontier grows a whole level at a time, and the search stops
+    once no route through the unexplored levels can be shorter than the
+    best one joined so far. Each search only goes about half the way, which
+    on long routes explores far fewer states than a search from one end.
+
+    The joined walk is cut down to a simple path, and if that starves the
+    colony the route is looked for again with fuel_search.
+
+    :param s - The start vertex for the quokka colony
+    :param t - The destination for the quokka colony
+    :param k - The maximum number of hops between locations with food
+    :param neighbours - Adjacency of the graph being searched
+    :param has_food - Food lookup of the graph being searched
+    :returns
+        * The list of vertices from `s` to `t` satisfying the conditions.
+        OR
+        * None if there isn't one.
+    """
+
+    if s == t:
+        return [s]
+    if k == 0:
+        return None
+
+    def forward(state):
+        v, steps = state
+        for u in neighbours(v):
+            if has_food(u):
+                yield u, 0
+            elif steps + 1 < k:
+                yield u, steps + 1
+
+    def backward(state):
+        v, steps = state
+        if steps == k:
+            return
+        for u in neighbours(v):
+            if has_food(u):
+                yield u, 0
+            elif steps + 1 < k or u == s:
+                # only the start may be a whole k steps from the next meal,
+                # it counts as one
+                yield u, steps + 1
+
+    start = (s, 0)
+    goal = (t, 0 if has_food(t) else 1)
+    # per side: the moves, the parent of every state, its distance from that
+    # side's end, the states found at every vertex and the current frontier
+    sides = [
+        [forward, {start: None}, {start: 0}, {s: [start]}, [start]],
+        [backward, {goal: None}, {goal: 0}, {t: [goal]}, [goal]],
+    ]
+    depth = [0, 0]
+    best = inf
+    meeting = None
+    while sides[0][4] and sides[1][4] and best > depth[0] + depth[1] + 1:
+        side = 0 if len(sides[0][4]) <= len(sides[1][4]) else 1
+        moves, parent, distance, found, frontier = sides[side]
+        other_distance, other_found = sides[1 - side][2], sides[1 - side][3]
+        depth[side] += 1
+        level = []
+        for state in frontier:
+            for nxt in moves(state):
+                if nxt in distance:
+                    continue
+                parent[nxt] = state
+                distance[nxt] = depth[side]
+                level.append(nxt)
+                u, steps = nxt
+                found.setdefault(u, []).append(nxt)
+                for other in other_found.get(u, ()):
+                    length = depth[side] + other_distance[other]
+                    if steps + other[1] <= k and length < best:
+                        best = length
+                        meeting = (nxt, other) if side == 0 else (other, nxt)
+        sides[side][4] = level
+
+    if meeting is None:
+        return None
+    there, back = meeting
+    walk = state_walk(sides[0][1], there)
+    state = sides[1][1][back]
+    while state is not None:
+        walk.append(state[0])
+        state = sides[1][1][state]
+    return simple_or_fuel(walk, s, t, k, neighbours, has_food)
+
+
+def fuel_tree(
+        s: Hashable,
+        k: int,
+        extra_food: Union[int, float] = 0,
+        neighbours: Callable = vertex_neighbours,
+        has_food: Callable = vertex_has_food
+) -> Tuple[Dict, Dict[Hashable, List[Tuple[Hashable, int]]], Dict]:
+    """
+    Runs the fuel search from `s` to exhaustion, to answer queries to many
+    destinations from one search.
+
+    :return a (parent, arrivals, others) tuple: parent is the parent table of
+        the states, arrivals lists the settled states of every vertex, in the
+        order they were settled, and others the other parents, see
+        state_path.
+    """
+
+    parent = {}
+    arrivals = {}
+    others = {}
+    for v, steps, _ in settle_states(s, k, extra_food, parent, neighbours, has_food, others=others):
+        arrivals.setdefault(v, []).append((v, steps))
+    return parent, arrivals, others
+
+
+def tree_path(
+        tree: Tuple[Dict, Dict, Dict],
+        t: Hashable,
+        k: int,
+        extra_food: Union[int, float] = 0,
+        has_food: Callable = vertex_has_food
+) -> Union[List[Hashable], None]:
+    """
+    Picks the path to `t` out of a fuel_tree, the same way fuel_search does.
+
+    :return a simple, feasible path to `t`, or None.
+    """
+
+    parent, arrivals, others = tree
+    for state in arrivals.get(t, ()):
+        found = state_path(parent, others, state, k, extra_food, has_food)
+        if found is not None:
+            return found[0]
+    return None
+
+
+class FeasibilityTree:
+    """
+    Every destination the colony can reach from one start for a given k, from
+    a single exhaustive fuel search.
+
+    The search runs once, when the tree is made. Paths are only put together
+    when asked for, and remembered.
+
+    Attributes:
+        * self.s - where the colony starts.
+        * self.k (int) - the maximum number of hops between meals.
+        * self.extra_food (int) - how many locations we may place food on.
+
+    Functions:
+        * reachable(self, t) - can the colony get to `t`?
+        * path_to(self, t) - a simple, feasible path to `t`, or None.
+        * destinations(self) - every vertex the search reached.
+    """
+
+    def __init__(
+            self,
+            s: Hashable,
+            k: int,
+            extra_food: Union[int, float] = 0,
+            neighbours: Callable = vertex_neighbours,
+            has_food: Callable = vertex_has_food
+    ) -> None:
+        self.s = s
+        self.k = k
+        self.extra_food = extra_food
+        self._has_food = has_food
+        self._tree = fuel_tree(s, k, extra_food, neighbours, has_food)
+        self._paths = {}
+
+    def __contains__(self, t: Hashable) -> bool:
+        return self.reachable(t)
+
+    def reachable(self, t: Hashable) -> bool:
+        """
+        Checks whether the colony can get to `t`.
+
+        A dict lookup for destinations the search never reached. Otherwise
+        the path is put together the first time, since a walk that doubles
+        back to food can't always be made simple, and it's a lookup after
+        that.
+        """
+
+        if t not in self._tree[1]:
+            return False
+        return self.path_to(t) is not None
+
+    def path_to(self, t: Hashable) -> Union[List[Hashable], None]:
+        """
+        :return a simple path from the start to `t` that the colony survives,
+        or None if there isn't one.
+        """
+
+        if t not in self._paths:
+            self._paths[t] = tree_path(self._tree, t, self.k, self.extra_food, self._has_food)
+        path = self._paths[t]
+        return None if path is None else list(path)
+
+    def destinations(self) -> List[Hashable]:
+        """
+        :return every vertex the search reached, some of them may only be
+        reachable along walks that aren't simple, see reachable.
+        """
+
+        return list(self._tree[1])
+
+
+def alternative_paths(
+        s: Hashable,
+        t: Hashable,
+        k: int,
+        extra_food: Union[int, float] = 0,
+        neighbours: Callable = vertex_neighbours,
+        has_food: Callable = vertex_has_food
+) -> Iterator[List[Hashable]]:
+    """
+    Yields distinct simple paths from `s` to `t` that the colony survives,
+    in the manner of Yen's k shortest paths. Without extra food they come
+    shortest first, as long as every spur search finds a shortest suffix.
+    With it, the searches prefer fewer placements to fewer steps, so a
+    longer path may come before a shorter one.
+
+    The first path is fuel_search's. Each next one branches off a path
+    already yielded at one of its locations, the spur: it keeps the route up
+    to the spur, and a fuel search from there finds the rest, starting with
+    however hungry the colony is at the spur and the food left over, and
+    avoiding the route so far and the ways the yielded paths already left
+    the spur. The candidates wait in a heap, and are only worked out when
+    the previous path has been asked for.
+
+    The spur searches are fuel_search, a heuristic: the walks it puts
+    together don't always make the shortest simple suffix, or any. So in
+    rare mazes a feasible path is skipped, or comes after a longer one.
+
+    :param s - The start vertex for the quokka colony
+    :param t - The destination for the quokka colony
+    :param k - The maximum number of hops between locations with food
+    :param extra_food - How many locations we may place food on
+    :param neighbours - Adjacency of the graph being searched
+    :param has_food - Food lookup of the graph being searched
+    :return yields every path as a list, until there are no more.
+    """
+
+    path = fuel_search(s, t, k, extra_food, neighbours, has_food)
+    if path is None:
+        return
+
+    found = [path]
+    seen = {tuple(path)}
+    candidates = []
+    counter = 0
+    while True:
+        yield list(path)
+
+        # the state of the colony at every location of the path
+        steps = 0
+        placed = 0
+        for i in range(len(path) - 1):
+            spur = path[i]
+            if i > 0:
+                steps += 1
+                if has_food(spur):
+                    steps = 0
+                elif steps == k:
+                    placed += 1
+                    steps = 0
+            if placed > extra_food:
+                break
+
+            root = path[:i + 1]
+            before = set(root[:-1])
+            taken = {p[i + 1] for p in found if p[:i + 1] == root}
+
+            def spur_neighbours(v, spur=spur, before=before, taken=taken):
+                return [
+                    u for u in neighbours(v)
+                    if u not in before and not (v == spur and u in taken)
+                ]
+
+            rest = fuel_search(spur, t, k, extra_food - placed, spur_neighbours, has_food, steps)
+            if rest is None:
+                continue
+            candidate = root[:-1] + rest
+            if tuple(candidate) not in seen:
+                seen.add(tuple(candidate))
+                counter += 1
+                heapq.heappush(candidates, (len(candidate), counter, candidate))
+
+        if not candidates:
+            return
+        path = heapq.heappop(candidates)[2]
+        found.append(path)
+
+
+def bottleneck_search(
+        s: Hashable,
+        t: Hashable,
+        neighbours: Callable = vertex_neighbours,
+        has_food: Callable = vertex_has_food
+) -> Union[Tuple[int, List[Hashable]], None]:
+    """
+    Finds the smallest k for which the colony can get from `s` to `t`, and a
+    path that needs no more than that.
+
+    A breadth first search finds a shortest path first, which is feasible
+    for its own required_k, so that is an upper bound. Then k = 1, 2, 4, ...
+    is tried with fuel_search until one has a path, and the range between
+    the last two tries is halved down to the smallest k that has one. That
+    is O(log k) fuel searches, none of them with a k more than twice the
+    answer, instead of one per k.
+
+    fuel_search can miss a rare simple path, so in rare mazes the k is an
+    upper bound on the smallest one.
+
+    `s` == `t` needs no steps at all, so it is (0, [s]).
+
+    :param s - The start vertex for the quokka colony
+    :param t - The destination for the quokka colony
+    :param neighbours - Adjacency of the graph being searched
+    :param has_food - Food lookup of the graph being searched
+    :returns
+        * A (k, path) tuple, with the simple path feasible for that k.
+        OR
+        * None if `t` can't be reached from `s` at all.
+    """
+
+    if s == t:
+        return 0, [s]
+
+    parent = {s: None}
+    frontier = [s]
+    while frontier and t not in parent:
+        nxt = []
+        for v in frontier:
+            for u in neighbours(v):
+                if u not in parent:
+                    parent[u] = v
+                    nxt.append(u)
+        frontier = nxt
+    if t not in parent:
+        return None
+    walk = []
+    v = t
+    while v is not None:
+        walk.append(v)
+        v = parent[v]
+    best = required_k(walk[::-1], has_food), walk[::-1]
+
+    # gallop up to the first k with a path, then halve the gap below it
+    low = 0
+    k = 1
+    while k < best[0]:
+        path = fuel_search(s, t, k, 0, neighbours, has_food)
+        if path is not None:
+            best = k, path
+            break
+        low = k
+        k *= 2
+    high = best[0]
+    while high - low > 1:
+        k = (low + high) // 2
+        path = fuel_search(s, t, k, 0, neighbours, has_food)
+        if path is None:
+            low = k
+        else:
+            best = k, path
+            high = k
+    return best
+
+
+# parent of the start vertex in a DijkstraQuery
+ROOT = "<root>"
+
+
+class SearchScratch:
+    """
+    Per-vertex tables reused by one search after another.
+
+    Every slot carries the generation it was written in, and only counts as
+    set while that matches the current generation. Starting a new search is
+    then just bumping the generation, instead of resetting every vertex of
+    the maze, so a search only pays for the vertices it actually reaches.
+
+    The tables are indexed by the vertex's position in the maze. A scratch
+    must only be used by one search at a time, QuokkaMaze keeps one per
+    thread.
+
+    Attributes:
+        * self.generation (int) - the generation of the current search.
+        * self.stamp (List[int]) - generation each slot was last written in.
+        * self.distance, self.parent, self.extra_food, self.done (List) - the
+            search state itself, see DijkstraQuery.
+    """
+
+    def __init__(self) -> None:
+        self.generation = 0
+        self.stamp = []
+        self.distance = []
+        self.parent = []
+        self.extra_food = []
+        self.done = []
+
+    def begin(self, size: int) -> int:
+        """
+        Starts a new search over `size` vertices, all slots become unset.
+
+        :return the generation of the new search.
+        """
+
+        grow = size - len(self.stamp)
+        if grow > 0:
+            self.stamp.extend([0] * grow)
+            self.distance.extend([inf] * grow)
+            self.parent.extend([None] * grow)
+            self.extra_food.extend([None] * grow)
+            self.done.extend([False] * grow)
+        self.generation += 1
+        return self.generation
+
+
+class DijkstraQuery:
+    """
+    The working state of one modified Dijkstra search from `s`.
+
+    This used to be stored on the vertices themselves (`Dijkstra_parent`,
+    `Dijkstra_distance`, `extra_food`, ...), so two searches on the same maze
+    overwrote each other. Every search now writes to its own SearchScratch,
+    and the maze is only ever read. Vertices the search never reaches are
+    never touched.
+
+    Attributes:
+        * self.ids (Dict[Vertex, int]) - position of every vertex in the maze.
+        * self.scratch (SearchScratch) - where the state is kept.
+        * self.generation (int) - this search's generation in the scratch.
+
+    Functions:
+        * distance_of(self, v) - hops from the start, inf if not reached.
+        * relax(self, u, v) - reach `v` from `u`.
+        * forget(self, v) - mark `v` as not reached again.
+        * settle(self, v) / is_settled(self, v) - `v` left the queue for good.
+        * did_we_eat_here(self, v) - did the quokkas have a meal on `v`?
+        * will_survive(self, v, k) - do the quokkas survive reaching `v`?
+        * path_to(self, v) - the path from the start to `v`.
+    """
+
+    def __init__(
+            self,
+            s: Hashable,
+            extra_food: int,
+            ids: Dict[Hashable, int],
+            scratch: Union[SearchScratch, None] = None
+    ) -> None:
+        """
+        Starts a search from `s` with `extra_food` food to place.
+
+        :param ids - Position of every vertex of the maze.
+        :param scratch - Tables to reuse, a fresh one is made if not given.
+        """
+
+        self.ids = ids
+        self.scratch = scratch if scratch is not None else SearchScratch()
+        self.generation = self.scratch.begin(len(ids))
+
+        i = ids[s]
+        self._reach(i, 0, ROOT, extra_food)
+
+    def _reach(self, i: int, distance: int, parent, extra_food) -> None:
+        scratch = self.scratch
+        scratch.stamp[i] = self.generation
+        scratch.distance[i] = distance
+        scratch.parent[i] = parent
+        scratch.extra_food[i] = extra_food
+        scratch.done[i] = False
+
+    def distance_of(self, v: Hashable) -> Union[int, float]:
+        i = self.ids[v]
+        if self.scratch.stamp[i] != self.generation:
+            return inf
+        return self.scratch.distance[i]
+
+    def relax(self, u: Hashable, v: Hashable) -> None:
+        """
+        Reach `v` through `u`, with whatever extra food was left at `u`.
+        """
+
+        i = self.ids[u]
+        self._reach(
+            self.ids[v],
+            self.scratch.distance[i] + 1,
+            u,
+            self.scratch.extra_food[i]
+        )
+
+    def forget(self, v: Hashable) -> None:
+        """
+        Marks `v` as not reached, it may be reached again from elsewhere.
+        """
+
+        self.scratch.stamp[self.ids[v]] = 0
+
+    def settle(self, v: Hashable) -> None:
+        self.scratch.done[self.ids[v]] = True
+
+    def is_settled(self, v: Hashable) -> bool:
+        i = self.ids[v]
+        return self.scratch.stamp[i] == self.generation and self.scratch.done[i]
+
+    def _parent(self, v: Hashable):
+        return self.scratch.parent[self.ids[v]]
+
+    def _extra_food(self, v: Hashable) -> int:
+        return self.scratch.extra_food[self.ids[v]]
+
+    def did_we_eat_here(self, v: Hashable) -> bool:
+        """Did quokkas have a meal on this vertex?
+
+        Returns:
+            bool: True: yes! this vertex had food, or we consumed extra food.
+                  False: no, quokkas ate nothing on this vertex
+        """
+        parent = self._parent(v)
+        if v.has_food or parent == ROOT:
+            return True
+        elif self._extra_food(v) + 1 == self._extra_food(parent):
+            return True
+        else:
+            return False
+
+    def will_survive(self, v: Hashable, k: int) -> bool:
+        """To find out if quokkas will survive when they reach this vertex, consume extra food
+            if necessary.
+        Args:
+            v (Vertex): The vertex the quokkas are reaching.
+            k (int): The maximum number of hops between locations with food, the same arg as
+            it in find_path() method.
+
+        Returns:
+            bool:  True: will survive
+                   False: will strave
+        """
+        # no input validity check for the argument k, since it has been checked in graph.find_path()
+
+        walk = 0
+        current_vertex = v
+
+        while walk < k:
+            if self.did_we_eat_here(current_vertex):
+                return True
+            else:
+                walk += 1
+                current_vertex = self._parent(current_vertex)
+
+        i = self.ids[v]
+        if self.scratch.extra_food[i] != 0:
+            self.scratch.extra_food[i] -= 1
+            return True
+        else:
+            return False
+
+    def path_to(self, v: Hashable) -> List[Hashable]:
+        """
+        Walks the parents back from `v` to the start.
+
+        :return the path from the start to `v`, in order.
+        """
+
+        path = []
+        while v != ROOT:
+            path.append(v)
+            v = self._parent(v)
+        return path[::-1]
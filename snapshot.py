@@ -0,0 +1,228 @@
+"""
+Maze Snapshot
+=============
+
+A frozen, array-backed copy of a quokka maze for read-heavy workloads.
+
+Vertices are numbered by their position in the maze, and the adjacency is
+stored in compressed sparse row (CSR) form: the neighbours of vertex `i` are
+`neighbours[offsets[i]:offsets[i + 1]]`. Food is a bitmap with one bit per
+vertex. Searches run on the integer ids and the result is translated back to
+the original `Vertex` objects.
+
+The snapshot does not follow later changes to the maze, freeze it again
+after fixing or blocking edges.
+"""
+
+from array import array
+from typing import Iterator, List, Tuple, Union
+
+from vertex import Vertex
+from search import alternative_paths, bottleneck_search, fuel_search, plan_extra_food
+
+
+class MazeSnapshot:
+    """
+    An immutable CSR view of a QuokkaMaze.
+
+    Attributes:
+        * self.vertices (List[Vertex]) - the vertex of every id.
+        * self.ids (Dict[Vertex, int]) - the id of every vertex.
+        * self.offsets (array) - where each vertex's neighbours start, with
+            one extra entry at the end.
+        * self.neighbours (array) - the neighbour ids of all vertices.
+        * self.food (bytearray) - bit `i` is set if vertex `i` has food.
+
+    Functions:
+        * has_food(self, i) - checks whether vertex id `i` has food.
+        * neighbours_of(self, i) - the neighbour ids of vertex id `i`.
+        * csr(self) - the offsets, neighbours and food arrays.
+        * search(self, s, t, k, extra_food) - find_path on vertex ids.
+        * find_path(self, s, t, k, extra_food) - same as QuokkaMaze.find_path.
+        * exists_path_with_extra_food(self, s, t, k, x) - same as
+            QuokkaMaze.exists_path_with_extra_food.
+        * min_extra_food(self, s, t, k) - same as QuokkaMaze.min_extra_food.
+        * min_k(self, s, t) - same as QuokkaMaze.min_k.
+        * alternative_paths(self, s, t, k, extra_food) - same as
+            QuokkaMaze.alternative_paths.
+    """
+
+    def __init__(self, maze) -> None:
+        """
+        Freezes the current state of `maze`.
+
+        :param maze - The QuokkaMaze to take a snapshot of.
+        """
+
+        self.vertices = list(maze.vertices)
+        self.ids = dict(maze._ids)
+
+        ids = self.ids
+        offsets = array("q", [0])
+        neighbours = array("q")
+        food = bytearray((len(self.vertices) + 7) // 8)
+        for i, v in enumerate(self.vertices):
+            neighbours.extend(ids[u] for u in v.edges)
+            offsets.append(len(neighbours))
+            if v.has_food:
+                food[i >> 3] |= 1 << (i & 7)
+
+        self.offsets = offsets
+        self.neighbours = neighbours
+        self.food = food
+        self._view = memoryview(neighbours)
+
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+
+    def has_food(self, i: int) -> bool:
+        return bool(self.food[i >> 3] >> (i & 7) & 1)
+
+    def neighbours_of(self, i: int) -> memoryview:
+        return self._view[self.offsets[i]:self.offsets[i + 1]]
+
+    def csr(self) -> Tuple:
+        """
+        :return the (offsets, neighbours, food) arrays described above, for
+        the code that reads them directly.
+        """
+        return self.offsets, self.neighbours, self.food
+
+    def search(
+            self,
+            s: int,
+            t: int,
+            k: int,
+            extra_food: int = 0
+    ) -> Union[List[int], None]:
+        """
+        Runs the fuel search between vertex ids, the inputs are not checked.
+
+        :return the list of vertex ids on the path, or None.
+        """
+
+        return fuel_search(s, t, k, extra_food, self.neighbours_of, self.has_food)
+
+    def _valid(self, s, t, k, x) -> bool:
+        if not (isinstance(s, Vertex) and isinstance(t, Vertex)):
+            return False
+        if not (isinstance(k, int) and isinstance(x, int)):
+            return False
+        return s in self.ids and t in self.ids and k >= 0 and x >= 0
+
+    def find_path(
+            self,
+            s: Vertex,
+            t: Vertex,
+            k: int,
+            extra_food: int = 0
+    ) -> Union[List[Vertex], None]:
+        """
+        find_path returns a SIMPLE path between `s` and `t` such that from any
+        location with food along this path we reach the next location with food
+        in at most `k` steps, as it was when the snapshot was taken.
+
+        :param s - The start vertex for the quokka colony
+        :param t - The destination for the quokka colony
+        :param k - The maximum number of hops between locations with food
+        :param extra_food - How many locations we may place extra food on.
+        :returns
+            * The list of vertices to form the simple path from `s` to `t`.
+            OR
+            * None if there is no such path, or the input is invalid.
+        """
+
+        if not self._valid(s, t, k, extra_food):
+            return None
+
+        path = self.search(self.ids[s], self.ids[t], k, extra_food)
+        if path is None:
+            return None
+        return [self.vertices[i] for i in path]
+
+    def exists_path_with_extra_food(
+            self,
+            s: Vertex,
+            t: Vertex,
+            k: int,
+            x: int
+    ) -> bool:
+        """
+        Determines whether the quokkas can make it from s to t by placing food
+        at at most x new locations, as the maze was when the snapshot was
+        taken.
+
+        :returns
+            * True if with x added food we can complete the simple path
+            * False otherwise, or if the input is invalid.
+        """
+
+        if not self._valid(s, t, k, x):
+            return False
+        needed = self.min_extra_food(s, t, k)
+        return needed is not None and needed <= x
+
+    def min_extra_food(
+            self,
+            s: Vertex,
+            t: Vertex,
+            k: int,
+            return_plan: bool = False
+    ) -> Union[int, Tuple[int, List[Vertex], List[Vertex]], None]:
+        """
+        Same as QuokkaMaze.min_extra_food, as the maze was when the snapshot
+        was taken.
+        """
+
+        if not self._valid(s, t, k, 0):
+            return None
+
+        plan = plan_extra_food(self.ids[s], self.ids[t], k, self.neighbours_of, self.has_food)
+        if plan is None:
+            return None
+        if not return_plan:
+            return plan[0]
+        count, placements, path = plan
+        return (
+            count,
+            [self.vertices[i] for i in placements],
+            [self.vertices[i] for i in path]
+        )
+
+    def min_k(
+            self,
+            s: Vertex,
+            t: Vertex
+    ) -> Union[Tuple[int, List[Vertex]], None]:
+        """
+        Same as QuokkaMaze.min_k, as the maze was when the snapshot was taken.
+        """
+
+        if not self._valid(s, t, 0, 0):
+            return None
+
+        found = bottleneck_search(self.ids[s], self.ids[t], self.neighbours_of, self.has_food)
+        if found is None:
+            return None
+        k, path = found
+        return k, [self.vertices[i] for i in path]
+
+    def alternative_paths(
+            self,
+            s: Vertex,
+            t: Vertex,
+            k: int,
+            extra_food: int = 0
+    ) -> Union[Iterator[List[Vertex]], None]:
+        """
+        Same as QuokkaMaze.alternative_paths, as the maze was when the
+        snapshot was taken.
+        """
+
+        if not self._valid(s, t, k, extra_food):
+            return None
+
+        paths = alternative_paths(
+            self.ids[s], self.ids[t], k, extra_food, self.neighbours_of, self.has_food
+        )
+        return ([self.vertices[i] for i in path] for path in paths)
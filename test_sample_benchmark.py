@@ -0,0 +1,59 @@
+import json
+import unittest
+
+import benchmark
+
+
+def should_be_equal(got, expected, func, message="Incorrect result returned"):
+    """
+    Simple Assert Helper Function
+    """
+
+    assert expected == got, \
+        f"[{func}] MSG: {message} [Expected: {expected}, got: {got}]"
+
+
+def should_be_true(got, func, message="Incorrect result returned"):
+    """
+    Simple Assert Helper Function
+    """
+
+    assert got, \
+        f"[{func}] MSG: {message} [Expected: True, got: {got}]"
+
+
+class TestSampleBenchmark(unittest.TestCase):
+
+    def test_generators(self):
+        """
+        The same seed gives the same maze, and the edges are valid.
+        """
+
+        for name, generate in benchmark.GENERATORS.items():
+            food, edges = generate(200, 0.3, 7)
+            should_be_equal(generate(200, 0.3, 7), (food, edges), name,
+                            "the maze should only depend on the seed")
+            should_be_true(len(food) > 100, name)
+            for i, j in edges:
+                should_be_true(0 <= i < len(food) and 0 <= j < len(food) and i != j, name)
+            should_be_equal(len({frozenset(e) for e in edges}), len(edges), name,
+                            "no edge should be generated twice")
+
+    def test_run(self):
+        """
+        A small run times every operation, and is valid JSON.
+        """
+
+        report = benchmark.run(["grid"], [25], [0.5], [2], [0, 1], queries=3,
+                               engines=("dijkstra", "fuel"))
+        json.dumps(report)
+
+        operations = [row["operation"] for row in report["results"]]
+        should_be_equal(operations, [
+            "add_vertex", "fix_edge",
+            "find_path", "find_path",
+            "exists_path_with_extra_food", "exists_path_with_extra_food",
+            "min_k", "block_edge",
+        ], "benchmark.run")
+        for row in report["results"]:
+            should_be_true(row["calls"] > 0 and row["seconds"] >= 0, "benchmark.run")
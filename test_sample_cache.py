@@ -0,0 +1,93 @@
+import unittest
+
+from vertex import Vertex
+from graph import QuokkaMaze
+from cache import QueryCache
+
+
+def should_be_equal(got, expected, func, message="Incorrect result returned"):
+    """
+    Simple Assert Helper Function
+    """
+
+    assert expected == got, \
+        f"[{func}] MSG: {message} [Expected: {expected}, got: {got}]"
+
+
+class TestSampleCache(unittest.TestCase):
+
+    def test_least_recently_used_goes_first(self):
+        """
+        A full cache evicts the entry that wasn't used for the longest.
+        """
+
+        cache = QueryCache(2)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        should_be_equal(cache.get("a"), (True, 1), "cache.get")
+
+        cache.put("c", 3)
+        should_be_equal(cache.get("b"), (False, None), "cache.get")
+        should_be_equal(cache.get("a"), (True, 1), "cache.get")
+        should_be_equal(cache.get("c"), (True, 3), "cache.get")
+
+        should_be_equal(
+            cache.stats(),
+            {"hits": 3, "misses": 1, "evictions": 1, "size": 2, "capacity": 2},
+            "cache.stats"
+        )
+
+        with self.assertRaises(ValueError):
+            QueryCache(0)
+
+    def test_maze_changes_invalidate_answers(self):
+        """
+        No answer from before a change is ever returned after it.
+        """
+
+        #           *         *
+        # A -- B -- C -- D -- E
+
+        A = Vertex(False)
+        B = Vertex(False)
+        C = Vertex(True)
+        D = Vertex(False)
+        E = Vertex(True)
+
+        m = QuokkaMaze()
+        for v in (A, B, C, D, E):
+            m.add_vertex(v)
+        m.fix_edge(A, B)
+        m.fix_edge(B, C)
+        m.fix_edge(C, D)
+        m.fix_edge(D, E)
+
+        should_be_equal(m.cache_stats(), None, "maze.cache_stats")
+        m.enable_query_cache(8)
+
+        path = m.find_path(A, E, 2)
+        should_be_equal(path, [A, B, C, D, E], "maze.find_path")
+        path.append("junk")
+        should_be_equal(m.find_path(A, E, 2), [A, B, C, D, E], "maze.find_path")
+        should_be_equal(m.exists_path_with_extra_food(A, E, 1, 2), True,
+                        "maze.exists_path_with_extra_food")
+        should_be_equal(m.exists_path_with_extra_food(A, E, 1, 2), True,
+                        "maze.exists_path_with_extra_food")
+
+        stats = m.cache_stats()
+        should_be_equal((stats["hits"], stats["misses"]), (2, 2), "maze.cache_stats")
+
+        m.block_edge(C, D)
+        should_be_equal(m.find_path(A, E, 2), None, "maze.find_path")
+        should_be_equal(m.exists_path_with_extra_food(A, E, 1, 2), False,
+                        "maze.exists_path_with_extra_food")
+
+        m.fix_edge(C, D)
+        should_be_equal(m.find_path(A, E, 2), [A, B, C, D, E], "maze.find_path")
+
+        # invalid queries are answered but never cached
+        should_be_equal(m.find_path(A, E, -1), None, "maze.find_path")
+        should_be_equal(m.find_path([A], E, 2), None, "maze.find_path")
+
+        stats = m.cache_stats()
+        should_be_equal((stats["hits"], stats["misses"]), (2, 5), "maze.cache_stats")
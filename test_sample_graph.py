@@ -1,7 +1,9 @@
 import unittest
+from concurrent.futures import ThreadPoolExecutor
 
 from vertex import Vertex
 from graph import QuokkaMaze
+from search import required_k
 
 
 def should_be_equal(got, expected, func, message="Incorrect result returned"):
@@ -302,4 +304,772 @@ class TestSampleGraph(unittest.TestCase):
             m.exists_path_with_extra_food(A, E, 1, 6),
             "maze.exists_path_with_extra_food",
             "Able to reach path with extra added food, should be true."
-        )
\ No newline at end of file
+        )
+
+class TestSampleFuelEngine(unittest.TestCase):
+
+    def test_fuel_engine_comment_example(self):
+        """
+        The fuel engine should agree with the examples in the comments.
+        """
+
+        #           *         *
+        # A -- B -- C -- D -- E
+
+        A = Vertex(False)
+        B = Vertex(False)
+        C = Vertex(True)
+        D = Vertex(False)
+        E = Vertex(True)
+
+        m = QuokkaMaze()
+
+        for v in (A, B, C, D, E):
+            should_be_true(m.add_vertex(v), "maze.add_vertex")
+
+        should_be_true(m.fix_edge(A, B), "maze.fix_edge")
+        should_be_true(m.fix_edge(B, C), "maze.fix_edge")
+        should_be_true(m.fix_edge(C, D), "maze.fix_edge")
+        should_be_true(m.fix_edge(D, E), "maze.fix_edge")
+
+        check_path_should_match(
+            m.find_path(A, E, 2, engine="fuel"),
+            [A, B, C, D, E],
+        )
+
+        should_be_true(
+            m.find_path(A, E, 1, engine="fuel") is None,
+            "maze.find_path",
+            "Returned not `None` path when no valid path exists"
+        )
+
+        check_path_should_match(
+            m.find_path(A, C, 4, engine="fuel"),
+            [A, B, C],
+        )
+
+        # with extra food on B and D the colony gets there with k=1
+        check_path_should_match(
+            m.find_path(A, E, 1, 2, engine="fuel"),
+            [A, B, C, D, E],
+        )
+
+        should_be_true(
+            m.find_path(A, E, 1, 1, engine="fuel") is None,
+            "maze.find_path",
+            "Returned a path that needs more extra food than allowed"
+        )
+
+    def test_fuel_engine_takes_the_detour(self):
+        """
+        The short way has no food, the long way around does.
+        """
+
+        #            *
+        #       X -- Y -- Z
+        #      /           \
+        # A --S             T
+        #      \           /
+        #       P ---Q----R
+
+        A, S, X, Z, T, P, Q, R = [Vertex(False) for _ in range(8)]
+        Y = Vertex(True)
+
+        m = QuokkaMaze()
+        for v in (A, S, X, Y, Z, T, P, Q, R):
+            should_be_true(m.add_vertex(v), "maze.add_vertex")
+
+        for u, v in [(A, S), (S, X), (X, Y), (Y, Z), (Z, T),
+                     (S, P), (P, Q), (Q, R), (R, T)]:
+            should_be_true(m.fix_edge(u, v), "maze.fix_edge")
+
+        check_path_should_match(
+            m.find_path(A, T, 3, engine="fuel"),
+            [A, S, X, Y, Z, T],
+        )
+
+        # an unknown engine is invalid input like any other
+        should_be_true(
+            m.find_path(A, T, 3, engine="teleport") is None,
+            "maze.find_path",
+            "Returned a path for an unknown engine"
+        )
+        should_be_true(
+            m.find_path(A, T, 3, engine=None) is None,
+            "maze.find_path",
+            "Returned a path for an unknown engine"
+        )
+
+
+class TestSampleBidirectionalEngine(unittest.TestCase):
+
+    def test_bidirectional_engine_comment_example(self):
+        """
+        The bidirectional engine should agree with the examples in the
+        comments.
+        """
+
+        #           *         *
+        # A -- B -- C -- D -- E
+
+        A = Vertex(False)
+        B = Vertex(False)
+        C = Vertex(True)
+        D = Vertex(False)
+        E = Vertex(True)
+
+        m = QuokkaMaze()
+
+        for v in (A, B, C, D, E):
+            should_be_true(m.add_vertex(v), "maze.add_vertex")
+
+        should_be_true(m.fix_edge(A, B), "maze.fix_edge")
+        should_be_true(m.fix_edge(B, C), "maze.fix_edge")
+        should_be_true(m.fix_edge(C, D), "maze.fix_edge")
+        should_be_true(m.fix_edge(D, E), "maze.fix_edge")
+
+        check_path_should_match(
+            m.find_path(A, E, 2, engine="bidirectional"),
+            [A, B, C, D, E],
+        )
+
+        should_be_true(
+            m.find_path(A, E, 1, engine="bidirectional") is None,
+            "maze.find_path",
+            "Returned not `None` path when no valid path exists"
+        )
+
+        check_path_should_match(
+            m.find_path(A, C, 4, engine="bidirectional"),
+            [A, B, C],
+        )
+
+        # the destination without food has to be reached a step early
+        should_be_true(
+            m.find_path(C, A, 2, engine="bidirectional") is None,
+            "maze.find_path",
+            "Returned a path that starves the colony at the destination"
+        )
+        check_path_should_match(
+            m.find_path(C, A, 3, engine="bidirectional"),
+            [C, B, A],
+        )
+
+        # extra food goes to the fuel engine
+        check_path_should_match(
+            m.find_path(A, E, 1, 2, engine="bidirectional"),
+            [A, B, C, D, E],
+        )
+
+    def test_bidirectional_engine_takes_the_detour(self):
+        """
+        The two searches meet on the long way around, the only one with
+        food.
+        """
+
+        #            *
+        #       X -- Y -- Z
+        #      /           \
+        # A --S             T
+        #      \           /
+        #       P ---Q----R
+
+        A, S, X, Z, T, P, Q, R = [Vertex(False) for _ in range(8)]
+        Y = Vertex(True)
+
+        m = QuokkaMaze()
+        for v in (A, S, X, Y, Z, T, P, Q, R):
+            should_be_true(m.add_vertex(v), "maze.add_vertex")
+
+        for u, v in [(A, S), (S, X), (X, Y), (Y, Z), (Z, T),
+                     (S, P), (P, Q), (Q, R), (R, T)]:
+            should_be_true(m.fix_edge(u, v), "maze.fix_edge")
+
+        check_path_should_match(
+            m.find_path(A, T, 3, engine="bidirectional"),
+            [A, S, X, Y, Z, T],
+        )
+
+        # the other way A has no food, so it has to be reached a step early
+        should_be_true(
+            m.find_path(T, A, 3, engine="bidirectional") is None,
+            "maze.find_path",
+            "Returned a path that starves the colony at the destination"
+        )
+        check_path_should_match(
+            m.find_path(T, A, 4, engine="bidirectional"),
+            [T, Z, Y, X, S, A],
+        )
+
+    def test_bidirectional_engine_agrees_with_fuel(self):
+        """
+        On a ladder with scattered food both engines find routes of the same
+        length.
+        """
+
+        m = QuokkaMaze.from_edges(
+            [i % 5 == 0 for i in range(40)],
+            [(i, i + 1) for i in range(19)] + [(20 + i, 21 + i) for i in range(19)] +
+            [(i, 20 + i) for i in range(20)]
+        )
+        for s, t in [(0, 19), (3, 37), (21, 17), (19, 20)]:
+            for k in range(1, 6):
+                fuel = m.find_path(m.vertices[s], m.vertices[t], k, engine="fuel")
+                both = m.find_path(m.vertices[s], m.vertices[t], k, engine="bidirectional")
+                should_be_equal(both is None, fuel is None, "maze.find_path")
+                if both is not None:
+                    should_be_equal(len(both), len(fuel), "maze.find_path")
+                    should_be_true(required_k(both) <= k, "maze.find_path")
+
+
+class TestSampleConcurrentQueries(unittest.TestCase):
+
+    def test_queries_from_many_threads(self):
+        """
+        Searches on a shared maze shouldn't step on each other.
+        """
+
+        # a 6x6 grid with food on every third location
+        size = 6
+        grid = [[Vertex((r * size + c) % 3 == 0) for c in range(size)]
+                for r in range(size)]
+
+        m = QuokkaMaze()
+        for row in grid:
+            for v in row:
+                should_be_true(m.add_vertex(v), "maze.add_vertex")
+
+        for r in range(size):
+            for c in range(size):
+                if r + 1 < size:
+                    m.fix_edge(grid[r][c], grid[r + 1][c])
+                if c + 1 < size:
+                    m.fix_edge(grid[r][c], grid[r][c + 1])
+
+        flat = [v for row in grid for v in row]
+        queries = [(flat[i], flat[-1 - j], k, x)
+                   for i in range(0, 36, 5)
+                   for j in range(0, 36, 7)
+                   for k in (1, 2, 3)
+                   for x in (0, 1)]
+
+        def run(query):
+            return (m.find_path(*query),
+                    m.exists_path_with_extra_food(*query))
+
+        expected = [run(q) for q in queries]
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            for _ in range(5):
+                got = list(pool.map(run, queries))
+                should_be_equal(got, expected, "maze.find_path",
+                                "Concurrent queries returned different results")
+
+
+class TestSampleMinExtraFood(unittest.TestCase):
+
+    def test_min_extra_food_comment_example(self):
+        """
+        Checks the examples in the min_extra_food comments.
+        """
+
+        #                     *
+        # A -- B -- C -- D -- E
+
+        A = Vertex(False)
+        B = Vertex(False)
+        C = Vertex(False)
+        D = Vertex(False)
+        E = Vertex(True)
+
+        m = QuokkaMaze()
+
+        for v in (A, B, C, D, E):
+            should_be_true(m.add_vertex(v), "maze.add_vertex")
+
+        should_be_true(m.fix_edge(A, B), "maze.fix_edge")
+        should_be_true(m.fix_edge(B, C), "maze.fix_edge")
+        should_be_true(m.fix_edge(C, D), "maze.fix_edge")
+        should_be_true(m.fix_edge(D, E), "maze.fix_edge")
+
+        should_be_equal(m.min_extra_food(A, E, 2), 1, "maze.min_extra_food")
+        should_be_equal(m.min_extra_food(A, E, 5), 0, "maze.min_extra_food")
+        should_be_equal(m.min_extra_food(A, A, 0), 0, "maze.min_extra_food")
+        should_be_equal(m.min_extra_food(A, E, 0), None, "maze.min_extra_food")
+        should_be_equal(m.min_extra_food(A, E, -1), None, "maze.min_extra_food")
+
+        count, placements, path = m.min_extra_food(A, E, 1, return_plan=True)
+        should_be_equal(count, 3, "maze.min_extra_food")
+        should_be_equal(placements, [B, C, D], "maze.min_extra_food")
+        check_path_should_match(path, [A, B, C, D, E], "maze.min_extra_food")
+
+        # exists_path_with_extra_food is a comparison against it
+        should_be_false(m.exists_path_with_extra_food(A, E, 1, 2),
+                        "maze.exists_path_with_extra_food")
+        should_be_true(m.exists_path_with_extra_food(A, E, 1, 3),
+                       "maze.exists_path_with_extra_food")
+        should_be_false(m.exists_path_with_extra_food(A, E, 1, -3),
+                        "maze.exists_path_with_extra_food")
+
+    def test_min_extra_food_takes_the_other_way_to_the_food(self):
+        """
+        V3-V4-V5 and V3-V0-V5 reach the food equally fast, only the first
+        leaves V0 free for the way on to V2.
+        """
+
+        #          *
+        #   V4 -- V5
+        #   |      |
+        #   V3 -- V0 -- V2
+        #   |
+        #   V1
+
+        m = QuokkaMaze.from_edges(
+            [False, False, False, False, False, True],
+            [(0, 2), (0, 3), (0, 5), (1, 3), (3, 4), (4, 5)]
+        )
+        V = m.vertices
+
+        count, placements, path = m.min_extra_food(V[1], V[2], 3, return_plan=True)
+        should_be_equal(count, 0, "maze.min_extra_food")
+        should_be_equal(placements, [], "maze.min_extra_food")
+        check_path_should_match(path, [V[1], V[3], V[4], V[5], V[0], V[2]],
+                                "maze.min_extra_food")
+        should_be_true(m.exists_path_with_extra_food(V[1], V[2], 3, 0),
+                       "maze.exists_path_with_extra_food")
+
+
+class TestSampleMinK(unittest.TestCase):
+
+    def test_min_k_comment_example(self):
+        """
+        Checks the examples in the min_k comments.
+        """
+
+        #           *         *
+        # A -- B -- C -- D -- E
+
+        A = Vertex(False)
+        B = Vertex(False)
+        C = Vertex(True)
+        D = Vertex(False)
+        E = Vertex(True)
+
+        m = QuokkaMaze()
+
+        for v in (A, B, C, D, E):
+            should_be_true(m.add_vertex(v), "maze.add_vertex")
+
+        should_be_true(m.fix_edge(A, B), "maze.fix_edge")
+        should_be_true(m.fix_edge(B, C), "maze.fix_edge")
+        should_be_true(m.fix_edge(C, D), "maze.fix_edge")
+        should_be_true(m.fix_edge(D, E), "maze.fix_edge")
+
+        k, path = m.min_k(A, E)
+        should_be_equal(k, 2, "maze.min_k")
+        check_path_should_match(path, [A, B, C, D, E], "maze.min_k")
+
+        k, path = m.min_k(A, D)
+        should_be_equal(k, 2, "maze.min_k")
+        check_path_should_match(path, [A, B, C, D], "maze.min_k")
+
+        should_be_equal(m.min_k(A, A), (0, [A]), "maze.min_k")
+        should_be_equal(m.min_k(A, Vertex(True)), None, "maze.min_k")
+
+        # k really is the smallest one
+        should_be_true(m.find_path(A, E, 1, engine="fuel") is None, "maze.find_path")
+
+    def test_min_k_prefers_food_over_short(self):
+        """
+        A longer route with food beats a short one without.
+        """
+
+        #      *    *
+        #      X -- Y
+        #     /      \
+        #    S        T
+        #     \      /
+        #      P -- Q
+
+        S, P, Q, T = [Vertex(False) for _ in range(4)]
+        X = Vertex(True)
+        Y = Vertex(True)
+
+        m = QuokkaMaze()
+        for v in (S, X, Y, T, P, Q):
+            should_be_true(m.add_vertex(v), "maze.add_vertex")
+        for u, v in [(S, X), (X, Y), (Y, T), (S, P), (P, Q), (Q, T)]:
+            should_be_true(m.fix_edge(u, v), "maze.fix_edge")
+
+        k, path = m.min_k(S, T)
+        should_be_equal(k, 2, "maze.min_k")
+        check_path_should_match(path, [S, X, Y, T], "maze.min_k")
+
+        should_be_true(m.block_edge(X, Y), "maze.block_edge")
+        k, path = m.min_k(S, T)
+        should_be_equal(k, 4, "maze.min_k")
+        check_path_should_match(path, [S, P, Q, T], "maze.min_k")
+
+    def test_min_k_when_cutting_loops_starves(self):
+        """
+        The chain of meals through V0 doubles back, the simple path for the
+        same k goes around through V4.
+        """
+
+        #          *
+        #   V4 -- V5
+        #   |      |
+        #   V3 -- V0 -- V2
+        #   |
+        #   V1
+
+        m = QuokkaMaze.from_edges(
+            [False, False, False, False, False, True],
+            [(0, 2), (0, 3), (0, 5), (1, 3), (3, 4), (4, 5)]
+        )
+        V = m.vertices
+
+        k, path = m.min_k(V[1], V[2])
+        should_be_equal(k, 3, "maze.min_k")
+        check_path_should_match(path, [V[1], V[3], V[4], V[5], V[0], V[2]], "maze.min_k")
+        check_path_should_match(m.find_path(V[1], V[2], 3, engine="fuel"), path)
+
+
+class TestSampleBatchQueries(unittest.TestCase):
+
+    def test_batch_matches_single_queries(self):
+        """
+        Answers come back in input order and agree with the single queries.
+        """
+
+        #           *         *
+        # A -- B -- C -- D -- E
+
+        A = Vertex(False)
+        B = Vertex(False)
+        C = Vertex(True)
+        D = Vertex(False)
+        E = Vertex(True)
+
+        m = QuokkaMaze()
+
+        for v in (A, B, C, D, E):
+            should_be_true(m.add_vertex(v), "maze.add_vertex")
+
+        should_be_true(m.fix_edge(A, B), "maze.fix_edge")
+        should_be_true(m.fix_edge(B, C), "maze.fix_edge")
+        should_be_true(m.fix_edge(C, D), "maze.fix_edge")
+        should_be_true(m.fix_edge(D, E), "maze.fix_edge")
+
+        queries = [
+            (A, E, 2),
+            (A, E, 1),
+            (A, C, 4),
+            (A, D, 2),
+            (E, A, 2),      # A has no food, so it must be reached within 1
+            (A, E, 1, 2),
+            (A, E, -1),
+            (A, Vertex(True), 2),
+            "not a query",
+        ]
+
+        got = m.find_paths(queries)
+        should_be_equal(len(got), len(queries), "maze.find_paths")
+        should_be_equal(
+            got,
+            [[A, B, C, D, E], None, [A, B, C], [A, B, C, D], None,
+             [A, B, C, D, E], None, None, None],
+            "maze.find_paths"
+        )
+
+        queries = [(A, E, 1, x) for x in range(4)] + [(A, E, 1), (A, E, 2, 0)]
+        should_be_equal(
+            m.exists_paths_with_extra_food(queries),
+            [False, False, True, True, False, True],
+            "maze.exists_paths_with_extra_food"
+        )
+
+
+class TestSampleReachableFrom(unittest.TestCase):
+
+    def test_reachable_from_comment_example(self):
+        """
+        One search answers every destination.
+        """
+
+        #           *         *
+        # A -- B -- C -- D -- E     F
+
+        A = Vertex(False)
+        B = Vertex(False)
+        C = Vertex(True)
+        D = Vertex(False)
+        E = Vertex(True)
+        F = Vertex(True)
+
+        m = QuokkaMaze()
+
+        for v in (A, B, C, D, E, F):
+            should_be_true(m.add_vertex(v), "maze.add_vertex")
+
+        should_be_true(m.fix_edge(A, B), "maze.fix_edge")
+        should_be_true(m.fix_edge(B, C), "maze.fix_edge")
+        should_be_true(m.fix_edge(C, D), "maze.fix_edge")
+        should_be_true(m.fix_edge(D, E), "maze.fix_edge")
+
+        tree = m.reachable_from(A, 2)
+        for v in (A, B, C, D, E):
+            should_be_true(tree.reachable(v), "tree.reachable")
+            should_be_true(v in tree, "tree.reachable")
+        should_be_false(tree.reachable(F), "tree.reachable")
+        should_be_equal(tree.path_to(F), None, "tree.path_to")
+
+        check_path_should_match(tree.path_to(D), [A, B, C, D], "tree.path_to")
+        check_path_should_match(tree.path_to(E), [A, B, C, D, E], "tree.path_to")
+
+        # the same answers as asking one destination at a time
+        for v in m.vertices:
+            should_be_equal(tree.path_to(v), m.find_path(A, v, 2, engine="fuel"),
+                            "tree.path_to")
+
+        tree = m.reachable_from(A, 1)
+        should_be_equal(sorted(map(id, tree.destinations())), [id(A)], "tree.destinations")
+
+        tree = m.reachable_from(A, 1, 1)
+        should_be_true(tree.reachable(B), "tree.reachable")
+        should_be_false(tree.reachable(D), "tree.reachable")
+
+        should_be_equal(m.reachable_from(A, -1), None, "maze.reachable_from")
+        should_be_equal(m.reachable_from(Vertex(True), 1), None, "maze.reachable_from")
+
+
+class TestSampleBulkUpdates(unittest.TestCase):
+
+    def test_bulk_api(self):
+        """
+        Batches report a status per item and leave the maze as the single
+        calls would.
+
+                    *         *
+          A -- B -- C -- D -- E
+        """
+
+        statuses = []
+        m = QuokkaMaze.from_edges(
+            [False, False, True, False, True],
+            [(0, 1), (1, 2), (2, 3), (3, 4), (1, 0), (2, 2), (4, 5), "AB", (0, 1, 2), 7],
+            statuses
+        )
+        should_be_equal(statuses, [True] * 4 + [False] * 6, "QuokkaMaze.from_edges")
+        A, B, C, D, E = m.vertices
+        check_edges(A, B, True)
+        check_edges(C, B, True)
+        check_edges(C, D, True)
+        should_be_equal(len(B.edges), 2, "QuokkaMaze.from_edges")
+        check_path_should_match(m.find_path(A, E, 2), [A, B, C, D, E], "maze.find_path")
+
+        # anything with __index__ is a position, like NumPy integers are
+        class Position:
+            def __init__(self, i):
+                self.i = i
+
+            def __index__(self):
+                return self.i
+
+        statuses = []
+        other = QuokkaMaze.from_edges(
+            [False, True], [[Position(0), Position(1)], [Position(1), Position(0)]], statuses
+        )
+        should_be_equal(statuses, [True, False], "QuokkaMaze.from_edges")
+        check_edges(other.vertices[0], other.vertices[1], True)
+
+        F = Vertex(True)
+        should_be_equal(m.add_vertices([F, F, A, "F"]), [True, False, False, False],
+                        "maze.add_vertices")
+
+        m.enable_food_overlay(2)
+        should_be_equal(
+            m.fix_edges([(E, F), (F, E), (A, A), (A, B), (A, Vertex(True)), (A, F)]),
+            [True, False, False, False, False, True],
+            "maze.fix_edges"
+        )
+        check_edges(F, E, True)
+        check_edges(F, A, True)
+        check_path_should_match(m.find_path(A, E, 2, engine="overlay"), [A, F, E],
+                                "maze.find_path")
+
+        should_be_equal(
+            m.block_edges([(A, F), (F, A), (B, D), [D, E]]),
+            [True, False, False, True],
+            "maze.block_edges"
+        )
+        check_edges(A, F, False)
+        check_edges(D, E, False)
+        should_be_equal(m.find_path(A, E, 2, engine="overlay"), None, "maze.find_path")
+
+
+class TestSampleInstrumentation(unittest.TestCase):
+
+    def test_counters_and_callback(self):
+        """
+        Instrumented queries give the same answers and report their work.
+
+                    *         *
+          A -- B -- C -- D -- E
+        """
+
+        m = QuokkaMaze.from_edges(
+            [False, False, True, False, True],
+            [(0, 1), (1, 2), (2, 3), (3, 4)]
+        )
+        A, B, C, D, E = m.vertices
+        should_be_equal(m.last_query_stats(), None, "maze.last_query_stats")
+        should_be_equal(m.query_stats(), None, "maze.query_stats")
+
+        seen = []
+        m.enable_instrumentation(seen.append)
+        m.enable_query_cache()
+
+        check_path_should_match(m.find_path(A, E, 2), [A, B, C, D, E], "maze.find_path")
+        stats = m.last_query_stats()
+        should_be_equal(seen, [stats], "maze.enable_instrumentation")
+        should_be_equal((stats.operation, stats.engine, stats.found, stats.path_length),
+                        ("find_path", "dijkstra", True, 5), "maze.last_query_stats")
+        should_be_equal(stats.pops, 5, "maze.last_query_stats")
+        should_be_true(stats.pushes >= stats.pops and stats.relaxations > 0,
+                       "maze.last_query_stats")
+        should_be_false(stats.cached, "maze.last_query_stats")
+
+        m.find_path(A, E, 2)
+        should_be_true(m.last_query_stats().cached, "maze.last_query_stats")
+
+        should_be_equal(m.find_path(A, E, 1), None, "maze.find_path")
+        should_be_true(m.last_query_stats().starved > 0, "maze.last_query_stats")
+
+        should_be_true(m.exists_path_with_extra_food(A, E, 1, 3), "maze.exists_path_with_extra_food")
+        should_be_equal(m.last_query_stats().operation, "exists_path_with_extra_food",
+                        "maze.last_query_stats")
+        # nothing counted the fuel search, or the cached answer
+        should_be_equal(m.last_query_stats().pops, None, "maze.last_query_stats")
+        should_be_equal(seen[1].pops, None, "maze.last_query_stats")
+
+        totals = m.query_stats()
+        should_be_equal(totals["queries"], 4, "maze.query_stats")
+        should_be_equal(totals["counted"], 2, "maze.query_stats")
+        should_be_equal(totals["pops"], sum(s.pops for s in seen if s.pops is not None),
+                        "maze.query_stats")
+
+        m.disable_instrumentation()
+        m.find_path(A, E, 2)
+        should_be_equal(len(seen), 4, "maze.disable_instrumentation")
+
+
+class TestSampleAlternativePaths(unittest.TestCase):
+
+    def test_docstring_example(self):
+        """
+        The alternative_paths example, one path at a time.
+
+                    *       *
+            A---B---C---D---E
+                |           |
+                F-----------G*
+        """
+
+        m = QuokkaMaze.from_edges(
+            [False, False, True, False, True, False, True],
+            [(0, 1), (1, 2), (2, 3), (3, 4), (1, 5), (5, 6), (6, 4)]
+        )
+        A, B, C, D, E, F, G = m.vertices
+
+        paths = m.alternative_paths(A, E, 3)
+        check_path_should_match(next(paths), [A, B, C, D, E], "maze.alternative_paths")
+        check_path_should_match(next(paths), [A, B, F, G, E], "maze.alternative_paths")
+        should_be_equal(list(paths), [], "maze.alternative_paths")
+
+        # F is too far from food with k = 2, unless we put food on it
+        should_be_equal(len(list(m.alternative_paths(A, E, 2))), 1, "maze.alternative_paths")
+        should_be_equal(len(list(m.alternative_paths(A, E, 2, 1))), 2, "maze.alternative_paths")
+
+        # the maze isn't touched, and snapshots give the same paths
+        should_be_equal(len(B.edges), 3, "maze.alternative_paths")
+        should_be_equal(list(m.freeze().alternative_paths(A, E, 3)),
+                        list(m.alternative_paths(A, E, 3)), "snapshot.alternative_paths")
+
+        should_be_equal(m.alternative_paths(A, E, -1), None, "maze.alternative_paths")
+        should_be_equal(m.alternative_paths(A, Vertex(True), 1), None, "maze.alternative_paths")
+
+    def test_shortest_first_when_walks_double_back(self):
+        """
+        Every feasible simple path comes out, shortest first, in a maze where
+        the walk to the food at V2 from V3 can go through V0 or not.
+        """
+
+        m = QuokkaMaze.from_edges(
+            [False, False, True, False, False, True, False],
+            [(0, 1), (0, 2), (0, 3), (0, 6), (1, 5), (1, 6), (2, 3), (2, 6), (3, 4),
+             (4, 5), (5, 6)]
+        )
+        V = m.vertices
+
+        paths = [[V.index(v) for v in p] for p in m.alternative_paths(V[4], V[1], 3)]
+        should_be_equal([len(p) for p in paths], sorted(len(p) for p in paths),
+                        "maze.alternative_paths", "paths should come shortest first")
+        should_be_equal(
+            sorted(paths),
+            [[4, 3, 0, 2, 6, 1], [4, 3, 0, 2, 6, 5, 1], [4, 3, 2, 0, 1],
+             [4, 3, 2, 0, 6, 5, 1], [4, 3, 2, 6, 1], [4, 3, 2, 6, 5, 1], [4, 5, 1],
+             [4, 5, 6, 1], [4, 5, 6, 2, 0, 1]],
+            "maze.alternative_paths"
+        )
+
+
+class TestSamplePlanPath(unittest.TestCase):
+
+    def test_plan_follows_the_maze(self):
+        """
+        A plan repairs its route as edges are blocked and fixed.
+
+                    *       *
+            A---B---C---D---E
+                |           |
+                F-----------G*
+        """
+
+        m = QuokkaMaze.from_edges(
+            [False, False, True, False, True, False, True],
+            [(0, 1), (1, 2), (2, 3), (3, 4), (1, 5), (5, 6), (6, 4)]
+        )
+        A, B, C, D, E, F, G = m.vertices
+
+        plan = m.plan_path(A, E, 3)
+        check_path_should_match(plan.path(), [A, B, C, D, E], "plan.path")
+        first = plan.expanded
+
+        m.block_edge(C, D)
+        check_path_should_match(plan.path(), [A, B, F, G, E], "plan.path")
+        should_be_true(plan.expanded - first < first, "plan.path",
+                       "the repair should redo less than the first search")
+
+        m.block_edges([(F, G), (A, A)])
+        should_be_equal(plan.path(), None, "plan.path")
+
+        m.fix_edge(C, D)
+        check_path_should_match(plan.path(), [A, B, C, D, E], "plan.path")
+
+        # a closed plan isn't told about changes any more
+        plan.close()
+        m.block_edge(C, D)
+        check_path_should_match(plan.path(), [A, B, C, D, E], "plan.path")
+
+        # a plan nobody asks only remembers which locations changed
+        plan = m.plan_path(A, E, 3)
+        for _ in range(50):
+            m.block_edge(C, D)
+            m.fix_edge(C, D)
+        should_be_equal(plan._changed, {C, D}, "plan.edges_changed")
+        check_path_should_match(plan.path(), [A, B, C, D, E], "plan.path")
+
+        check_path_should_match(m.plan_path(A, A, 0).path(), [A], "plan.path")
+        should_be_equal(m.plan_path(A, E, 1).path(), None, "plan.path")
+        should_be_equal(m.plan_path(A, E, -1), None, "maze.plan_path")
@@ -0,0 +1,115 @@
+import unittest
+
+from vertex import Vertex
+from graph import QuokkaMaze
+from landmarks import Landmarks
+
+
+def should_be_equal(got, expected, func, message="Incorrect result returned"):
+    """
+    Simple Assert Helper Function
+    """
+
+    assert expected == got, \
+        f"[{func}] MSG: {message} [Expected: {expected}, got: {got}]"
+
+
+def check_path_should_match(got, expected, func, message="Incorrect path returned"):
+    """
+    Simple path match check function
+    """
+
+    assert got is not None, \
+        f"[{func}] MSG: {message} [Expected: {expected}, got: None]"
+    assert len(expected) == len(got), \
+        f"[{func}] MSG: {message} [Expected: {expected}, got: {got}]"
+    for i in range(len(expected)):
+        assert expected[i] == got[i], \
+            f"[{func}] MSG: {message} [Expected: {expected}, got: {got}]"
+
+
+def grid_maze(side):
+    """
+    A side x side grid with food on every third vertex, in row order.
+    """
+
+    pairs = []
+    for r in range(side):
+        for c in range(side):
+            i = r * side + c
+            if c + 1 < side:
+                pairs.append((i, i + 1))
+            if r + 1 < side:
+                pairs.append((i, i + side))
+    return QuokkaMaze.from_edges([i % 3 == 0 for i in range(side * side)], pairs)
+
+
+class TestSampleLandmarks(unittest.TestCase):
+
+    def test_bounds(self):
+        """
+        The bounds never overestimate the distance on a grid.
+        """
+
+        side = 6
+        m = grid_maze(side)
+        landmarks = Landmarks(m, 4)
+        should_be_equal(len(landmarks.landmarks), 4, "Landmarks")
+
+        t = m.vertices[side * 2 + 3]
+        h = landmarks.bound(t)
+        for i, v in enumerate(m.vertices):
+            distance = abs(i // side - 2) + abs(i % side - 3)
+            should_be_equal(h(v) <= distance, True, "Landmarks.bound")
+        should_be_equal(h(t), 0, "Landmarks.bound")
+        should_be_equal(landmarks.bound(Vertex(True))(t), 0, "Landmarks.bound")
+
+    def test_alt_engine(self):
+        """
+        The alt engine agrees with the fuel engine, before and after edges
+        change.
+
+                    *       *
+            A---B---C---D---E
+        """
+
+        m = QuokkaMaze.from_edges(
+            [False, False, True, False, True],
+            [(0, 1), (1, 2), (2, 3), (3, 4)]
+        )
+        A, B, C, D, E = m.vertices
+
+        check_path_should_match(m.find_path(A, E, 2, engine="alt"), [A, B, C, D, E],
+                                "maze.find_path")
+        should_be_equal(m.find_path(A, E, 1, engine="alt"), None, "maze.find_path")
+        should_be_equal(m.find_path(A, B, 0, engine="alt"), None, "maze.find_path")
+
+        # a new shortcut makes the tables stale, they are made again
+        m.fix_edge(A, C)
+        check_path_should_match(m.find_path(A, E, 2, engine="alt"), [A, C, D, E],
+                                "maze.find_path")
+        m.block_edge(C, D)
+        should_be_equal(m.find_path(A, E, 2, engine="alt"), None, "maze.find_path")
+
+        should_be_equal(m.enable_landmarks(0), False, "maze.enable_landmarks")
+        should_be_equal(m.enable_landmarks(2), True, "maze.enable_landmarks")
+
+        # the shortest walks from V3 to V5 eat at V0 and come back the way
+        # they went, cutting that loop starves the colony, so the simple
+        # path comes from the fuel search
+        m = QuokkaMaze.from_edges(
+            [True, False, False, False, False, False],
+            [(0, 1), (0, 4), (1, 2), (1, 4), (2, 3), (2, 4), (4, 5)]
+        )
+        V = m.vertices
+        check_path_should_match(m.find_path(V[3], V[5], 3, engine="alt"),
+                                [V[3], V[2], V[1], V[0], V[4], V[5]], "maze.find_path")
+
+        m = grid_maze(8)
+        for s, t in ((0, 63), (9, 50), (62, 3)):
+            for k in (1, 2, 3):
+                path = m.find_path(m.vertices[s], m.vertices[t], k, engine="alt")
+                other = m.find_path(m.vertices[s], m.vertices[t], k, engine="fuel")
+                should_be_equal(None if path is None else len(path),
+                                None if other is None else len(other),
+                                "maze.find_path", "the paths should be as short")
@@ -0,0 +1,91 @@
+import os
+import tempfile
+import unittest
+
+from graph import QuokkaMaze
+import mazefile
+
+
+def should_be_equal(got, expected, func, message="Incorrect result returned"):
+    """
+    Simple Assert Helper Function
+    """
+
+    assert expected == got, \
+        f"[{func}] MSG: {message} [Expected: {expected}, got: {got}]"
+
+
+class TestSampleMazeFile(unittest.TestCase):
+
+    def test_save_and_load(self):
+        """
+        A loaded maze answers like the maze that was saved.
+
+                    *         *
+          A -- B -- C -- D -- E     F*
+        """
+
+        m = QuokkaMaze.from_edges(
+            [False, False, True, False, True, True],
+            [(0, 1), (1, 2), (2, 3), (3, 4)]
+        )
+
+        with tempfile.TemporaryDirectory() as folder:
+            path = os.path.join(folder, "maze.qmaz")
+            m.save(path)
+            # 32 header bytes, 8 of food, then 7 offsets and 8 neighbours of 8
+            # bytes each, all of them 8-byte aligned
+            should_be_equal(os.path.getsize(path), 32 + 8 + 7 * 8 + 8 * 8, "QuokkaMaze.save")
+
+            with mazefile.load(path) as loaded:
+                should_be_equal(len(loaded), 6, "MappedMaze.__len__")
+                should_be_equal(len(loaded.ids), 0, "MappedMaze.ids",
+                                "no vertex should be made before it is asked for")
+
+                A, E, F = loaded.vertex(0), loaded.vertex(4), loaded.vertex(5)
+                should_be_equal(loaded.vertex(0) is A, True, "MappedMaze.vertex")
+                should_be_equal(loaded.vertex(6), None, "MappedMaze.vertex")
+                should_be_equal(E.has_food, True, "MappedMaze.vertex")
+
+                path_ids = [loaded.ids[v] for v in loaded.find_path(A, E, 2)]
+                should_be_equal(path_ids, [0, 1, 2, 3, 4], "MappedMaze.find_path")
+                should_be_equal(loaded.find_path(A, E, 1), None, "MappedMaze.find_path")
+                should_be_equal(loaded.find_path(A, F, 5), None, "MappedMaze.find_path")
+                should_be_equal(loaded.exists_path_with_extra_food(A, E, 1, 3), True,
+                                "MappedMaze.exists_path_with_extra_food")
+                should_be_equal(loaded.find_path(m.vertices[0], E, 2), None,
+                                "MappedMaze.find_path", "only its own handles are valid")
+
+            with open(path, "r+b") as f:
+                f.write(b"JUNK")
+            self.assertRaises(ValueError, mazefile.load, path)
+
+    def test_save_a_version(self):
+        """
+        A version is saved as it was, not as the maze is now.
+
+                    *         *
+          A -- B -- C -- D -- E     F*
+        """
+
+        m = QuokkaMaze.from_edges(
+            [False, False, True, False, True, True],
+            [(0, 1), (1, 2), (2, 3), (3, 4)]
+        )
+        m.enable_versions()
+        version = m.current_version()
+        m.block_edge(m.vertices[2], m.vertices[3])
+
+        with tempfile.TemporaryDirectory() as folder:
+            path = os.path.join(folder, "version.qmaz")
+            mazefile.save(version, path)
+
+            with mazefile.load(path) as loaded:
+                should_be_equal(len(loaded), 6, "MappedMaze.__len__")
+                should_be_equal(loaded.search(0, 4, 2), [0, 1, 2, 3, 4], "MappedMaze.search")
+                should_be_equal(loaded.csr()[0].tolist(), version.csr()[0].tolist(),
+                                "MappedMaze.csr")
+
+            m.save(path)
+            with mazefile.load(path) as loaded:
+                should_be_equal(loaded.search(0, 4, 2), None, "MappedMaze.search")
@@ -0,0 +1,71 @@
+import unittest
+
+from graph import QuokkaMaze
+from oracle import UnionFind
+
+
+def should_be_equal(got, expected, func, message="Incorrect result returned"):
+    """
+    Simple Assert Helper Function
+    """
+
+    assert expected == got, \
+        f"[{func}] MSG: {message} [Expected: {expected}, got: {got}]"
+
+
+class TestSampleUnionFind(unittest.TestCase):
+
+    def test_union_find(self):
+        uf = UnionFind()
+        uf.union("a", "b")
+        uf.union("c", "d")
+        uf.union("b", "d")
+
+        should_be_equal(len({uf.find(x) for x in "abcd"}), 1, "uf.union")
+        should_be_equal(uf.find("e"), "e", "uf.find")
+        should_be_equal(uf.find("a") == uf.find("e"), False, "uf.find")
+
+
+class TestSampleConnectivityOracle(unittest.TestCase):
+
+    def test_rules_out_hopeless_queries(self):
+        """
+        Food chains are followed through fixes and blocks.
+
+                    *       *
+            A---B---C---D---E       F*
+        """
+
+        m = QuokkaMaze.from_edges(
+            [False, False, True, False, True, True],
+            [(0, 1), (1, 2), (2, 3), (3, 4)]
+        )
+        A, B, C, D, E, F = m.vertices
+        m.enable_connectivity_oracle()
+        oracle = m._oracle
+
+        # F is on its own, no food helps
+        should_be_equal(m.find_path(A, F, 5), None, "maze.find_path")
+        should_be_equal(m.exists_path_with_extra_food(A, F, 1, 10), False,
+                        "maze.exists_path_with_extra_food")
+        should_be_equal(oracle.rejected, 2, "oracle.rules_out")
+
+        # with k = 1 the colony can't get past B, but extra food helps
+        should_be_equal(m.find_path(A, E, 1), None, "maze.find_path")
+        should_be_equal(oracle.rejected, 3, "oracle.rules_out")
+        should_be_equal(m.exists_path_with_extra_food(A, E, 1, 3), True,
+                        "maze.exists_path_with_extra_food")
+        should_be_equal(oracle.rejected, 3, "oracle.rules_out")
+
+        # the answers follow the maze
+        m.fix_edge(E, F)
+        should_be_equal(len(m.find_path(A, F, 2)), 6, "maze.find_path")
+        m.block_edge(C, D)
+        should_be_equal(m.find_path(A, F, 2), None, "maze.find_path")
+        should_be_equal(oracle.rejected, 4, "oracle.rules_out")
+        m.fix_edges([(B, F)])
+        should_be_equal(len(m.find_path(A, E, 2)), 4, "maze.find_path")
+
+        should_be_equal(m.find_paths([(A, F, 2), (D, A, 2)]), [[A, B, F], None],
+                        "maze.find_paths")
+        should_be_equal(oracle.rejected, 5, "oracle.rules_out")
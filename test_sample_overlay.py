@@ -0,0 +1,123 @@
+import unittest
+
+from vertex import Vertex
+from graph import QuokkaMaze
+from overlay import FoodOverlay
+
+
+def should_be_equal(got, expected, func, message="Incorrect result returned"):
+    """
+    Simple Assert Helper Function
+    """
+
+    assert expected == got, \
+        f"[{func}] MSG: {message} [Expected: {expected}, got: {got}]"
+
+
+class TestSampleOverlay(unittest.TestCase):
+
+    def setUp(self):
+        """
+        *         *              *
+        A -- B -- C -- D -- E -- F
+                  |              |
+                  G ------------ H
+        """
+
+        self.A = Vertex(True)
+        self.B = Vertex(False)
+        self.C = Vertex(True)
+        self.D = Vertex(False)
+        self.E = Vertex(False)
+        self.F = Vertex(True)
+        self.G = Vertex(False)
+        self.H = Vertex(False)
+
+        self.m = QuokkaMaze()
+        for v in (self.A, self.B, self.C, self.D, self.E, self.F, self.G, self.H):
+            self.m.add_vertex(v)
+        for u, v in [(self.A, self.B), (self.B, self.C), (self.C, self.D),
+                     (self.D, self.E), (self.E, self.F), (self.C, self.G),
+                     (self.G, self.H), (self.H, self.F)]:
+            self.m.fix_edge(u, v)
+
+    def test_links(self):
+        """
+        Food locations are linked when they are at most k steps apart.
+        """
+
+        overlay = FoodOverlay(self.m, 3)
+
+        should_be_equal(overlay.links[self.A], {self.C: 2}, "overlay.links")
+        should_be_equal(overlay.links[self.C], {self.A: 2, self.F: 3}, "overlay.links")
+        should_be_equal(overlay.links[self.F], {self.C: 3}, "overlay.links")
+
+        should_be_equal(FoodOverlay(self.m, 2).links[self.F], {}, "overlay.links")
+
+    def test_overlay_follows_edges(self):
+        """
+        Fixing and blocking edges keeps the overlay up to date.
+        """
+
+        m = self.m
+        should_be_equal(m.enable_food_overlay(3), True, "maze.enable_food_overlay")
+        should_be_equal(m.enable_food_overlay(3), False, "maze.enable_food_overlay")
+        should_be_equal(m.enable_food_overlay(0), False, "maze.enable_food_overlay")
+
+        should_be_equal(
+            m.find_path(self.A, self.F, 3, engine="overlay"),
+            [self.A, self.B, self.C, self.D, self.E, self.F],
+            "maze.find_path"
+        )
+
+        m.block_edge(self.D, self.E)
+        should_be_equal(m._overlays[3].links, FoodOverlay(m, 3).links, "overlay.edge_changed")
+        should_be_equal(
+            m.find_path(self.A, self.F, 3, engine="overlay"),
+            [self.A, self.B, self.C, self.G, self.H, self.F],
+            "maze.find_path"
+        )
+
+        m.block_edge(self.G, self.H)
+        should_be_equal(m.find_path(self.A, self.F, 3, engine="overlay"), None, "maze.find_path")
+
+        m.fix_edge(self.B, self.H)
+        should_be_equal(m._overlays[3].links, FoodOverlay(m, 3).links, "overlay.edge_changed")
+        should_be_equal(
+            m.find_path(self.A, self.F, 3, engine="overlay"),
+            [self.A, self.B, self.H, self.F],
+            "maze.find_path"
+        )
+
+        # a destination without food is attached to the food around it
+        should_be_equal(
+            m.find_path(self.A, self.E, 3, engine="overlay"),
+            [self.A, self.B, self.H, self.F, self.E],
+            "maze.find_path"
+        )
+        m.block_edge(self.E, self.F)
+        should_be_equal(m.find_path(self.A, self.E, 3, engine="overlay"), None, "maze.find_path")
+        should_be_equal(m._overlays[3].links, FoodOverlay(m, 3).links, "overlay.edge_changed")
+        should_be_equal(
+            m.find_path(self.C, self.D, 3, engine="overlay"),
+            [self.C, self.D],
+            "maze.find_path"
+        )
+
+        should_be_equal(m.disable_food_overlay(3), True, "maze.disable_food_overlay")
+        should_be_equal(m.disable_food_overlay(3), False, "maze.disable_food_overlay")
+
+    def test_overlay_engine_needs_the_overlay(self):
+        """
+        Without enable_food_overlay the overlay engine answers with "fuel",
+        and leaves no overlay behind for the edge changes to keep up.
+        """
+
+        m = self.m
+        should_be_equal(
+            m.find_path(self.A, self.F, 3, engine="overlay"),
+            m.find_path(self.A, self.F, 3, engine="fuel"),
+            "maze.find_path"
+        )
+        should_be_equal(m._overlays, {}, "maze.find_path")
+        should_be_equal(m.disable_food_overlay(3), False, "maze.disable_food_overlay")
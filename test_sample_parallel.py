@@ -0,0 +1,74 @@
+import unittest
+
+from vertex import Vertex
+from graph import QuokkaMaze
+from parallel import ParallelQueryExecutor
+
+
+def should_be_equal(got, expected, func, message="Incorrect result returned"):
+    """
+    Simple Assert Helper Function
+    """
+
+    assert expected == got, \
+        f"[{func}] MSG: {message} [Expected: {expected}, got: {got}]"
+
+
+class TestSampleParallel(unittest.TestCase):
+
+    def test_workers_agree_with_the_maze(self):
+        """
+        Paths from the workers are the caller's own vertices, in input order.
+        """
+
+        # a 5x5 grid with food on every fourth location
+        size = 5
+        grid = [[Vertex((r * size + c) % 4 == 0) for c in range(size)]
+                for r in range(size)]
+
+        m = QuokkaMaze()
+        for row in grid:
+            for v in row:
+                m.add_vertex(v)
+        for r in range(size):
+            for c in range(size):
+                if r + 1 < size:
+                    m.fix_edge(grid[r][c], grid[r + 1][c])
+                if c + 1 < size:
+                    m.fix_edge(grid[r][c], grid[r][c + 1])
+
+        flat = [v for row in grid for v in row]
+        queries = [(flat[i], flat[j], k)
+                   for i in (0, 7, 12)
+                   for j in range(0, 25, 3)
+                   for k in (1, 2, 3)]
+        queries += [(flat[0], flat[24], 1, 2), (flat[0], flat[24], -1), ("nope",)]
+        exists = [(flat[0], flat[j], 1, x) for j in range(25) for x in (0, 3)]
+
+        with ParallelQueryExecutor(m, processes=2) as pool:
+            should_be_equal(pool.find_paths(queries), m.find_paths(queries),
+                            "pool.find_paths")
+            should_be_equal(
+                pool.exists_paths_with_extra_food(exists),
+                m.exists_paths_with_extra_food(exists),
+                "pool.exists_paths_with_extra_food"
+            )
+
+            # vertices added later aren't in the exported maze
+            late = Vertex(True)
+            m.add_vertex(late)
+            m.fix_edge(late, flat[0])
+            should_be_equal(pool.find_paths([(flat[0], late, 1)]), [None],
+                            "pool.find_paths")
+
+    def test_maze_without_edges(self):
+        """
+        An empty neighbours array still maps as 64-bit words in the workers.
+        """
+
+        m = QuokkaMaze.from_edges([True, False], [])
+        A, B = m.vertices
+        queries = [(A, B, 1), (A, A, 0), (B, A, 3, 1)]
+
+        with ParallelQueryExecutor(m, processes=1) as pool:
+            should_be_equal(pool.find_paths(queries), [None, [A], None], "pool.find_paths")
@@ -0,0 +1,71 @@
+import unittest
+
+from priority_queue import IndexedPriorityQueue
+
+
+def should_be_equal(got, expected, func, message="Incorrect result returned"):
+    """
+    Simple Assert Helper Function
+    """
+
+    assert expected == got, \
+        f"[{func}] MSG: {message} [Expected: {expected}, got: {got}]"
+
+
+class TestSamplePriorityQueue(unittest.TestCase):
+
+    def test_pops_in_key_order(self):
+        """
+        Items come out smallest key first.
+        """
+
+        pq = IndexedPriorityQueue()
+        for item, key in [("c", 3), ("a", 1), ("e", 5), ("b", 2), ("d", 4)]:
+            pq.push(item, key)
+
+        should_be_equal(len(pq), 5, "pq.push")
+
+        got = [pq.pop()[1] for _ in range(5)]
+        should_be_equal(got, ["a", "b", "c", "d", "e"], "pq.pop")
+        should_be_equal(len(pq), 0, "pq.pop")
+
+    def test_update_moves_item(self):
+        """
+        Changing a key should reorder the queue, both up and down.
+        """
+
+        pq = IndexedPriorityQueue()
+        for item, key in [("a", 1), ("b", 2), ("c", 3), ("d", 4)]:
+            pq.push(item, key)
+
+        pq.update("d", 0)
+        pq.update("a", 10)
+
+        should_be_equal(pq.key_of("d"), 0, "pq.key_of")
+        should_be_equal(pq.peek(), (0, "d"), "pq.update")
+
+        got = [pq.pop()[1] for _ in range(4)]
+        should_be_equal(got, ["d", "b", "c", "a"], "pq.update")
+
+        self.assertFalse("a" in pq)
+        with self.assertRaises(IndexError):
+            pq.pop()
+
+    def test_discard(self):
+        """
+        Discarding removes an item from anywhere in the heap.
+        """
+
+        pq = IndexedPriorityQueue()
+        for item in "hgfedcba":
+            pq.push(item, ord(item))
+
+        pq.discard("a")
+        pq.discard("e")
+        pq.discard("z")
+
+        should_be_equal(len(pq), 6, "pq.discard")
+        self.assertFalse("e" in pq)
+
+        got = [pq.pop()[1] for _ in range(6)]
+        should_be_equal(got, ["b", "c", "d", "f", "g", "h"], "pq.discard")
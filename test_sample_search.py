@@ -0,0 +1,97 @@
+import unittest
+
+from vertex import Vertex
+from math import inf
+
+from search import DijkstraQuery, SearchScratch, bottleneck_search, count_placements, shortcut
+from graph import QuokkaMaze
+import benchmark
+
+
+def should_be_equal(got, expected, func, message="Incorrect result returned"):
+    """
+    Simple Assert Helper Function
+    """
+
+    assert expected == got, \
+        f"[{func}] MSG: {message} [Expected: {expected}, got: {got}]"
+
+
+class TestSampleSearch(unittest.TestCase):
+
+    def test_count_placements(self):
+        """
+        Food is only placed where the colony would starve otherwise.
+        """
+
+        #                     *
+        # A -- B -- C -- D -- E
+
+        A, B, C, D = [Vertex(False) for _ in range(4)]
+        E = Vertex(True)
+        path = [A, B, C, D, E]
+
+        should_be_equal(count_placements(path, 2), 1, "search.count_placements")
+        should_be_equal(count_placements(path, 1), 3, "search.count_placements")
+        should_be_equal(count_placements(path, 5), 0, "search.count_placements")
+        should_be_equal(count_placements(path, 0), None, "search.count_placements")
+        should_be_equal(count_placements([A], 0), 0, "search.count_placements")
+
+    def test_shortcut_removes_loops(self):
+        """
+        Loops in a walk are cut out.
+        """
+
+        should_be_equal(
+            shortcut(["a", "b", "c", "b", "d", "a", "e"]),
+            ["a", "e"],
+            "search.shortcut"
+        )
+
+        should_be_equal(
+            shortcut(["a", "b", "c", "d", "c", "e"]),
+            ["a", "b", "c", "e"],
+            "search.shortcut"
+        )
+
+    def test_scratch_is_reset_by_generation(self):
+        """
+        A new search on the same scratch doesn't see the old one's state.
+        """
+
+        A, B, C = [Vertex(False) for _ in range(3)]
+        ids = {A: 0, B: 1, C: 2}
+        scratch = SearchScratch()
+
+        first = DijkstraQuery(A, 0, ids, scratch)
+        first.relax(A, B)
+        first.settle(B)
+        should_be_equal(first.distance_of(B), 1, "search.DijkstraQuery")
+        should_be_equal(first.path_to(B), [A, B], "search.DijkstraQuery")
+
+        second = DijkstraQuery(C, 0, ids, scratch)
+        should_be_equal(second.distance_of(C), 0, "search.DijkstraQuery")
+        should_be_equal(second.distance_of(B), inf, "search.DijkstraQuery")
+        should_be_equal(second.is_settled(B), False, "search.DijkstraQuery")
+
+    def test_bottleneck_search_grows_linearly(self):
+        """
+        Four times the grid is about four times the work, not sixteen, as it
+        would be if every meal swept the food-less locations around it.
+        """
+
+        calls = []
+        for size in (400, 1600):
+            m = QuokkaMaze.from_edges(*benchmark.grid(size, 0.2, 0))
+            count = [0]
+
+            def neighbours(v, count=count):
+                count[0] += 1
+                return v.edges
+
+            k, _ = bottleneck_search(m.vertices[0], m.vertices[-1], neighbours)
+            should_be_equal(k, 6, "search.bottleneck_search")
+            calls.append(count[0])
+
+        should_be_equal(calls[1] < 6 * calls[0], True, "search.bottleneck_search",
+                        f"neighbour lookups grew from {calls[0]} to {calls[1]}")
@@ -0,0 +1,84 @@
+import unittest
+
+from vertex import Vertex
+from graph import QuokkaMaze
+
+
+def should_be_equal(got, expected, func, message="Incorrect result returned"):
+    """
+    Simple Assert Helper Function
+    """
+
+    assert expected == got, \
+        f"[{func}] MSG: {message} [Expected: {expected}, got: {got}]"
+
+
+def comment_maze():
+    """
+    The maze from the find_path comments.
+
+                *         *
+      A -- B -- C -- D -- E
+    """
+
+    A = Vertex(False)
+    B = Vertex(False)
+    C = Vertex(True)
+    D = Vertex(False)
+    E = Vertex(True)
+
+    m = QuokkaMaze()
+    for v in (A, B, C, D, E):
+        m.add_vertex(v)
+    m.fix_edge(A, B)
+    m.fix_edge(B, C)
+    m.fix_edge(C, D)
+    m.fix_edge(D, E)
+    return m, (A, B, C, D, E)
+
+
+class TestSampleSnapshot(unittest.TestCase):
+
+    def test_snapshot_layout(self):
+        """
+        The CSR arrays describe the same maze.
+        """
+
+        m, (A, B, C, D, E) = comment_maze()
+        snap = m.freeze()
+
+        should_be_equal(len(snap), 5, "snapshot.__len__")
+        should_be_equal(
+            [snap.has_food(i) for i in range(5)],
+            [False, False, True, False, True],
+            "snapshot.has_food"
+        )
+        should_be_equal(
+            sorted(snap.neighbours_of(snap.ids[C])),
+            sorted([snap.ids[B], snap.ids[D]]),
+            "snapshot.neighbours_of"
+        )
+
+    def test_snapshot_queries(self):
+        """
+        Queries on a snapshot give back the original vertices.
+        """
+
+        m, (A, B, C, D, E) = comment_maze()
+        snap = m.freeze()
+
+        should_be_equal(snap.find_path(A, E, 2), [A, B, C, D, E], "snapshot.find_path")
+        should_be_equal(snap.find_path(A, E, 1), None, "snapshot.find_path")
+        should_be_equal(snap.find_path(A, C, 4), [A, B, C], "snapshot.find_path")
+        should_be_equal(snap.find_path(A, E, -1), None, "snapshot.find_path")
+        should_be_equal(snap.find_path(A, Vertex(True), 2), None, "snapshot.find_path")
+
+        should_be_equal(snap.exists_path_with_extra_food(A, E, 1, 2), True,
+                        "snapshot.exists_path_with_extra_food")
+        should_be_equal(snap.exists_path_with_extra_food(A, E, 1, 1), False,
+                        "snapshot.exists_path_with_extra_food")
+
+        # the snapshot doesn't follow the maze
+        m.block_edge(B, C)
+        should_be_equal(snap.find_path(A, E, 2), [A, B, C, D, E], "snapshot.find_path")
+        should_be_equal(m.freeze().find_path(A, E, 2), None, "snapshot.find_path")
@@ -0,0 +1,89 @@
+import unittest
+
+from vertex import Vertex
+from graph import QuokkaMaze
+import vectorized
+
+
+def should_be_equal(got, expected, func, message="Incorrect result returned"):
+    """
+    Simple Assert Helper Function
+    """
+
+    assert expected == got, \
+        f"[{func}] MSG: {message} [Expected: {expected}, got: {got}]"
+
+
+def check_path_should_match(got, expected, func, message="Incorrect path returned"):
+    """
+    Simple path match check function
+    """
+
+    assert got is not None, \
+        f"[{func}] MSG: {message} [Expected: {expected}, got: None]"
+    assert len(expected) == len(got), \
+        f"[{func}] MSG: {message} [Expected: {expected}, got: {got}]"
+    for i in range(len(expected)):
+        assert expected[i] == got[i], \
+            f"[{func}] MSG: {message} [Expected: {expected}, got: {got}]"
+
+
+@unittest.skipIf(not vectorized.available(), "NumPy is not installed")
+class TestSampleNumpyEngine(unittest.TestCase):
+
+    def test_comment_examples(self):
+        """
+        The find_path examples, plus a detour for more food.
+
+                    *         *
+          A -- B -- C -- D -- E
+                \\        /
+                 F ---- G*
+        """
+
+        A = Vertex(False)
+        B = Vertex(False)
+        C = Vertex(True)
+        D = Vertex(False)
+        E = Vertex(True)
+        F = Vertex(False)
+        G = Vertex(True)
+
+        m = QuokkaMaze()
+        for v in (A, B, C, D, E, F, G):
+            m.add_vertex(v)
+        m.fix_edges([(A, B), (B, C), (C, D), (D, E), (B, F), (F, G), (G, D)])
+
+        check_path_should_match(m.find_path(A, E, 2, engine="numpy"), [A, B, C, D, E],
+                                "maze.find_path")
+        should_be_equal(m.find_path(A, E, 1, engine="numpy"), None, "maze.find_path")
+        check_path_should_match(m.find_path(A, C, 4, engine="numpy"), [A, B, C],
+                                "maze.find_path")
+        check_path_should_match(m.find_path(A, A, 0, engine="numpy"), [A],
+                                "maze.find_path")
+
+        # the arrays follow the maze after it changes
+        m.block_edge(B, C)
+        check_path_should_match(m.find_path(A, E, 3, engine="numpy"), [A, B, F, G, D, E],
+                                "maze.find_path")
+        should_be_equal(m.find_path(A, D, 2, engine="numpy"), None, "maze.find_path")
+        check_path_should_match(m.find_path(A, E, 1, 4, engine="numpy"),
+                                m.find_path(A, E, 1, 4, engine="fuel"), "maze.find_path")
+
+    def test_arrays_of_a_version(self):
+        """
+        A MazeVersion is searched like the snapshot of the same maze.
+        """
+
+        m = QuokkaMaze.from_edges(
+            [False, False, True, False, True],
+            [(0, 1), (1, 2), (2, 3), (3, 4)]
+        )
+        m.enable_versions()
+        version = m.current_version()
+        m.block_edge(m.vertices[1], m.vertices[2])
+
+        should_be_equal(vectorized.ArrayMaze(version).search(0, 4, 2), [0, 1, 2, 3, 4],
+                        "ArrayMaze.search")
+        should_be_equal(vectorized.ArrayMaze(m.freeze()).search(0, 4, 2), None,
+                        "ArrayMaze.search")
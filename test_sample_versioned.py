@@ -0,0 +1,91 @@
+import unittest
+
+from vertex import Vertex
+from graph import QuokkaMaze
+from versioned import PersistentArray
+
+
+def should_be_equal(got, expected, func, message="Incorrect result returned"):
+    """
+    Simple Assert Helper Function
+    """
+
+    assert expected == got, \
+        f"[{func}] MSG: {message} [Expected: {expected}, got: {got}]"
+
+
+def check_path_should_match(got, expected, func, message="Incorrect path returned"):
+    """
+    Simple path match check function
+    """
+
+    assert got is not None, \
+        f"[{func}] MSG: {message} [Expected: {expected}, got: None]"
+    assert len(expected) == len(got), \
+        f"[{func}] MSG: {message} [Expected: {expected}, got: {got}]"
+    for i in range(len(expected)):
+        assert expected[i] == got[i], \
+            f"[{func}] MSG: {message} [Expected: {expected}, got: {got}]"
+
+
+class TestSamplePersistentArray(unittest.TestCase):
+
+    def test_changes_leave_the_original_alone(self):
+        """
+        set and append return new arrays, across several tree levels.
+        """
+
+        a = PersistentArray(range(1000))
+        b = a.set(500, -1)
+        c = a.append(1000)
+
+        should_be_equal(a[500], 500, "PersistentArray.set")
+        should_be_equal(b[500], -1, "PersistentArray.set")
+        should_be_equal(len(a), 1000, "PersistentArray.append")
+        should_be_equal(list(c), list(range(1001)), "PersistentArray.append")
+
+
+class TestSampleVersions(unittest.TestCase):
+
+    def test_old_versions_do_not_change(self):
+        """
+        A version keeps answering for the maze it was taken from.
+
+                    *         *
+          A -- B -- C -- D -- E
+        """
+
+        A = Vertex(False)
+        B = Vertex(False)
+        C = Vertex(True)
+        D = Vertex(False)
+        E = Vertex(True)
+
+        m = QuokkaMaze()
+        should_be_equal(m.current_version(), None, "current_version")
+        for v in (A, B, C):
+            m.add_vertex(v)
+        m.enable_versions()
+        for v in (D, E):
+            m.add_vertex(v)
+        m.fix_edge(A, B)
+        m.fix_edge(B, C)
+        m.fix_edge(C, D)
+        m.fix_edge(D, E)
+
+        before = m.current_version()
+        m.block_edge(C, D)
+        after = m.current_version()
+        F = Vertex(True)
+        m.add_vertex(F)
+
+        check_path_should_match(before.find_path(A, E, 2), [A, B, C, D, E], "MazeVersion.find_path")
+        should_be_equal(after.find_path(A, E, 2), None, "MazeVersion.find_path")
+        should_be_equal(after.find_path(A, F, 2), None, "MazeVersion.find_path",
+                        "vertices added later aren't in the version")
+        should_be_equal(after.version < m.current_version().version, True, "MazeVersion.version")
+
+        m.fix_edge(C, D)
+        check_path_should_match(m.current_version().find_path(A, E, 2), [A, B, C, D, E],
+                                "MazeVersion.find_path")
+        should_be_equal(after.find_path(A, E, 2), None, "MazeVersion.find_path")
@@ -95,4 +95,59 @@ class TestSampleVertex(unittest.TestCase):
             len(A.edges),
             1,
             "vertex.rm_edge"
-        )
\ No newline at end of file
+        )
+
+    def test_rm_edge_keeps_other_edges(self):
+        """
+        Removing an edge from the middle shouldn't lose the other edges.
+        """
+
+        A = Vertex(True)
+        others = [Vertex(False) for _ in range(5)]
+
+        for v in others:
+            A.add_edge(v)
+
+        A.rm_edge(others[1])
+        A.rm_edge(others[4])
+
+        should_be_equal(
+            len(A.edges),
+            3,
+            "vertex.rm_edge"
+        )
+
+        for v in (others[0], others[2], others[3]):
+            should_be_true(v in A.edges, "vertex.rm_edge")
+            should_be_true(A.has_edge(v), "vertex.has_edge")
+
+        should_be_false(A.has_edge(others[1]), "vertex.has_edge")
+        should_be_false(A.has_edge(others[4]), "vertex.has_edge")
+
+        # and we can add it back again
+        A.add_edge(others[1])
+        should_be_true(others[1] in A.edges, "vertex.add_edge")
+
+    def test_many_edges(self):
+        """
+        Past a few neighbours the vertex indexes them, the contract stays
+        the same. Vertices have no __dict__.
+        """
+
+        A = Vertex(False)
+        others = [Vertex(True) for _ in range(3 * Vertex.POSITIONS_FROM)]
+
+        for v in others:
+            A.add_edge(v)
+            A.add_edge(v)
+        should_be_equal(len(A.edges), len(others), "vertex.add_edge")
+
+        for v in others[::2]:
+            A.rm_edge(v)
+        A.rm_edge(others[0])
+        should_be_equal(sorted(map(id, A.edges)), sorted(map(id, others[1::2])),
+                        "vertex.rm_edge")
+        for i, v in enumerate(others):
+            should_be_equal(A.has_edge(v), i % 2 == 1, "vertex.has_edge")
+
+        should_be_false(hasattr(A, "__dict__"), "vertex.__slots__")
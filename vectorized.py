@@ -0,0 +1,161 @@
+"""
+Vectorized Search
+=================
+
+A level-synchronous breadth first search written with NumPy, for big mazes
+where k is large compared to the distance between meals and the search is
+mostly a plain BFS.
+
+The maze is read from a MazeSnapshot's CSR arrays without copying them.
+Each level expands the whole frontier at once: every (vertex, steps since
+food) state of the level gathers its neighbours, the ones the colony can't
+reach alive are dropped, and a vertex is only entered again if it is
+reached with fewer steps since its last meal than before. Every state
+entered is recorded with the state it came from, and the path is read back
+from those records.
+
+NumPy is optional, `available()` tells whether it is installed.
+"""
+
+from typing import List, Union
+
+from search import simple_or_fuel
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+def available() -> bool:
+    return numpy is not None
+
+
+class ArrayMaze:
+    """
+    The NumPy arrays of one MazeSnapshot.
+
+    Attributes:
+        * self.snapshot (MazeSnapshot) - the snapshot the arrays view.
+        * self.offsets, self.neighbours (numpy.ndarray) - the CSR arrays.
+        * self.food (numpy.ndarray) - whether every vertex id has food.
+
+    Functions:
+        * search(self, s, t, k) - find_path on vertex ids, without extra
+            food.
+    """
+
+    def __init__(self, snapshot) -> None:
+        """
+        :param snapshot - The MazeSnapshot to search.
+        :raise ImportError if NumPy isn't installed.
+        """
+
+        if numpy is None:
+            raise ImportError("the numpy search needs NumPy installed")
+
+        size = len(snapshot)
+        self.snapshot = snapshot
+        offsets, neighbours, food = snapshot.csr()
+        self.offsets = numpy.frombuffer(offsets, dtype=numpy.int64)
+        self.neighbours = numpy.frombuffer(neighbours, dtype=numpy.int64)
+        self.food = numpy.unpackbits(
+            numpy.frombuffer(bytes(food), dtype=numpy.uint8),
+            bitorder="little"
+        )[:size].astype(bool)
+
+    def _expand(self, vertices):
+        """
+        Every neighbour of every vertex in `vertices`.
+
+        :return the neighbours, and for each one the position in `vertices`
+        of the vertex it came from.
+        """
+
+        starts = self.offsets[vertices]
+        degrees = self.offsets[vertices + 1] - starts
+        total = int(degrees.sum())
+        origin = numpy.repeat(numpy.arange(len(vertices)), degrees)
+        # position of every edge within its vertex's neighbour list
+        within = numpy.arange(total) - numpy.repeat(numpy.cumsum(degrees) - degrees, degrees)
+        return self.neighbours[starts[origin] + within], origin
+
+    def search(self, s: int, t: int, k: int) -> Union[List[int], None]:
+        """
+        find_path between vertex ids without extra food, the inputs are not
+        checked.
+
+        :return the vertex ids on the path, or None.
+        """
+
+        if s == t:
+            return [s]
+        if k == 0:
+            return None
+
+        size = len(self.food)
+        # fewest steps since food any state of each vertex has had so far
+        best = numpy.full(size, k, dtype=numpy.int64)
+        best[s] = 0
+
+        # all the states entered so far, and the state each came from
+        state_vertex = [numpy.array([s], dtype=numpy.int64)]
+        state_parent = [numpy.array([-1], dtype=numpy.int64)]
+        entered = 1
+
+        frontier = state_vertex[0]
+        hungry = numpy.zeros(1, dtype=numpy.int64)
+        states = numpy.zeros(1, dtype=numpy.int64)
+        found = -1
+        while len(frontier):
+            reached, origin = self._expand(frontier)
+            steps = hungry[origin] + 1
+            food = self.food[reached]
+
+            # a location with food can be reached on the k-th step, any
+            # other location has to be reached before that
+            alive = numpy.where(food, steps <= k, steps < k)
+            reached = reached[alive]
+            origin = origin[alive]
+            steps = numpy.where(food[alive], 0, steps[alive])
+
+            # the best state of each vertex in this level, then only the ones
+            # better than any earlier state of it
+            order = numpy.lexsort((steps, reached))
+            reached = reached[order]
+            first = numpy.ones(len(reached), dtype=bool)
+            first[1:] = reached[1:] != reached[:-1]
+            keep = order[first]
+            reached = reached[first]
+            steps = steps[keep]
+            origin = origin[keep]
+            better = steps < best[reached]
+
+            frontier = reached[better]
+            hungry = steps[better]
+            parents = states[origin[better]]
+            best[frontier] = hungry
+
+            states = numpy.arange(entered, entered + len(frontier))
+            entered += len(frontier)
+            state_vertex.append(frontier)
+            state_parent.append(parents)
+
+            hits = numpy.nonzero(frontier == t)[0]
+            if len(hits):
+                found = int(states[hits[0]])
+                break
+
+        if found < 0:
+            return None
+
+        vertex_of = numpy.concatenate(state_vertex)
+        parent_of = numpy.concatenate(state_parent)
+        walk = []
+        while found >= 0:
+            walk.append(int(vertex_of[found]))
+            found = int(parent_of[found])
+
+        # a vertex entered again with more food left can make the walk loop
+        return simple_or_fuel(walk[::-1], s, t, k, self.snapshot.neighbours_of,
+                              self.snapshot.has_food)
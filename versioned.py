@@ -0,0 +1,224 @@
+"""
+Maze Versions
+=============
+
+Immutable versions of a quokka maze that readers can keep searching while
+edges are fixed and blocked.
+
+Every version stores the adjacency as vertex ids in a persistent array: a
+tree of tuples, 32 wide, that is never changed once built. Fixing or
+blocking an edge makes a new version that copies only the path from the
+root to the two changed entries, O(log V) small tuples, and shares every
+other node with the version before it. A search holding an old version
+therefore never sees a half-applied change, and the writer never waits
+for it to finish.
+"""
+
+from array import array
+from typing import Any, Iterable, Tuple
+
+from vertex import Vertex
+from snapshot import MazeSnapshot
+
+
+_BITS = 5
+_WIDTH = 1 << _BITS
+_MASK = _WIDTH - 1
+
+
+class PersistentArray:
+    """
+    An immutable array where set and append return a new array sharing
+    everything but the changed path with this one.
+
+    Functions:
+        * set(self, i, value) - a copy with entry `i` replaced.
+        * append(self, value) - a copy with one more entry at the end.
+    """
+
+    __slots__ = ("_root", "_shift", "_size")
+
+    def __init__(self, items: Iterable[Any] = ()) -> None:
+        """
+        Builds the tree bottom up from `items`.
+        """
+
+        items = list(items)
+        level = [tuple(items[i:i + _WIDTH]) for i in range(0, len(items), _WIDTH)]
+        shift = 0
+        while len(level) > 1:
+            level = [tuple(level[i:i + _WIDTH]) for i in range(0, len(level), _WIDTH)]
+            shift += _BITS
+
+        self._root = level[0] if level else ()
+        self._shift = shift
+        self._size = len(items)
+
+    @classmethod
+    def _make(cls, root: tuple, shift: int, size: int) -> "PersistentArray":
+        array = cls.__new__(cls)
+        array._root = root
+        array._shift = shift
+        array._size = size
+        return array
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __getitem__(self, i: int) -> Any:
+        if not 0 <= i < self._size:
+            raise IndexError("PersistentArray index out of range")
+        node = self._root
+        shift = self._shift
+        while shift > 0:
+            node = node[(i >> shift) & _MASK]
+            shift -= _BITS
+        return node[i & _MASK]
+
+    def __iter__(self):
+        for i in range(self._size):
+            yield self[i]
+
+    def _assoc(self, node: tuple, shift: int, i: int, value: Any) -> tuple:
+        """
+        Copies `node` with entry `i` below it set to `value`, creating the
+        nodes on the way if `i` is one past the end.
+        """
+
+        idx = (i >> shift) & _MASK
+        if shift == 0:
+            child = value
+        else:
+            below = node[idx] if idx < len(node) else ()
+            child = self._assoc(below, shift - _BITS, i, value)
+        if idx < len(node):
+            return node[:idx] + (child,) + node[idx + 1:]
+        return node + (child,)
+
+    def set(self, i: int, value: Any) -> "PersistentArray":
+        if not 0 <= i < self._size:
+            raise IndexError("PersistentArray index out of range")
+        root = self._assoc(self._root, self._shift, i, value)
+        return self._make(root, self._shift, self._size)
+
+    def append(self, value: Any) -> "PersistentArray":
+        root = self._root
+        shift = self._shift
+        if self._size == _WIDTH << shift:
+            # the tree is full, grow a level on top
+            root = (root,)
+            shift += _BITS
+        root = self._assoc(root, shift, self._size, value)
+        return self._make(root, shift, self._size + 1)
+
+
+class MazeVersion(MazeSnapshot):
+    """
+    One immutable version of a QuokkaMaze, queried like a MazeSnapshot.
+
+    The vertex list and id map are shared with the maze, which only ever
+    appends to them, so a version knows its own `size` and ignores the
+    vertices added after it.
+
+    Attributes:
+        * self.version (int) - the maze's version number when it was made.
+        * self.size (int) - how many vertices the maze had.
+        * self.adjacency (PersistentArray) - a tuple of neighbour ids for
+            every vertex id.
+        * self.food (PersistentArray) - whether every vertex id has food.
+
+    Functions:
+        * with_vertex(self, version, has_food) - the next version, with a new
+            vertex at the end.
+        * with_edge(self, version, u, v, present) - the next version, with
+            the edge between ids `u` and `v` fixed or blocked.
+        * csr(self) - the CSR arrays of MazeSnapshot, made on demand.
+        * the queries of MazeSnapshot.
+    """
+
+    def __init__(self, maze) -> None:
+        """
+        Makes the first version from the current state of `maze`.
+
+        :param maze - The QuokkaMaze to version.
+        """
+
+        ids = maze._ids
+        self.vertices = maze.vertices
+        self.ids = ids
+        self.version = maze._version
+        self.size = len(maze.vertices)
+        self.adjacency = PersistentArray(
+            tuple(ids[u] for u in v.edges) for v in maze.vertices
+        )
+        self.food = PersistentArray(bool(v.has_food) for v in maze.vertices)
+
+    def _next(self, version: int, adjacency: PersistentArray, food: PersistentArray, size: int) -> "MazeVersion":
+        after = MazeVersion.__new__(MazeVersion)
+        after.vertices = self.vertices
+        after.ids = self.ids
+        after.version = version
+        after.size = size
+        after.adjacency = adjacency
+        after.food = food
+        return after
+
+    def with_vertex(self, version: int, has_food: bool) -> "MazeVersion":
+        return self._next(
+            version,
+            self.adjacency.append(()),
+            self.food.append(bool(has_food)),
+            self.size + 1
+        )
+
+    def with_edge(self, version: int, u: int, v: int, present: bool) -> "MazeVersion":
+        adjacency = self.adjacency
+        for a, b in ((u, v), (v, u)):
+            neighbours = adjacency[a]
+            if present:
+                neighbours = neighbours + (b,)
+            else:
+                # the last neighbour fills the hole, like Vertex.rm_edge, so
+                # the order matches the vertices and searches agree with them
+                idx = neighbours.index(b)
+                last = neighbours[-1]
+                if last == b:
+                    neighbours = neighbours[:-1]
+                else:
+                    neighbours = neighbours[:idx] + (last,) + neighbours[idx + 1:-1]
+            adjacency = adjacency.set(a, neighbours)
+        return self._next(version, adjacency, self.food, self.size)
+
+    def __len__(self) -> int:
+        return self.size
+
+    def has_food(self, i: int) -> bool:
+        return self.food[i]
+
+    def neighbours_of(self, i: int) -> Tuple[int, ...]:
+        return self.adjacency[i]
+
+    def csr(self) -> Tuple[array, array, bytearray]:
+        """
+        A version keeps no CSR arrays, they are made here in the layout of
+        MazeSnapshot, so that it can be saved or searched with NumPy.
+
+        :return the (offsets, neighbours, food) arrays.
+        """
+        offsets = array("q", [0])
+        neighbours = array("q")
+        food = bytearray((self.size + 7) // 8)
+        for i in range(self.size):
+            neighbours.extend(self.adjacency[i])
+            offsets.append(len(neighbours))
+            if self.food[i]:
+                food[i >> 3] |= 1 << (i & 7)
+        return offsets, neighbours, food
+
+    def _valid(self, s, t, k, x) -> bool:
+        if not (isinstance(s, Vertex) and isinstance(t, Vertex)):
+            return False
+        if not (isinstance(k, int) and isinstance(x, int)):
+            return False
+        size = self.size
+        return self.ids.get(s, size) < size and self.ids.get(t, size) < size and k >= 0 and x >= 0
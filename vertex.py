@@ -12,16 +12,30 @@ class Vertex:
     Vertex represents a location in the quokka's quest to find food.
     It contains the relevant information surrounding the location.
 
+    Vertices are slotted and keep nothing but the maze itself, searches keep
+    their working state in their own tables, so a vertex stays small.
+
     Attributes:
         * self.has_food (bool) - indicates whether this location has food.
         * self.edges (List[Vertex]) - list of connected vertices.
+        * self._positions (Dict[Vertex, int]) - index of every neighbour in
+            `self.edges`, so membership tests and removals are O(1). Only
+            made once the vertex has more than POSITIONS_FROM neighbours,
+            before that it is None and `self.edges` is scanned.
 
     Functions:
         * add_edge(self, v) - connects 'v' to this vertex by adding an edge.
         * rm_edge(self, v) - removes the vertex 'v' from this vertex's edges,
             breaking the connection between this vertex and 'v'.
+        * has_edge(self, v) - checks whether 'v' is connected to this vertex.
     """
 
+    __slots__ = ("has_food", "edges", "_positions")
+
+    # scanning a few neighbours is faster than a dict, and most vertices only
+    # have a few
+    POSITIONS_FROM = 8
+
     def __init__(self, has_food: bool) -> None:
         """
         Initialises this vertex, by setting the attribute whether it has food.
@@ -31,11 +45,19 @@ class Vertex:
 
         self.has_food = has_food
         self.edges = []
-        self.Dijkstra_parent = None
-        self.Dijkstra_distance = None
-        self.destination = False
-        self.extra_food = None
-        self.heap_counter = None    # to fix this problem: https://stackoverflow.com/questions/43477958/typeerror-not-supported-between-instances-python
+        self._positions = None
+
+    def _index(self, v: 'Vertex') -> int:
+        """
+        :return the index of 'v' in `self.edges`, or -1.
+        """
+        positions = self._positions
+        if positions is not None:
+            return positions.get(v, -1)
+        for i, u in enumerate(self.edges):
+            if u is v:
+                return i
+        return -1
 
     def add_edge(self, v: 'Vertex') -> None:
         """
@@ -44,9 +66,13 @@ class Vertex:
         :param v - The vertex to add an edge between.
         """
         # TODO implement me please!
-        if isinstance(v, Vertex) and v not in self.edges:
+        if isinstance(v, Vertex) and self._index(v) < 0:
             if v != self:
                 self.edges.append(v)
+                if self._positions is not None:
+                    self._positions[v] = len(self.edges) - 1
+                elif len(self.edges) > self.POSITIONS_FROM:
+                    self._positions = {u: i for i, u in enumerate(self.edges)}
 
     def rm_edge(self, v: 'Vertex') -> None:
         """
@@ -55,48 +81,26 @@ class Vertex:
         :param v - The vertex to remove from edges.
         """
         # TODO implement me please!
-        if isinstance(v, Vertex) and v in self.edges:
-            self.edges.remove(v)
-    
-    def did_we_eat_here(self) -> bool:
-        """Did quokkas have a meal on this vertex?
-
-        Returns:
-            bool: True: yes! this vertex had food, or we consumed extra food.
-                  False: no, quokkas ate nothing on this vertex
-        """ 
-        if self.has_food or self.Dijkstra_parent == "<root>":
-            return True
-        elif self.extra_food + 1 == self.Dijkstra_parent.extra_food:
-            return True
-        else:
-            return False
-
-    def will_survive(self, k: int) ->bool:
-        """To find out if quokkas will survive when they reach this vertex, consume extra food
-            if necessary.
-        Args:
-            k (int): The maximum number of hops between locations with food, the same arg as 
-            it in find_path() method.
-
-        Returns:
-            bool:  True: will survive
-                   False: will strave
+        if not isinstance(v, Vertex):
+            return
+        idx = self._index(v)
+        if idx >= 0:
+            # swap the last neighbour into the hole instead of list.remove(),
+            # the order of the edges doesn't matter anyway
+            positions = self._positions
+            last = self.edges.pop()
+            if positions is not None:
+                del positions[v]
+            if last is not v:
+                self.edges[idx] = last
+                if positions is not None:
+                    positions[last] = idx
+
+    def has_edge(self, v: 'Vertex') -> bool:
+        """
+        Checks whether there is an edge between this vertex and 'v'.
+
+        :param v - The vertex to look for in edges.
+        :return true if 'v' is connected to this vertex, else false.
         """
-        # no input validity check for the argument k, since it has been checked in graph.find_path()
-
-        walk = 0
-        current_vertex = self
-
-        while walk < k:
-            if current_vertex.did_we_eat_here():
-                return True
-            else:
-                walk += 1
-                current_vertex = current_vertex.Dijkstra_parent
-        
-        if self.extra_food != 0:
-            self.extra_food -= 1
-            return True
-        else:
-            return False
+        return self._index(v) >= 0